@@ -26,7 +26,7 @@ ARGS_BACKTEST = ARGS_COMMON_OPTIMIZE + ["position_stacking", "use_max_market_pos
                                         "enable_protections", "dry_run_wallet", "timeframe_detail",
                                         "strategy_list", "export", "exportfilename",
                                         "backtest_breakdown", "backtest_cache",
-                                        "freqai_backtest_live_models"]
+                                        "backtest_engine", "freqai_backtest_live_models"]
 
 ARGS_HYPEROPT = ARGS_COMMON_OPTIMIZE + ["hyperopt", "hyperopt_path",
                                         "position_stacking", "use_max_market_positions",
@@ -35,7 +35,8 @@ ARGS_HYPEROPT = ARGS_COMMON_OPTIMIZE + ["hyperopt", "hyperopt_path",
                                         "print_colorized", "print_json", "hyperopt_jobs",
                                         "hyperopt_random_state", "hyperopt_min_trades",
                                         "hyperopt_loss", "disableparamexport",
-                                        "hyperopt_ignore_missing_space", "analyze_per_epoch"]
+                                        "hyperopt_ignore_missing_space", "analyze_per_epoch",
+                                        "backtest_engine"]
 
 ARGS_EDGE = ARGS_COMMON_OPTIMIZE + ["stoploss_range"]
 
@@ -73,6 +74,8 @@ ARGS_CONVERT_TRADES = ["pairs", "timeframes", "exchange", "dataformat_ohlcv", "d
 
 ARGS_LIST_DATA = ["exchange", "dataformat_ohlcv", "pairs", "trading_mode", "show_timerange"]
 
+ARGS_REBUILD_DATA_INDEX = ["exchange", "dataformat_ohlcv"]
+
 ARGS_DOWNLOAD_DATA = ["pairs", "pairs_file", "days", "new_pairs_days", "include_inactive",
                       "timerange", "download_trades", "exchange", "timeframes",
                       "erase", "dataformat_ohlcv", "dataformat_trades", "trading_mode",
@@ -112,7 +115,7 @@ NO_CONF_REQURIED = ["convert-data", "convert-trade-data", "download-data", "list
                     "list-markets", "list-pairs", "list-strategies", "list-freqaimodels",
                     "list-data", "hyperopt-list", "hyperopt-show", "backtest-filter",
                     "plot-dataframe", "plot-profit", "show-trades", "trades-to-ohlcv",
-                    "strategy-updater"]
+                    "strategy-updater", "rebuild-data-index"]
 
 NO_CONF_ALLOWED = ["create-userdir", "list-exchanges", "new-strategy"]
 
@@ -208,9 +211,9 @@ class Arguments:
                                         start_list_strategies, start_list_timeframes,
                                         start_lookahead_analysis, start_new_config,
                                         start_new_strategy, start_plot_dataframe, start_plot_profit,
-                                        start_recursive_analysis, start_show_trades,
-                                        start_strategy_update, start_test_pairlist, start_trading,
-                                        start_webserver)
+                                        start_rebuild_data_index, start_recursive_analysis,
+                                        start_show_trades, start_strategy_update,
+                                        start_test_pairlist, start_trading, start_webserver)
 
         subparsers = self.parser.add_subparsers(dest='command',
                                                 # Use custom message when no subhandler is added
@@ -288,6 +291,15 @@ class Arguments:
         list_data_cmd.set_defaults(func=start_list_data)
         self._build_args(optionlist=ARGS_LIST_DATA, parser=list_data_cmd)
 
+        # Add rebuild-data-index subcommand
+        rebuild_data_index_cmd = subparsers.add_parser(
+            'rebuild-data-index',
+            help='Rebuild the index of downloaded data.',
+            parents=[_common_parser],
+        )
+        rebuild_data_index_cmd.set_defaults(func=start_rebuild_data_index)
+        self._build_args(optionlist=ARGS_REBUILD_DATA_INDEX, parser=rebuild_data_index_cmd)
+
         # Add backtesting subcommand
         backtesting_cmd = subparsers.add_parser('backtesting', help='Backtesting module.',
                                                 parents=[_common_parser, _strategy_parser])
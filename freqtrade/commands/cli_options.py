@@ -222,6 +222,12 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        '--backtest-engine',
+        help='Backtest engine to use. `numpy` keeps candles in columnar arrays and skips candles '
+        f'without signal or open trade (default: `{constants.BACKTEST_ENGINE_DEFAULT}`).',
+        choices=constants.BACKTEST_ENGINES,
+    ),
     # Edge
     "stoploss_range": Arg(
         '--stoplosses',
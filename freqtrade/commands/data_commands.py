@@ -141,3 +141,17 @@ def start_list_data(args: Dict[str, Any]) -> None:
             ],
             headers=("Pair", "Timeframe", "Type", 'From', 'To'),
             tablefmt='psql', stralign='right'))
+
+
+def start_rebuild_data_index(args: Dict[str, Any]) -> None:
+    """
+    Rebuild the datadir index of the ohlcv data
+    """
+
+    config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
+
+    from freqtrade.data.history.idatahandler import get_datahandler
+    dhc = get_datahandler(config['datadir'], config['dataformat_ohlcv'])
+
+    files = dhc.rebuild_ohlcv_index()
+    logger.info(f"Indexed {files} {config['dataformat_ohlcv']} files in {config['datadir']}.")
@@ -11,6 +11,7 @@ from freqtrade.enums import CandleType, PriceType, RPCMessageType
 DOCS_LINK = "https://www.freqtrade.io/en/stable"
 DEFAULT_CONFIG = 'config.json'
 PROCESS_THROTTLE_SECS = 5  # sec
+ANALYSIS_EXECUTORS = ['thread', 'process']
 HYPEROPT_EPOCH = 100  # epochs
 RETRY_TIMEOUT = 30  # sec
 TIMEOUT_UNITS = ['minutes', 'seconds']
@@ -42,6 +43,8 @@ AVAILABLE_DATAHANDLERS = ['json', 'jsongz', 'hdf5', 'feather', 'parquet']
 BACKTEST_BREAKDOWNS = ['day', 'week', 'month']
 BACKTEST_CACHE_AGE = ['none', 'day', 'week', 'month']
 BACKTEST_CACHE_DEFAULT = 'day'
+BACKTEST_ENGINES = ['lists', 'numpy']
+BACKTEST_ENGINE_DEFAULT = 'lists'
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = '%Y-%m-%d %H:%M:%S'
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -155,6 +158,8 @@ CONF_SCHEMA = {
         'dry_run_wallet': {'type': 'number', 'default': DRY_RUN_WALLET},
         'cancel_open_orders_on_exit': {'type': 'boolean', 'default': False},
         'process_only_new_candles': {'type': 'boolean'},
+        'analysis_workers': {'type': 'integer', 'minimum': 0},
+        'analysis_executor': {'type': 'string', 'enum': ANALYSIS_EXECUTORS},
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
@@ -175,6 +180,8 @@ CONF_SCHEMA = {
         'trading_mode': {'type': 'string', 'enum': TRADING_MODES},
         'margin_mode': {'type': 'string', 'enum': MARGIN_MODES},
         'reduce_df_footprint': {'type': 'boolean', 'default': False},
+        'ohlcv_mmap_cache': {'type': 'boolean', 'default': False},
+        'compact_dataframes': {'type': 'boolean', 'default': False},
         'minimum_trade_amount': {'type': 'number', 'default': 10},
         'targeted_trade_amount': {'type': 'number', 'default': 20},
         'lookahead_analysis_exportfilename': {'type': 'string'},
@@ -188,6 +195,8 @@ CONF_SCHEMA = {
             'type': 'array',
             'items': {'type': 'string', 'enum': BACKTEST_BREAKDOWNS}
         },
+        'backtest_engine': {'type': 'string', 'enum': BACKTEST_ENGINES,
+                            'default': BACKTEST_ENGINE_DEFAULT},
         'bot_name': {'type': 'string'},
         'unfilledtimeout': {
             'type': 'object',
@@ -497,7 +506,8 @@ CONF_SCHEMA = {
                 'outdated_offset': {'type': 'integer', 'minimum': 1},
                 'markets_refresh_interval': {'type': 'integer'},
                 'ccxt_config': {'type': 'object'},
-                'ccxt_async_config': {'type': 'object'}
+                'ccxt_async_config': {'type': 'object'},
+                'enable_ws': {'type': 'boolean', 'default': False},
             },
             'required': ['name']
         },
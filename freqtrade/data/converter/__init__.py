@@ -1,21 +1,27 @@
-from freqtrade.data.converter.converter import (clean_ohlcv_dataframe, convert_ohlcv_format,
+from freqtrade.data.converter.converter import (clean_ohlcv_dataframe, clean_ohlcv_dataframes,
+                                                convert_ohlcv_format, log_ohlcv_fillup,
                                                 ohlcv_fill_up_missing_data, ohlcv_to_dataframe,
                                                 order_book_to_dataframe, reduce_dataframe_footprint,
+                                                reduce_ohlcv_footprint, reduce_tags_footprint,
                                                 trim_dataframe, trim_dataframes)
 from freqtrade.data.converter.trade_converter import (convert_trades_format,
                                                       convert_trades_to_ohlcv, trades_convert_types,
                                                       trades_df_remove_duplicates,
                                                       trades_dict_to_list, trades_list_to_df,
-                                                      trades_to_ohlcv)
+                                                      trades_to_ohlcv, trades_to_ohlcv_chunked)
 
 
 __all__ = [
     'clean_ohlcv_dataframe',
+    'clean_ohlcv_dataframes',
     'convert_ohlcv_format',
+    'log_ohlcv_fillup',
     'ohlcv_fill_up_missing_data',
     'ohlcv_to_dataframe',
     'order_book_to_dataframe',
     'reduce_dataframe_footprint',
+    'reduce_ohlcv_footprint',
+    'reduce_tags_footprint',
     'trim_dataframe',
     'trim_dataframes',
     'convert_trades_format',
@@ -25,4 +31,5 @@ __all__ = [
     'trades_dict_to_list',
     'trades_list_to_df',
     'trades_to_ohlcv',
+    'trades_to_ohlcv_chunked',
 ]
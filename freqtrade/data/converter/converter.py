@@ -6,14 +6,19 @@ from typing import Dict
 
 import numpy as np
 import pandas as pd
-from pandas import DataFrame, to_datetime
+from pandas import DataFrame, concat, to_datetime
 
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, Config
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, Config, PairWithTimeframe
 from freqtrade.enums import CandleType, TradingMode
 
 
 logger = logging.getLogger(__name__)
 
+_NAT = np.iinfo(np.int64).min
+_DAY_NS = 86400 * 10 ** 9
+# Timeframes (in minutes) which are resampled to calendar months / years
+_CALENDAR_TIMEFRAME_MINUTES = 43200
+
 
 def ohlcv_to_dataframe(ohlcv: list, timeframe: str, pair: str, *,
                        fill_missing: bool = True, drop_incomplete: bool = True) -> DataFrame:
@@ -59,14 +64,7 @@ def clean_ohlcv_dataframe(data: DataFrame, timeframe: str, pair: str, *,
     :param drop_incomplete: Drop the last candle of the dataframe, assuming it's incomplete
     :return: DataFrame
     """
-    # group by index and aggregate results to eliminate duplicate ticks
-    data = data.groupby(by='date', as_index=False, sort=True).agg({
-        'open': 'first',
-        'high': 'max',
-        'low': 'min',
-        'close': 'last',
-        'volume': 'max',
-    })
+    data = _remove_duplicate_candles(data, _ohlcv_dates(data))
     # eliminate partial candle
     if drop_incomplete:
         data.drop(data.tail(1).index, inplace=True)
@@ -78,6 +76,112 @@ def clean_ohlcv_dataframe(data: DataFrame, timeframe: str, pair: str, *,
         return data
 
 
+def clean_ohlcv_dataframes(data: Dict[PairWithTimeframe, DataFrame], *,
+                           fill_missing: bool, drop_incomplete: bool
+                           ) -> Dict[PairWithTimeframe, DataFrame]:
+    """
+    Cleanse multiple OHLCV dataframes (see clean_ohlcv_dataframe) in one call.
+    Sorted, duplicate free and gap free data is detected for all pairs with one vectorized
+    check over the dates of all pairs - only the remaining pairs are cleaned one by one.
+    :param data: Dict of {(pair, timeframe, candle_type): DataFrame with candle (OHLCV) data}
+    :param fill_missing: fill up missing candles with 0 candles
+                         (see ohlcv_fill_up_missing_data for details)
+    :param drop_incomplete: Drop the last candle of each dataframe, assuming it's incomplete
+    :return: Dict with the cleaned dataframes, using the same keys
+    """
+    if not data:
+        return {}
+    dates = [_ohlcv_dates(df) for df in data.values()]
+    lengths = np.array([len(d) for d in dates])
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    # Expected distance to the previous candle (0 where continuity can't be checked)
+    tf_ns = np.array([_continuous_timeframe_ns(key[1]) for key in data])
+    expected = np.repeat(tf_ns, lengths)
+    all_dates = np.concatenate(dates)
+    diffs = np.diff(all_dates, prepend=_NAT)
+    # The first candle of a pair has no previous candle of the same pair
+    firsts = starts[lengths > 0]
+    diffs[firsts] = np.maximum(expected[firsts], 1)
+    # Number of unsorted (or duplicate) candles and gaps before each row
+    unsorted = np.concatenate([[0], np.cumsum(diffs <= 0)])
+    gaps = np.concatenate([[0], np.cumsum(diffs != expected)])
+
+    result = {}
+    for idx, (key, df) in enumerate(data.items()):
+        start, end = starts[idx], ends[idx]
+        if (lengths[idx] <= int(drop_incomplete) or _NAT in (all_dates[start], all_dates[end - 1])
+                or unsorted[end] != unsorted[start]):
+            result[key] = clean_ohlcv_dataframe(
+                df, key[1], key[0], fill_missing=fill_missing, drop_incomplete=drop_incomplete)
+            continue
+        df = df.loc[:, DEFAULT_DATAFRAME_COLUMNS].reset_index(drop=True)
+        if drop_incomplete:
+            df.drop(df.tail(1).index, inplace=True)
+        if fill_missing and not (gaps[end] == gaps[start] and tf_ns[idx] > 0
+                                 and _is_aligned(all_dates[start], tf_ns[idx], df)):
+            df = ohlcv_fill_up_missing_data(df, key[1], key[0])
+        result[key] = df
+    return result
+
+
+def _ohlcv_dates(data: DataFrame) -> np.ndarray:
+    """
+    Candle dates as int64 nanoseconds (NaT becomes the minimum int64 value).
+    """
+    return data['date'].values.astype('datetime64[ns]', copy=False).view(np.int64)
+
+
+def _continuous_timeframe_ns(timeframe: str) -> int:
+    """
+    Distance between candles of this timeframe in nanoseconds.
+    0 for timeframes resampled to calendar months / years (with varying candle distance).
+    """
+    from freqtrade.exchange import timeframe_to_minutes
+
+    timeframe_minutes = timeframe_to_minutes(timeframe)
+    if timeframe_minutes >= _CALENDAR_TIMEFRAME_MINUTES:
+        return 0
+    return timeframe_minutes * 60 * 10 ** 9
+
+
+def _is_aligned(first_date: int, tf_ns: int, data: DataFrame) -> bool:
+    """
+    Gap free candles starting at first_date are returned unchanged by resample in
+    ohlcv_fill_up_missing_data - if they are aligned to the resample bins (which start
+    at midnight of the first candle's day) and don't contain empty values.
+    """
+    return ((first_date % _DAY_NS) % tf_ns == 0
+            and not data[DEFAULT_DATAFRAME_COLUMNS[1:]].isna().to_numpy().any())
+
+
+def _remove_duplicate_candles(data: DataFrame, dates: np.ndarray) -> DataFrame:
+    """
+    Group by date and aggregate results to eliminate duplicate ticks.
+    Only the rows starting at the first candle which is not newer than all previous candles
+    are grouped (typically the overlap of appended candles) - sorted data isn't grouped at all.
+    """
+    unsorted = np.flatnonzero(np.diff(dates) <= 0)
+    has_nat = len(dates) > 0 and _NAT in (dates[0], dates[-1])
+    if len(dates) and not has_nat and not len(unsorted):
+        return data.loc[:, DEFAULT_DATAFRAME_COLUMNS].reset_index(drop=True)
+    # Rows before start are sorted, unique and older than all later rows
+    start = 0
+    if len(unsorted) and not has_nat:
+        start = dates[:unsorted[0] + 1].searchsorted(dates[unsorted[0] + 1:].min())
+    grouped = data.iloc[start:].groupby(by='date', as_index=False, sort=True).agg({
+        'open': 'first',
+        'high': 'max',
+        'low': 'min',
+        'close': 'last',
+        'volume': 'max',
+    })
+    if not start:
+        return grouped
+    return concat([data.iloc[:start].loc[:, DEFAULT_DATAFRAME_COLUMNS], grouped],
+                  ignore_index=True)
+
+
 def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str) -> DataFrame:
     """
     Fills up missing data with 0 volume rows,
@@ -86,6 +190,13 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
     """
     from freqtrade.exchange import timeframe_to_minutes
 
+    dates = _ohlcv_dates(dataframe)
+    tf_ns = _continuous_timeframe_ns(timeframe)
+    if (tf_ns > 0 and len(dates) and _NAT not in (dates[0], dates[-1])
+            and (np.diff(dates) == tf_ns).all() and _is_aligned(dates[0], tf_ns, dataframe)):
+        # Nothing to fill up
+        return dataframe.loc[:, DEFAULT_DATAFRAME_COLUMNS].reset_index(drop=True)
+
     ohlcv_dict = {
         'open': 'first',
         'high': 'max',
@@ -95,7 +206,7 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
     }
     timeframe_minutes = timeframe_to_minutes(timeframe)
     resample_interval = f'{timeframe_minutes}min'
-    if timeframe_minutes >= 43200 and timeframe_minutes < 525600:
+    if timeframe_minutes >= _CALENDAR_TIMEFRAME_MINUTES and timeframe_minutes < 525600:
         # Monthly candles need special treatment to stick to the 1st of the month
         resample_interval = f'{timeframe}S'
     elif timeframe_minutes > 43200:
@@ -112,8 +223,14 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
                'low': df['close'],
                })
     df.reset_index(inplace=True)
-    len_before = len(dataframe)
-    len_after = len(df)
+    log_ohlcv_fillup(pair, len(dataframe), len(df))
+    return df
+
+
+def log_ohlcv_fillup(pair: str, len_before: int, len_after: int) -> None:
+    """
+    Log the amount of candles added by filling up missing data
+    """
     pct_missing = (len_after - len_before) / len_before if len_before > 0 else 0
     if len_before != len_after:
         message = (f"Missing data fillup for {pair}: before: {len_before} - after: {len_after}"
@@ -123,7 +240,6 @@ def ohlcv_fill_up_missing_data(dataframe: DataFrame, timeframe: str, pair: str)
         else:
             # Don't be verbose if only a small amount is missing
             logger.debug(message)
-    return df
 
 
 def trim_dataframe(df: DataFrame, timerange, *, df_date_col: str = 'date',
@@ -277,3 +393,36 @@ def reduce_dataframe_footprint(df: DataFrame) -> DataFrame:
                  f"{df.memory_usage().sum() / 1024**2:.2f} MB")
 
     return df
+
+
+def reduce_ohlcv_footprint(df: DataFrame) -> DataFrame:
+    """
+    Convert candle (OHLCV) columns to float32.
+    Prices are only converted if float32 can still represent the smallest price step
+    of the data - otherwise they are kept as float64.
+    :param df: Dataframe with candle (OHLCV) data
+    :return: Dataframe with float32 volume (and prices, if possible)
+    """
+    price_columns = ['open', 'high', 'low', 'close']
+    df = df.astype({'volume': np.float32})
+    if df.empty:
+        return df
+    prices = np.unique(df[price_columns].to_numpy())
+    min_step = np.diff(prices).min() if len(prices) > 1 else np.inf
+    if np.spacing(np.float32(prices[-1])) < min_step / 2:
+        df = df.astype({col: np.float32 for col in price_columns})
+    else:
+        logger.debug("Keeping float64 prices, as float32 can't represent all price steps.")
+    return df
+
+
+def reduce_tags_footprint(df: DataFrame) -> DataFrame:
+    """
+    Convert enter_tag and exit_tag columns to categoricals.
+    :param df: Dataframe with signal columns
+    :return: Dataframe with categorical tag columns
+    """
+    for col in ('enter_tag', 'exit_tag'):
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    return df
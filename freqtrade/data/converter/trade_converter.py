@@ -3,7 +3,9 @@ Functions to convert data from one format to another
 """
 import logging
 from pathlib import Path
-from typing import Dict, List
+from shutil import rmtree
+from tempfile import mkdtemp
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Set
 
 import pandas as pd
 from pandas import DataFrame, to_datetime
@@ -15,6 +17,10 @@ from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
 
 
+if TYPE_CHECKING:
+    from freqtrade.data.history.idatahandler import IDataHandler
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,6 +90,53 @@ def trades_to_ohlcv(trades: DataFrame, timeframe: str) -> DataFrame:
     return df_new.loc[:, DEFAULT_DATAFRAME_COLUMNS]
 
 
+def trades_to_ohlcv_chunked(trades_chunks: Iterable[DataFrame],
+                            timeframes: List[str]) -> Iterator[Dict[str, DataFrame]]:
+    """
+    Converts time-ordered chunks of trades to OHLCV for multiple timeframes in one pass.
+    The last candle of each chunk may be incomplete - it's completed with the trades
+    of the following chunks before it's returned.
+    :param trades_chunks: Trades Dataframes, ordered by date
+    :param timeframes: Timeframes to resample data to
+    :return: Iterator of dicts {timeframe: OHLCV Dataframe} with completed candles
+    :raises: ValueError if no trades are provided
+    """
+    # Last (possibly incomplete) candle per timeframe
+    partial: Dict[str, DataFrame] = {}
+    for trades in trades_chunks:
+        if trades.empty:
+            continue
+        candles = {}
+        for timeframe in timeframes:
+            ohlcv = trades_to_ohlcv(trades, timeframe)
+            if timeframe in partial:
+                ohlcv = _merge_partial_candle(partial[timeframe], ohlcv)
+            partial[timeframe] = ohlcv.iloc[-1:]
+            if len(ohlcv) > 1:
+                candles[timeframe] = ohlcv.iloc[:-1]
+        if candles:
+            yield candles
+    if not partial:
+        raise ValueError('Trade-list empty.')
+    yield partial
+
+
+def _merge_partial_candle(partial: DataFrame, ohlcv: DataFrame) -> DataFrame:
+    """
+    Prepend the incomplete candle of the previous chunk to ohlcv,
+    combining both if the first candle of ohlcv is the same candle.
+    """
+    if partial['date'].iloc[0] != ohlcv['date'].iloc[0]:
+        return pd.concat([partial, ohlcv])
+    ohlcv = ohlcv.copy()
+    first = ohlcv.index[0]
+    ohlcv.loc[first, 'open'] = partial['open'].iloc[0]
+    ohlcv.loc[first, 'high'] = max(partial['high'].iloc[0], ohlcv.loc[first, 'high'])
+    ohlcv.loc[first, 'low'] = min(partial['low'].iloc[0], ohlcv.loc[first, 'low'])
+    ohlcv.loc[first, 'volume'] += partial['volume'].iloc[0]
+    return ohlcv
+
+
 def convert_trades_to_ohlcv(
     pairs: List[str],
     timeframes: List[str],
@@ -95,7 +148,10 @@ def convert_trades_to_ohlcv(
     candle_type: CandleType = CandleType.SPOT
 ) -> None:
     """
-    Convert stored trades data to ohlcv data
+    Convert stored trades data to ohlcv data.
+    Trades are loaded in chunks, and the resulting candles are appended to temporary ohlcv data
+    after each chunk (if the ohlcv datahandler supports appending), which replaces the stored
+    data once the conversion succeeded.
     """
     from freqtrade.data.history.idatahandler import get_datahandler
     data_handler_trades = get_datahandler(datadir, data_format=data_format_trades)
@@ -107,17 +163,50 @@ def convert_trades_to_ohlcv(
                 f"intervals: '{', '.join(timeframes)}' to {datadir}")
 
     for pair in pairs:
-        trades = data_handler_trades.trades_load(pair)
-        for timeframe in timeframes:
-            if erase:
+        if erase:
+            for timeframe in timeframes:
                 if data_handler_ohlcv.ohlcv_purge(pair, timeframe, candle_type=candle_type):
                     logger.info(f'Deleting existing data for pair {pair}, interval {timeframe}.')
-            try:
-                ohlcv = trades_to_ohlcv(trades, timeframe)
-                # Store ohlcv
-                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=ohlcv, candle_type=candle_type)
-            except ValueError:
-                logger.exception(f'Could not convert {pair} to OHLCV.')
+        try:
+            _convert_pair_trades_to_ohlcv(data_handler_trades, data_handler_ohlcv, datadir, pair,
+                                          timeframes, candle_type)
+        except ValueError:
+            logger.exception(f'Could not convert {pair} to OHLCV.')
+
+
+def _convert_pair_trades_to_ohlcv(data_handler_trades: 'IDataHandler',
+                                  data_handler_ohlcv: 'IDataHandler', datadir: Path, pair: str,
+                                  timeframes: List[str], candle_type: CandleType) -> None:
+    """
+    Convert the stored trades of one pair, chunk by chunk (see convert_trades_to_ohlcv).
+    Stored ohlcv data is only replaced once all chunks were converted.
+    """
+    chunks = trades_to_ohlcv_chunked(data_handler_trades.trades_load_chunks(pair), timeframes)
+    if not data_handler_ohlcv.OHLCV_APPEND_SUPPORTED:
+        # Datahandlers without append support store all candles at once.
+        ohlcv_chunks: Dict[str, List[DataFrame]] = {timeframe: [] for timeframe in timeframes}
+        for candles in chunks:
+            for timeframe, ohlcv in candles.items():
+                ohlcv_chunks[timeframe].append(ohlcv)
+        for timeframe, ohlcv_list in ohlcv_chunks.items():
+            if ohlcv_list:
+                data_handler_ohlcv.ohlcv_store(pair, timeframe, data=pd.concat(ohlcv_list),
+                                               candle_type=candle_type)
+        return
+
+    # Candles are appended to a temporary datadir, and moved into place once complete.
+    tmp_dir = Path(mkdtemp(prefix='.convert-', dir=datadir))
+    try:
+        tmp_handler = type(data_handler_ohlcv)(tmp_dir)
+        written: Set[str] = set()
+        for candles in chunks:
+            for timeframe, ohlcv in candles.items():
+                tmp_handler.ohlcv_append(pair, timeframe, data=ohlcv, candle_type=candle_type)
+                written.add(timeframe)
+        for timeframe in written:
+            data_handler_ohlcv.ohlcv_replace(tmp_handler, pair, timeframe, candle_type)
+    finally:
+        rmtree(tmp_dir)
 
 
 def convert_trades_format(config: Config, convert_from: str, convert_to: str, erase: bool):
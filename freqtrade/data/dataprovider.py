@@ -14,7 +14,7 @@ from pandas import DataFrame, Timedelta, Timestamp, to_timedelta
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import (FULL_DATAFRAME_THRESHOLD, Config, ListPairsWithTimeframes,
                                  PairWithTimeframe)
-from freqtrade.data.history import load_pair_history
+from freqtrade.data.history import get_datahandler, load_pair_history
 from freqtrade.enums import CandleType, RPCMessageType, RunMode
 from freqtrade.exceptions import ExchangeError, OperationalException
 from freqtrade.exchange import Exchange, timeframe_to_prev_date, timeframe_to_seconds
@@ -327,6 +327,19 @@ class DataProvider:
             )
         return self.__cached_pairs_backtesting[saved_pair].copy()
 
+    def historic_pairs(self, timeframe: Optional[str] = None, candle_type: str = '') -> List[str]:
+        """
+        Get pairs with stored historical candle (OHLCV) data.
+        Listed from the datadir index if it exists (see rebuild-data-index).
+        :param timeframe: timeframe to get pairs for - defaults to the strategy timeframe
+        :param candle_type: '', mark, index, premiumIndex, or funding_rate
+        """
+        _candle_type = CandleType.from_string(
+            candle_type) if candle_type != '' else self._config['candle_type_def']
+        data_handler = get_datahandler(self._config['datadir'], self._config['dataformat_ohlcv'])
+        return data_handler.ohlcv_get_pairs(self._config['datadir'],
+                                            timeframe or self._config['timeframe'], _candle_type)
+
     def get_required_startup(self, timeframe: str, add_train_candles: bool = True) -> int:
         freqai_config = self._config.get('freqai', {})
         if not freqai_config.get('enabled', False):
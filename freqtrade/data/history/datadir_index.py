@@ -0,0 +1,172 @@
+"""
+Metadata index of the ohlcv data in a datadir.
+The index is a sqlite database in the datadir, created by the rebuild-data-index command.
+Once it exists, it's maintained by the datahandlers whenever data is stored, appended or
+removed - so stored data can be listed without scanning the datadir, and its date range can be
+found without loading the data files.
+"""
+import logging
+import sqlite3
+import zlib
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from freqtrade.enums import CandleType
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = '.ohlcv_index.sqlite'
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS ohlcv_files (
+        filename TEXT PRIMARY KEY,
+        data_format TEXT NOT NULL,
+        pair TEXT NOT NULL,
+        timeframe TEXT NOT NULL,
+        candle_type TEXT NOT NULL,
+        rows INTEGER NOT NULL,
+        start_ts INTEGER NOT NULL,
+        end_ts INTEGER NOT NULL,
+        checksum INTEGER NOT NULL,
+        stamp INTEGER NOT NULL
+    )""",
+    # Data formats indexed by rebuild-data-index - files of other formats aren't all indexed.
+    """CREATE TABLE IF NOT EXISTS data_formats (
+        data_format TEXT PRIMARY KEY
+    )""",
+]
+_COLUMNS = ('filename', 'data_format', 'pair', 'timeframe', 'candle_type', 'rows',
+            'start_ts', 'end_ts', 'checksum', 'stamp')
+
+
+class OhlcvIndexEntry(NamedTuple):
+    # File path, relative to the datadir (futures files start with "futures/")
+    filename: str
+    data_format: str
+    pair: str
+    timeframe: str
+    candle_type: CandleType
+    rows: int
+    # Date of the first and last candle, as epoch milliseconds (0 without candles)
+    start_ts: int
+    end_ts: int
+    # crc32 over the data file and its appended segments (in order)
+    checksum: int
+    # Modification time (ns) of the data when it was indexed - see file_stamp()
+    stamp: int
+
+
+def file_checksum(paths: Iterable[Path], checksum: int = 0) -> int:
+    """
+    crc32 over the content of all paths, continuing from checksum.
+    Continuing the checksum of a file with the files appended to it gives the same result
+    as calculating the checksum of all files at once.
+    """
+    for path in paths:
+        with path.open('rb') as f:
+            while chunk := f.read(1024 * 1024):
+                checksum = zlib.crc32(chunk, checksum)
+    return checksum
+
+
+def file_stamp(paths: Iterable[Path]) -> int:
+    """
+    Latest modification time (ns) of the existing paths - used to detect stale entries.
+    """
+    return max((path.stat().st_mtime_ns for path in paths if path.exists()), default=0)
+
+
+class DatadirIndex:
+    """
+    Index of the ohlcv files of one datadir (including the futures subdirectory).
+    Each operation uses its own connection, so the index can be used from multiple threads
+    and processes.
+    """
+
+    def __init__(self, datadir: Path) -> None:
+        self._datadir = datadir
+        self.filename = datadir / INDEX_FILENAME
+
+    def exists(self) -> bool:
+        return self.filename.is_file()
+
+    def _connect(self, create: bool = False) -> sqlite3.Connection:
+        """
+        :param create: Create the index (and its schema) if it doesn't exist.
+            Otherwise, the index must exist - it's only created by replace_all.
+        """
+        conn = sqlite3.connect(self.filename, timeout=30)
+        if create:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        return conn
+
+    def relative_name(self, filename: Path) -> str:
+        return filename.relative_to(self._datadir).as_posix()
+
+    def get(self, filename: Path) -> Optional[OhlcvIndexEntry]:
+        """
+        Index entry of this data file - or None if the file is not indexed.
+        """
+        if not self.exists():
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute(f"SELECT {', '.join(_COLUMNS)} FROM ohlcv_files "
+                               "WHERE filename = ?", (self.relative_name(filename), )).fetchone()
+        return self._to_entry(row) if row else None
+
+    def list_data(self, data_format: str,
+                  futures: bool) -> Optional[List[Tuple[str, str, CandleType]]]:
+        """
+        Pairs, timeframes and candle types of the indexed files of this data format.
+        :param futures: List the files in the futures subdirectory (instead of the datadir)
+        :return: List of (pair, timeframe, candle_type) tuples - or None if the files of this
+            data format are not indexed.
+        """
+        if not self.exists():
+            return None
+        with closing(self._connect()) as conn:
+            if not conn.execute('SELECT 1 FROM data_formats WHERE data_format = ?',
+                                (data_format, )).fetchone():
+                return None
+            rows = conn.execute(
+                "SELECT pair, timeframe, candle_type FROM ohlcv_files "
+                "WHERE data_format = ? AND (filename LIKE 'futures/%') = ? ORDER BY filename",
+                (data_format, futures)).fetchall()
+        return [(pair, timeframe, CandleType.from_string(candle_type))
+                for pair, timeframe, candle_type in rows]
+
+    def update(self, entry: OhlcvIndexEntry) -> None:
+        """
+        Add or replace an entry.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(f"INSERT OR REPLACE INTO ohlcv_files ({', '.join(_COLUMNS)}) "
+                         f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                         (*entry[:4], entry.candle_type.value, *entry[5:]))
+
+    def remove(self, filename: Path) -> None:
+        if not self.exists():
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM ohlcv_files WHERE filename = ?',
+                         (self.relative_name(filename), ))
+
+    def replace_all(self, data_format: str, entries: List[OhlcvIndexEntry]) -> None:
+        """
+        Replace all entries of this data format - creating the index if it doesn't exist.
+        """
+        with closing(self._connect(create=True)) as conn, conn:
+            conn.execute('DELETE FROM ohlcv_files WHERE data_format = ?', (data_format, ))
+            conn.execute('INSERT OR IGNORE INTO data_formats (data_format) VALUES (?)',
+                         (data_format, ))
+            conn.executemany(f"INSERT INTO ohlcv_files ({', '.join(_COLUMNS)}) "
+                             f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                             [(*entry[:4], entry.candle_type.value, *entry[5:])
+                              for entry in entries])
+
+    @staticmethod
+    def _to_entry(row: tuple) -> OhlcvIndexEntry:
+        return OhlcvIndexEntry._make((*row[:4], CandleType.from_string(row[4]), *row[5:]))
@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
 
 from pandas import DataFrame, read_feather, to_datetime
 
@@ -16,6 +17,7 @@ logger = logging.getLogger(__name__)
 class FeatherDataHandler(IDataHandler):
 
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    OHLCV_APPEND_SUPPORTED = True
 
     def ohlcv_store(
             self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
@@ -31,7 +33,11 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
+        self._ohlcv_write(filename, data)
+        self._ohlcv_purge_segments(filename)
+        self._ohlcv_index_store(pair, timeframe, data, candle_type)
 
+    def _ohlcv_write(self, filename: Path, data: DataFrame) -> None:
         data.reset_index(drop=True).loc[:, self._columns].to_feather(
             filename, compression_level=9, compression='lz4')
 
@@ -59,7 +65,7 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
 
-        pairdata = read_feather(filename)
+        pairdata = self._load_arrow_dataset(filename, 'feather', timeframe, timerange)
         pairdata.columns = self._columns
         pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
                                           'low': 'float', 'close': 'float', 'volume': 'float'})
@@ -80,7 +86,7 @@ class FeatherDataHandler(IDataHandler):
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        self._ohlcv_append_segment(pair, timeframe, data, candle_type)
 
     def _trades_store(self, pair: str, data: DataFrame) -> None:
         """
@@ -118,6 +124,28 @@ class FeatherDataHandler(IDataHandler):
 
         return tradesdata
 
+    def _trades_load_chunks(self, pair: str, chunksize: int) -> Iterator[DataFrame]:
+        """
+        Load trades for this pair in chunks of up to chunksize trades.
+        Reads the record batches of the (memory mapped) file one by one.
+        :param pair: Load trades for this pair
+        :param chunksize: Maximum number of trades per chunk
+        :return: Iterator of Dataframes containing trades
+        """
+        import pyarrow as pa
+
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            yield DataFrame(columns=DEFAULT_TRADES_COLUMNS)
+            return
+
+        with pa.memory_map(str(filename)) as source:
+            reader = pa.ipc.open_file(source)
+            for idx in range(reader.num_record_batches):
+                batch = reader.get_batch(idx)
+                for offset in range(0, batch.num_rows, chunksize):
+                    yield batch.slice(offset, chunksize).to_pandas()
+
     @classmethod
     def _get_file_extension(cls):
         return "feather"
@@ -38,6 +38,7 @@ class HDF5DataHandler(IDataHandler):
             filename, key, mode='a', complevel=9, complib='blosc',
             format='table', data_columns=['date']
         )
+        self._ohlcv_index_store(pair, timeframe, data, candle_type)
 
     def _ohlcv_load(self, pair: str, timeframe: str,
                     timerange: Optional[TimeRange], candle_type: CandleType
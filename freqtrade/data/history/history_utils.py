@@ -1,8 +1,11 @@
+import asyncio
 import logging
 import operator
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from pandas import DataFrame, concat
 
@@ -10,12 +13,12 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import (DATETIME_PRINT_FORMAT, DEFAULT_DATAFRAME_COLUMNS,
                                  DL_DATA_TIMEFRAMES, Config)
 from freqtrade.data.converter import (clean_ohlcv_dataframe, convert_trades_to_ohlcv,
-                                      ohlcv_to_dataframe, trades_df_remove_duplicates,
-                                      trades_list_to_df)
+                                      ohlcv_to_dataframe, reduce_ohlcv_footprint,
+                                      trades_df_remove_duplicates, trades_list_to_df)
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
-from freqtrade.exchange import Exchange
+from freqtrade.exchange import Exchange, timeframe_to_seconds
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from freqtrade.util import dt_ts, format_ms_time
 from freqtrade.util.binance_mig import migrate_binance_futures_data
@@ -24,6 +27,12 @@ from freqtrade.util.datetime_helpers import dt_now
 
 logger = logging.getLogger(__name__)
 
+# Data formats which are loaded for multiple pairs concurrently (see load_data)
+PARALLEL_LOAD_FORMATS = ('feather', 'parquet')
+LOAD_DATA_THREADS = 8
+# Number of pairs / timeframes downloaded concurrently by refresh_backtest_ohlcv_data
+DOWNLOAD_CONCURRENCY = 4
+
 
 def load_pair_history(pair: str,
                       timeframe: str,
@@ -74,6 +83,8 @@ def load_data(datadir: Path,
               data_format: str = 'feather',
               candle_type: CandleType = CandleType.SPOT,
               user_futures_funding_rate: Optional[int] = None,
+              mmap_cache: bool = False,
+              compact_dataframes: bool = False,
               ) -> Dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -87,15 +98,17 @@ def load_data(datadir: Path,
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param mmap_cache: Load data through the memory mapped ohlcv cache
+    :param compact_dataframes: Convert candles to float32 (see reduce_ohlcv_footprint)
     :return: dict(<pair>:<Dataframe>)
     """
     result: Dict[str, DataFrame] = {}
     if startup_candles > 0 and timerange:
         logger.info(f'Using indicator startup period: {startup_candles} ...')
 
-    data_handler = get_datahandler(datadir, data_format)
+    data_handler = get_datahandler(datadir, data_format, mmap_cache=mmap_cache)
 
-    for pair in pairs:
+    def load_pair(pair: str) -> DataFrame:
         hist = load_pair_history(pair=pair, timeframe=timeframe,
                                  datadir=datadir, timerange=timerange,
                                  fill_up_missing=fill_up_missing,
@@ -103,6 +116,17 @@ def load_data(datadir: Path,
                                  data_handler=data_handler,
                                  candle_type=candle_type,
                                  )
+        return reduce_ohlcv_footprint(hist) if compact_dataframes else hist
+
+    if data_format in PARALLEL_LOAD_FORMATS and len(pairs) > 1:
+        # Arrow-based formats decode (mostly) without holding the GIL.
+        # Results are returned in the order of pairs.
+        with ThreadPoolExecutor(max_workers=min(LOAD_DATA_THREADS, len(pairs))) as executor:
+            loaded = list(zip(pairs, executor.map(load_pair, pairs)))
+    else:
+        loaded = [(pair, load_pair(pair)) for pair in pairs]
+
+    for pair, hist in loaded:
         if not hist.empty:
             result[pair] = hist
         else:
@@ -169,12 +193,21 @@ def _load_cached_data_for_updating(
             end = timerange.stopdt
 
     # Intentionally don't pass timerange in - since we need to load the full dataset.
+    load_timerange = None
+    entry = data_handler.ohlcv_index_entry(pair, timeframe, candle_type)
+    if (entry and entry.rows and not prepend and data_handler.OHLCV_APPEND_SUPPORTED
+            and not (start and dt_ts(start) < entry.start_ts)):
+        # Unless new candles are appended - then only the last candles (located through the
+        # datadir index) are needed to determine where the download starts.
+        load_timerange = TimeRange(
+            'date', None, entry.end_ts // 1000 - timeframe_to_seconds(timeframe) * 10, 0)
     data = data_handler.ohlcv_load(pair, timeframe=timeframe,
-                                   timerange=None, fill_missing=False,
+                                   timerange=load_timerange, fill_missing=False,
                                    drop_incomplete=True, warn_no_data=False,
                                    candle_type=candle_type)
     if not data.empty:
-        if not prepend and start and start < data.iloc[0]['date']:
+        # If only the end of the data was loaded, the index showed an earlier start (see above).
+        if not prepend and start and not load_timerange and start < data.iloc[0]['date']:
             # Earlier data than existing data requested, redownload all
             data = DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
         else:
@@ -187,6 +220,87 @@ def _load_cached_data_for_updating(
     return data, start_ms, end_ms
 
 
+def _prepare_pair_download(pair: str, *,
+                           datadir: Path,
+                           timeframe: str,
+                           process: str,
+                           new_pairs_days: int,
+                           data_handler: IDataHandler,
+                           timerange: Optional[TimeRange],
+                           candle_type: CandleType,
+                           erase: bool,
+                           prepend: bool,
+                           ) -> Tuple[DataFrame, int, Optional[int]]:
+    """
+    Load the stored data for a pair and determine the range to download.
+    :return: Tuple of (stored data, since_ms, until_ms)
+    """
+    if erase:
+        if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
+            logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
+
+    data, since_ms, until_ms = _load_cached_data_for_updating(
+        pair, timeframe, timerange,
+        data_handler=data_handler,
+        candle_type=candle_type,
+        prepend=prepend)
+
+    logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
+                f'{candle_type} and store in {datadir}. '
+                f'From {format_ms_time(since_ms) if since_ms else "start"} to '
+                f'{format_ms_time(until_ms) if until_ms else "now"}'
+                )
+
+    logger.debug("Current Start: %s",
+                 f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
+                 if not data.empty else 'None')
+    logger.debug("Current End: %s",
+                 f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+                 if not data.empty else 'None')
+
+    # Default since_ms to 30 days if nothing is given
+    if not since_ms:
+        since_ms = int((datetime.now() - timedelta(days=new_pairs_days)).timestamp()) * 1000
+    return data, since_ms, until_ms
+
+
+def _store_pair_download(pair: str, timeframe: str, data: DataFrame, new_data: List, *,
+                         data_handler: IDataHandler,
+                         candle_type: CandleType,
+                         prepend: bool,
+                         ) -> None:
+    """
+    Combine downloaded candles with the stored data and store the result.
+    """
+    # TODO: Maybe move parsing to exchange class (?)
+    new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
+                                       fill_missing=False, drop_incomplete=True)
+    if not data.empty and not prepend:
+        try:
+            # Only write the new candles if the datahandler supports it.
+            data_handler.ohlcv_append(pair, timeframe, data=new_dataframe,
+                                      candle_type=candle_type)
+            return
+        except NotImplementedError:
+            pass
+    if data.empty:
+        data = new_dataframe
+    else:
+        # Run cleaning again to ensure there were no duplicate candles
+        # Especially between existing and new data.
+        data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,
+                                     fill_missing=False, drop_incomplete=False)
+
+    logger.debug("New Start: %s",
+                 f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
+                 if not data.empty else 'None')
+    logger.debug("New End: %s",
+                 f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+                 if not data.empty else 'None')
+
+    data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+
+
 def _download_pair_history(pair: str, *,
                            datadir: Path,
                            exchange: Exchange,
@@ -215,58 +329,20 @@ def _download_pair_history(pair: str, *,
     data_handler = get_datahandler(datadir, data_handler=data_handler)
 
     try:
-        if erase:
-            if data_handler.ohlcv_purge(pair, timeframe, candle_type=candle_type):
-                logger.info(f'Deleting existing data for pair {pair}, {timeframe}, {candle_type}.')
-
-        data, since_ms, until_ms = _load_cached_data_for_updating(
-            pair, timeframe, timerange,
-            data_handler=data_handler,
-            candle_type=candle_type,
-            prepend=prepend)
-
-        logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
-                    f'{candle_type} and store in {datadir}. '
-                    f'From {format_ms_time(since_ms) if since_ms else "start"} to '
-                    f'{format_ms_time(until_ms) if until_ms else "now"}'
-                    )
-
-        logger.debug("Current Start: %s",
-                     f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
-                     if not data.empty else 'None')
-        logger.debug("Current End: %s",
-                     f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
-                     if not data.empty else 'None')
+        data, since_ms, until_ms = _prepare_pair_download(
+            pair, datadir=datadir, timeframe=timeframe, process=process,
+            new_pairs_days=new_pairs_days, data_handler=data_handler, timerange=timerange,
+            candle_type=candle_type, erase=erase, prepend=prepend)
 
-        # Default since_ms to 30 days if nothing is given
         new_data = exchange.get_historic_ohlcv(pair=pair,
                                                timeframe=timeframe,
-                                               since_ms=since_ms if since_ms else
-                                               int((datetime.now() - timedelta(days=new_pairs_days)
-                                                    ).timestamp()) * 1000,
+                                               since_ms=since_ms,
                                                is_new_pair=data.empty,
                                                candle_type=candle_type,
                                                until_ms=until_ms if until_ms else None
                                                )
-        # TODO: Maybe move parsing to exchange class (?)
-        new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
-                                           fill_missing=False, drop_incomplete=True)
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(concat([data, new_dataframe], axis=0), timeframe, pair,
-                                         fill_missing=False, drop_incomplete=False)
-
-        logger.debug("New Start: %s",
-                     f"{data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}"
-                     if not data.empty else 'None')
-        logger.debug("New End: %s",
-                     f"{data.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
-                     if not data.empty else 'None')
-
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+        _store_pair_download(pair, timeframe, data, new_data, data_handler=data_handler,
+                             candle_type=candle_type, prepend=prepend)
         return True
 
     except Exception:
@@ -276,6 +352,65 @@ def _download_pair_history(pair: str, *,
         return False
 
 
+async def _async_download_pair_history(pair: str, *,
+                                       datadir: Path,
+                                       exchange: Exchange,
+                                       timeframe: str,
+                                       process: str = '',
+                                       new_pairs_days: int = 30,
+                                       data_handler: IDataHandler,
+                                       timerange: Optional[TimeRange] = None,
+                                       candle_type: CandleType,
+                                       erase: bool = False,
+                                       prepend: bool = False,
+                                       ) -> int:
+    """
+    Async version of _download_pair_history, running on the exchange's event loop.
+    Downloaded candles are stored as soon as the download of this pair completes.
+    Loading and storing data runs in a worker thread, so other downloads continue meanwhile.
+    :return: Number of downloaded candles (0 if the download failed)
+    """
+    try:
+        data, since_ms, until_ms = await asyncio.to_thread(
+            _prepare_pair_download,
+            pair, datadir=datadir, timeframe=timeframe, process=process,
+            new_pairs_days=new_pairs_days, data_handler=data_handler, timerange=timerange,
+            candle_type=candle_type, erase=erase, prepend=prepend)
+
+        new_data = await exchange.async_get_historic_ohlcv(
+            pair=pair, timeframe=timeframe, since_ms=since_ms, until_ms=until_ms,
+            is_new_pair=data.empty, candle_type=candle_type)
+        await asyncio.to_thread(
+            _store_pair_download, pair, timeframe, data, new_data, data_handler=data_handler,
+            candle_type=candle_type, prepend=prepend)
+        return len(new_data)
+
+    except Exception:
+        logger.exception(
+            f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
+        )
+        return 0
+
+
+async def _async_download_pairs(exchange: Exchange, jobs: List[Dict[str, Any]]) -> None:
+    """
+    Download multiple pairs / timeframes concurrently.
+    Requests of all downloads are throttled by the rate limiter of the exchange.
+    :param jobs: Keyword arguments for _async_download_pair_history - one entry per download
+    """
+    semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+
+    async def download(job: Dict[str, Any]) -> int:
+        async with semaphore:
+            return await _async_download_pair_history(exchange=exchange, **job)
+
+    start = time.monotonic()
+    candles = sum(await asyncio.gather(*(download(job) for job in jobs)))
+    duration = max(time.monotonic() - start, 1e-6)
+    logger.info(f"Downloaded {candles} candles from {exchange.name} in {duration:.1f} "
+                f"seconds ({candles / duration:.0f} candles/s).")
+
+
 def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes: List[str],
                                 datadir: Path, trading_mode: str,
                                 timerange: Optional[TimeRange] = None,
@@ -291,22 +426,20 @@ def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes
     pairs_not_available = []
     data_handler = get_datahandler(datadir, data_format)
     candle_type = CandleType.get_default(trading_mode)
-    process = ''
+    jobs: List[Dict[str, Any]] = []
+    common = dict(datadir=datadir, timerange=timerange, data_handler=data_handler,
+                  new_pairs_days=new_pairs_days, erase=erase, prepend=prepend)
     for idx, pair in enumerate(pairs, start=1):
         if pair not in exchange.markets:
             pairs_not_available.append(pair)
             logger.info(f"Skipping pair {pair}...")
             continue
+        process = f'{idx}/{len(pairs)}'
         for timeframe in timeframes:
 
             logger.debug(f'Downloading pair {pair}, {candle_type}, interval {timeframe}.')
-            process = f'{idx}/{len(pairs)}'
-            _download_pair_history(pair=pair, process=process,
-                                   datadir=datadir, exchange=exchange,
-                                   timerange=timerange, data_handler=data_handler,
-                                   timeframe=str(timeframe), new_pairs_days=new_pairs_days,
-                                   candle_type=candle_type,
-                                   erase=erase, prepend=prepend)
+            jobs.append(dict(pair=pair, process=process, timeframe=str(timeframe),
+                             candle_type=candle_type, **common))
         if trading_mode == 'futures':
             # Predefined candletype (and timeframe) depending on exchange
             # Downloads what is necessary to backtest based on futures data.
@@ -315,13 +448,11 @@ def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes
             # All exchanges need FundingRate for futures trading.
             # The timeframe is aligned to the mark-price timeframe.
             for funding_candle_type in (CandleType.FUNDING_RATE, fr_candle_type):
-                _download_pair_history(pair=pair, process=process,
-                                       datadir=datadir, exchange=exchange,
-                                       timerange=timerange, data_handler=data_handler,
-                                       timeframe=str(tf_mark), new_pairs_days=new_pairs_days,
-                                       candle_type=funding_candle_type,
-                                       erase=erase, prepend=prepend)
+                jobs.append(dict(pair=pair, process=process, timeframe=str(tf_mark),
+                                 candle_type=funding_candle_type, **common))
 
+    if jobs:
+        exchange.loop.run_until_complete(_async_download_pairs(exchange, jobs))
     return pairs_not_available
 
 
@@ -5,32 +5,53 @@ It's subclasses handle and storing data from disk.
 """
 import logging
 import re
+import sqlite3
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from datetime import datetime, timezone
+from functools import reduce
+from operator import and_
 from pathlib import Path
-from typing import List, Optional, Tuple, Type
+from shutil import rmtree
+from typing import Iterator, List, Optional, Tuple, Type
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_TRADES_COLUMNS, ListPairsWithTimeframes
-from freqtrade.data.converter import (clean_ohlcv_dataframe, trades_convert_types,
+from freqtrade.data.converter import (clean_ohlcv_dataframe, log_ohlcv_fillup, trades_convert_types,
                                       trades_df_remove_duplicates, trim_dataframe)
+from freqtrade.data.history.datadir_index import (DatadirIndex, OhlcvIndexEntry, file_checksum,
+                                                  file_stamp)
+from freqtrade.data.history.ohlcv_mmap_cache import load_ohlcv_mmap, purge_ohlcv_mmap
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exchange import timeframe_to_seconds
+from freqtrade.util import dt_ts
 
 
 logger = logging.getLogger(__name__)
 
+# Default number of trades loaded at once by trades_load_chunks
+TRADES_CHUNKSIZE = 1_000_000
+
 
 class IDataHandler(ABC):
 
     _OHLCV_REGEX = r'^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)'
+    # Appended segments after which ohlcv_append rewrites all data into one file.
+    MAX_OHLCV_SEGMENTS = 30
+    # ohlcv_append only writes the new candles (and doesn't raise NotImplementedError).
+    OHLCV_APPEND_SUPPORTED = False
 
-    def __init__(self, datadir: Path) -> None:
+    def __init__(self, datadir: Path, mmap_cache: bool = False) -> None:
+        """
+        :param datadir: Folder containing the data
+        :param mmap_cache: Load ohlcv data through the memory mapped cache (see ohlcv_mmap_cache)
+        """
         self._datadir = datadir
+        self._mmap_cache = mmap_cache
 
     @classmethod
     def _get_file_extension(cls) -> str:
@@ -44,10 +65,14 @@ class IDataHandler(ABC):
             cls, datadir: Path, trading_mode: TradingMode) -> ListPairsWithTimeframes:
         """
         Returns a list of all pairs with ohlcv data available in this datadir
+        Served from the datadir index if this data format is indexed.
         :param datadir: Directory to search for ohlcv files
         :param trading_mode: trading-mode to be used
         :return: List of Tuples of (pair, timeframe, CandleType)
         """
+        indexed = cls._ohlcv_list_indexed(datadir, trading_mode == TradingMode.FUTURES)
+        if indexed is not None:
+            return indexed
         if trading_mode == TradingMode.FUTURES:
             datadir = datadir.joinpath('futures')
         _tmp = [
@@ -66,21 +91,38 @@ class IDataHandler(ABC):
         """
         Returns a list of all pairs with ohlcv data available in this datadir
         for the specified timeframe
+        Served from the datadir index if this data format is indexed.
         :param datadir: Directory to search for ohlcv files
         :param timeframe: Timeframe to search pairs for
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: List of Pairs
         """
+        indexed = cls._ohlcv_list_indexed(datadir, candle_type != CandleType.SPOT)
+        if indexed is not None:
+            return [pair for pair, pair_timeframe, pair_candle_type in indexed
+                    if pair_timeframe == timeframe and pair_candle_type == candle_type]
+        ext = cls._get_file_extension()
         candle = ""
         if candle_type != CandleType.SPOT:
             datadir = datadir.joinpath('futures')
             candle = f"-{candle_type}"
-        ext = cls._get_file_extension()
         _tmp = [re.search(r'^(\S+)(?=\-' + timeframe + candle + f'.{ext})', p.name)
                 for p in datadir.glob(f"*{timeframe}{candle}.{ext}")]
         # Check if regex found something and only return these results
         return [cls.rebuild_pair_from_filename(match[0]) for match in _tmp if match]
 
+    @classmethod
+    def _ohlcv_list_indexed(cls, datadir: Path,
+                            futures: bool) -> Optional[ListPairsWithTimeframes]:
+        """
+        Ohlcv data of this data format listed in the datadir index
+        - None if the index doesn't exist (or doesn't cover this data format).
+        """
+        try:
+            return DatadirIndex(datadir).list_data(cls._get_file_extension(), futures)
+        except sqlite3.Error:
+            return None
+
     @abstractmethod
     def ohlcv_store(
             self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
@@ -102,6 +144,10 @@ class IDataHandler(ABC):
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: (min, max)
         """
+        entry = self.ohlcv_index_entry(pair, timeframe, candle_type)
+        if entry:
+            return (datetime.fromtimestamp(entry.start_ts / 1000, tz=timezone.utc),
+                    datetime.fromtimestamp(entry.end_ts / 1000, tz=timezone.utc))
         data = self._ohlcv_load(pair, timeframe, None, candle_type)
         if data.empty:
             return (
@@ -127,6 +173,292 @@ class IDataHandler(ABC):
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
 
+    @classmethod
+    def _load_arrow_dataset(cls, filename: Path, file_format: str, timeframe: str,
+                            timerange: Optional[TimeRange]) -> DataFrame:
+        """
+        Load a feather or parquet file (and segments appended to it),
+        only decoding the rows within timerange.
+        For parquet files, row groups outside of the timerange are skipped entirely.
+        One candle after the end of the timerange is kept, so ohlcv_load can still tell
+        if the data was trimmed at the end.
+        :param filename: File to load
+        :param file_format: "feather" or "parquet"
+        :param timeframe: Timeframe of the data
+        :param timerange: Limit data to be loaded to this timerange
+        :return: DataFrame with the columns of the file
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        frames = []
+        for file in [filename, *cls._ohlcv_segment_files(filename)]:
+            dataset = ds.dataset(file, format=file_format)
+            filters = []
+            # Files with non-timestamp dates (not written by freqtrade) are loaded completely.
+            if timerange and pa.types.is_timestamp(dataset.schema.types[0]):
+                date_col = ds.field(dataset.schema.names[0])
+                ts_type = pa.timestamp('s', tz='UTC')
+                if timerange.starttype == 'date':
+                    filters.append(date_col >= pa.scalar(timerange.startts, type=ts_type))
+                if timerange.stoptype == 'date':
+                    stop = timerange.stopts + timeframe_to_seconds(timeframe)
+                    filters.append(date_col <= pa.scalar(stop, type=ts_type))
+            frames.append(
+                dataset.to_table(filter=reduce(and_, filters) if filters else None).to_pandas())
+        return frames[0] if len(frames) == 1 else concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _ohlcv_segment_dir(filename: Path) -> Path:
+        """
+        Directory containing the candles appended to filename - one file per append.
+        """
+        return filename.with_name(f'{filename.name}.parts')
+
+    @classmethod
+    def _ohlcv_segment_files(cls, filename: Path) -> List[Path]:
+        """
+        Segments appended to filename, in the order they were appended.
+        """
+        segment_dir = cls._ohlcv_segment_dir(filename)
+        if not segment_dir.is_dir():
+            return []
+        return sorted(segment_dir.glob(f'*{filename.suffix}'))
+
+    @classmethod
+    def _ohlcv_purge_segments(cls, filename: Path) -> None:
+        segment_dir = cls._ohlcv_segment_dir(filename)
+        if segment_dir.is_dir():
+            rmtree(segment_dir)
+
+    @classmethod
+    def _ohlcv_stamp_paths(cls, filename: Path) -> List[Path]:
+        """
+        Paths whose modification time changes whenever the data of filename changes.
+        """
+        return [filename, cls._ohlcv_segment_dir(filename)]
+
+    @classmethod
+    def _ohlcv_data_files(cls, datadir: Path) -> List[Path]:
+        """
+        All ohlcv files of this data format in datadir (including futures data).
+        """
+        regex = re.compile(cls._OHLCV_REGEX)
+        return [path for folder in (datadir, datadir / 'futures')
+                for path in sorted(folder.glob(f"*.{cls._get_file_extension()}"))
+                if regex.search(path.name)]
+
+    def _ohlcv_index_build_entry(self, filename: Path, pair: str, timeframe: str,
+                                 candle_type: CandleType, data: DataFrame) -> OhlcvIndexEntry:
+        """
+        Index entry for filename, containing all of data.
+        """
+        stamp_paths = self._ohlcv_stamp_paths(filename)
+        return OhlcvIndexEntry(
+            filename=DatadirIndex(self._datadir).relative_name(filename),
+            data_format=self._get_file_extension(),
+            pair=pair,
+            timeframe=timeframe,
+            candle_type=CandleType.from_string(candle_type),
+            rows=len(data),
+            start_ts=dt_ts(data['date'].min()) if len(data) else 0,
+            end_ts=dt_ts(data['date'].max()) if len(data) else 0,
+            checksum=file_checksum([filename, *self._ohlcv_segment_files(filename)]),
+            stamp=file_stamp(stamp_paths),
+        )
+
+    def _ohlcv_index_store(self, pair: str, timeframe: str, data: DataFrame,
+                           candle_type: CandleType) -> None:
+        """
+        Update the datadir index (if it exists) after storing all data of this pair.
+        """
+        index = DatadirIndex(self._datadir)
+        if not index.exists():
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        try:
+            index.update(self._ohlcv_index_build_entry(filename, pair, timeframe, candle_type,
+                                                       data))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update datadir index for {filename}: {e}")
+
+    def _ohlcv_index_append(self, pair: str, timeframe: str, data: DataFrame,
+                            candle_type: CandleType, entry: Optional[OhlcvIndexEntry],
+                            segment: Path) -> None:
+        """
+        Update the datadir index (if it exists) after appending data as a new segment.
+        :param entry: Valid index entry before writing the segment (None to reindex the file)
+        """
+        index = DatadirIndex(self._datadir)
+        if not index.exists():
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        try:
+            if entry:
+                entry = entry._replace(
+                    rows=entry.rows + len(data),
+                    start_ts=entry.start_ts or dt_ts(data['date'].min()),
+                    end_ts=max(entry.end_ts, dt_ts(data['date'].max())),
+                    checksum=file_checksum([segment], entry.checksum),
+                    stamp=file_stamp(self._ohlcv_stamp_paths(filename)),
+                )
+            else:
+                stored = self._ohlcv_load(pair, timeframe, None, candle_type)
+                entry = self._ohlcv_index_build_entry(filename, pair, timeframe, candle_type,
+                                                      stored)
+            index.update(entry)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update datadir index for {filename}: {e}")
+
+    def ohlcv_index_entry(self, pair: str, timeframe: str,
+                          candle_type: CandleType) -> Optional[OhlcvIndexEntry]:
+        """
+        Datadir index entry for this pair - if the data files didn't change since indexing.
+        :param pair: Pair to get the entry for
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: OhlcvIndexEntry, or None if the data is not indexed (or the entry is stale)
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        try:
+            entry = DatadirIndex(self._datadir).get(filename)
+        except sqlite3.Error:
+            return None
+        if entry and entry.stamp == file_stamp(self._ohlcv_stamp_paths(filename)):
+            return entry
+        return None
+
+    def rebuild_ohlcv_index(self) -> int:
+        """
+        Rebuild the datadir index for this data format from the data files - creating it if
+        it doesn't exist yet.
+        Required after changing data files without freqtrade (copying / deleting files).
+        :return: Number of indexed files
+        """
+        entries = []
+        for filename in self._ohlcv_data_files(self._datadir):
+            match = re.search(self._OHLCV_REGEX, filename.name)
+            if not match:
+                continue
+            pair = self.rebuild_pair_from_filename(match[1])
+            timeframe = self.rebuild_timeframe_from_filename(match[2])
+            candle_type = CandleType.from_string(match[3])
+            try:
+                data = self._ohlcv_load(pair, timeframe, None, candle_type)
+            except Exception as e:
+                # Keep unreadable files in the index (as empty data), so they're still listed.
+                logger.warning(f"Could not load {filename}, indexing it without data: {e}")
+                data = DataFrame(columns=['date'])
+            entries.append(
+                self._ohlcv_index_build_entry(filename, pair, timeframe, candle_type, data))
+        DatadirIndex(self._datadir).replace_all(self._get_file_extension(), entries)
+        return len(entries)
+
+    def _ohlcv_write(self, filename: Path, data: DataFrame) -> None:
+        """
+        Write ohlcv data to filename. Implemented by datahandlers supporting ohlcv_append.
+        """
+        raise NotImplementedError()
+
+    def _ohlcv_append_segment(self, pair: str, timeframe: str, data: DataFrame,
+                              candle_type: CandleType) -> None:
+        """
+        Append data by writing only the new candles to a new segment file.
+        Candles which are not newer than the stored data are ignored.
+        Once MAX_OHLCV_SEGMENTS segments exist, all data is compacted into a single file.
+        """
+        import pyarrow.dataset as ds
+
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+        segments = self._ohlcv_segment_files(filename)
+        # Only the date column of the last file is read.
+        last_file = ds.dataset(segments[-1] if segments else filename,
+                               format=self._get_file_extension())
+        dates = last_file.to_table(columns=[last_file.schema.names[0]]).column(0).to_pandas()
+        if len(dates):
+            data = data.loc[data['date'] > to_datetime(dates.max(), unit='ms', utc=True)]
+        if data.empty:
+            return
+
+        if len(segments) >= self.MAX_OHLCV_SEGMENTS:
+            logger.debug(f"Compacting {len(segments)} segments of {filename}.")
+            stored = self._ohlcv_load(pair, timeframe, None, candle_type)
+            self.ohlcv_store(pair, timeframe, concat([stored, data], ignore_index=True),
+                             candle_type)
+            return
+        # Index entry of the data before the new segment is written
+        entry = self.ohlcv_index_entry(pair, timeframe, candle_type)
+        segment_dir = self._ohlcv_segment_dir(filename)
+        segment_dir.mkdir(exist_ok=True)
+        next_segment = int(segments[-1].stem) + 1 if segments else 1
+        segment = segment_dir / f'{next_segment:05d}{filename.suffix}'
+        self._ohlcv_write(segment, data)
+        self._ohlcv_index_append(pair, timeframe, data, candle_type, entry, segment)
+
+    def _ohlcv_load_mmap(self, pair: str, timeframe: str, timerange: Optional[TimeRange],
+                         candle_type: CandleType, *, fill_missing: bool,
+                         drop_incomplete: bool, warn_no_data: bool) -> Optional[DataFrame]:
+        """
+        ohlcv_load through the memory mapped cache.
+        The cache holds the full data, cleaned once by clean_ohlcv_dataframe - together with a
+        mask of the candles of the data file, so trimming to the timerange and dropping the
+        incomplete candle return the same data as cleaning the loaded data does.
+        The returned dataframe is a read-only view of the memory maps - it must not be modified.
+        :return: DataFrame with ohlcv data - or None if the data can't be cached.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            return None
+
+        def load_cleaned() -> Tuple[DataFrame, np.ndarray]:
+            data = self._ohlcv_load(pair, timeframe, None, candle_type=candle_type)
+            cleaned = clean_ohlcv_dataframe(data, timeframe, pair=pair,
+                                            fill_missing=fill_missing, drop_incomplete=False)
+            return cleaned, cleaned['date'].isin(data['date']).to_numpy()
+
+        cache = load_ohlcv_mmap(filename, self._ohlcv_stamp_paths(filename),
+                                'filled' if fill_missing else 'cleaned', load_cleaned)
+        if cache is None:
+            return None
+
+        # Rows of the candles of the data file - first:last within the timerange,
+        # first:loaded also including one candle after the end (like the data file loaders).
+        candles = np.flatnonzero(cache.candles)
+        first, last = 0, len(candles)
+        loaded = last
+        if timerange and timerange.starttype == 'date':
+            first = int(candles.searchsorted(
+                cache.dates.searchsorted(timerange.startts * 1_000_000_000)))
+        if timerange and timerange.stoptype == 'date':
+            stop = timerange.stopts * 1_000_000_000
+            last = int(candles.searchsorted(cache.dates.searchsorted(stop, side='right')))
+            loaded = int(candles.searchsorted(cache.dates.searchsorted(
+                stop + timeframe_to_seconds(timeframe) * 1_000_000_000, side='right')))
+
+        def frame(end: int) -> DataFrame:
+            return (cache.dataframe(candles[first], candles[end - 1] + 1) if end > first
+                    else cache.dataframe(0, 0))
+
+        pairdf = frame(loaded)
+        if self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data):
+            return pairdf
+        if timerange:
+            self._validate_pairdata(pair, pairdf, timeframe, candle_type, timerange)
+            pairdf = frame(last)
+            if self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data, True):
+                return pairdf
+        if drop_incomplete and last == loaded:
+            last -= 1
+            logger.debug('Dropping last candle')
+            pairdf = frame(last)
+        if fill_missing:
+            log_ohlcv_fillup(pair, last - first, len(pairdf))
+        self._check_empty_df(pairdf, pair, timeframe, candle_type, warn_no_data)
+        return pairdf
+
     def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         """
         Remove data for this pair
@@ -136,11 +468,41 @@ class IDataHandler(ABC):
         :return: True when deleted, false if file did not exist.
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self._ohlcv_purge_segments(filename)
+        purge_ohlcv_mmap(filename)
+        try:
+            DatadirIndex(self._datadir).remove(filename)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update datadir index for {filename}: {e}")
         if filename.exists():
             filename.unlink()
             return True
         return False
 
+    def ohlcv_replace(self, source: 'IDataHandler', pair: str, timeframe: str,
+                      candle_type: CandleType) -> None:
+        """
+        Replace the data of this pair with the data stored by source, by moving the files
+        of source into place. source must use the same data format, and a datadir on the
+        same filesystem.
+        :param source: Datahandler containing the new data
+        :param pair: Pair
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        source_file = source._pair_data_filename(source._datadir, pair, timeframe, candle_type)
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.ohlcv_purge(pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+        source_file.replace(filename)
+        source_segments = source._ohlcv_segment_dir(source_file)
+        if source_segments.is_dir():
+            source_segments.replace(self._ohlcv_segment_dir(filename))
+        if DatadirIndex(self._datadir).exists():
+            self._ohlcv_index_store(pair, timeframe,
+                                    self._ohlcv_load(pair, timeframe, None, candle_type),
+                                    candle_type)
+
     @abstractmethod
     def ohlcv_append(
         self,
@@ -197,6 +559,16 @@ class IDataHandler(ABC):
         :return: Dataframe containing trades
         """
 
+    def _trades_load_chunks(self, pair: str, chunksize: int) -> Iterator[DataFrame]:
+        """
+        Load trades for this pair in time-ordered chunks of up to chunksize trades.
+        Datahandlers which can't read parts of a file return all trades as one chunk.
+        :param pair: Load trades for this pair
+        :param chunksize: Maximum number of trades per chunk
+        :return: Iterator of Dataframes containing trades
+        """
+        yield self._trades_load(pair)
+
     def trades_store(self, pair: str, data: DataFrame) -> None:
         """
         Store trades data (list of Dicts) to file
@@ -232,6 +604,19 @@ class IDataHandler(ABC):
         trades = trades_convert_types(trades)
         return trades
 
+    def trades_load_chunks(self, pair: str,
+                           chunksize: Optional[int] = None) -> Iterator[DataFrame]:
+        """
+        Load trades for this pair in time-ordered chunks, to limit memory usage.
+        Removes duplicates (within each chunk) in the process.
+        :param pair: Load trades for this pair
+        :param chunksize: Maximum number of trades per chunk (not guaranteed by all datahandlers)
+                          Defaults to TRADES_CHUNKSIZE.
+        :return: Iterator of Dataframes containing trades
+        """
+        for chunk in self._trades_load_chunks(pair, chunksize or TRADES_CHUNKSIZE):
+            yield trades_convert_types(trades_df_remove_duplicates(chunk))
+
     @classmethod
     def create_dir_if_needed(cls, datadir: Path):
         """
@@ -316,6 +701,13 @@ class IDataHandler(ABC):
         if startup_candles > 0 and timerange_startup:
             timerange_startup.subtract_start(timeframe_to_seconds(timeframe) * startup_candles)
 
+        if self._mmap_cache:
+            pairdf_mmap = self._ohlcv_load_mmap(
+                pair, timeframe, timerange_startup, candle_type, fill_missing=fill_missing,
+                drop_incomplete=drop_incomplete, warn_no_data=warn_no_data)
+            if pairdf_mmap is not None:
+                return pairdf_mmap
+
         pairdf = self._ohlcv_load(
             pair,
             timeframe,
@@ -401,7 +793,12 @@ class IDataHandler(ABC):
         if file_new.exists():
             logger.warning(f"{file_new} exists already, can't migrate {pair}.")
             return
+        entry = self.ohlcv_index_entry(pair, timeframe, candle_type)
         file_old.rename(file_new)
+        index = DatadirIndex(self._datadir)
+        if entry:
+            index.update(entry._replace(filename=index.relative_name(file_new), pair=new_pair))
+            index.remove(file_old)
 
 
 def get_datahandlerclass(datatype: str) -> Type[IDataHandler]:
@@ -433,14 +830,16 @@ def get_datahandlerclass(datatype: str) -> Type[IDataHandler]:
 
 
 def get_datahandler(datadir: Path, data_format: Optional[str] = None,
-                    data_handler: Optional[IDataHandler] = None) -> IDataHandler:
+                    data_handler: Optional[IDataHandler] = None,
+                    mmap_cache: bool = False) -> IDataHandler:
     """
     :param datadir: Folder to save data
     :param data_format: dataformat to use
     :param data_handler: returns this datahandler if it exists or initializes a new one
+    :param mmap_cache: Load ohlcv data through the memory mapped cache
     """
 
     if not data_handler:
         HandlerClass = get_datahandlerclass(data_format or 'feather')
-        data_handler = HandlerClass(datadir)
+        data_handler = HandlerClass(datadir, mmap_cache=mmap_cache)
     return data_handler
@@ -43,6 +43,7 @@ class JsonDataHandler(IDataHandler):
         _data.reset_index(drop=True).loc[:, self._columns].to_json(
             filename, orient="values",
             compression='gzip' if self._use_zip else None)
+        self._ohlcv_index_store(pair, timeframe, data, candle_type)
 
     def _ohlcv_load(self, pair: str, timeframe: str,
                     timerange: Optional[TimeRange], candle_type: CandleType
@@ -0,0 +1,117 @@
+"""
+Memory mapped cache of decoded (and cleaned) OHLCV data.
+Candles are stored as uncompressed numpy files next to the data files, so concurrent processes
+loading the same data share one copy (the OS page cache) and skip decoding.
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame, DatetimeTZDtype
+from pandas.arrays import DatetimeArray
+
+
+logger = logging.getLogger(__name__)
+
+OHLCV_CACHE_DIR = '.ohlcv_cache'
+_VALUE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class OhlcvMmap(NamedTuple):
+    """
+    Read-only memory mapped arrays of the cached data.
+    """
+    # Candle dates (int64 nanoseconds)
+    dates: np.ndarray
+    # open, high, low, close, volume - one row per candle
+    values: np.ndarray
+    # True for candles of the data file, False for candles added by cleaning (filled up)
+    candles: np.ndarray
+
+    def dataframe(self, start: int = 0, stop: Optional[int] = None) -> DataFrame:
+        """
+        DataFrame of the rows start:stop - backed by the memory maps, without copying them.
+        The dataframe must not be modified.
+        """
+        columns = {'date': DatetimeArray(self.dates[start:stop].view('datetime64[ns]'),
+                                         dtype=DatetimeTZDtype('ns', 'UTC'), copy=False)}
+        values = self.values[start:stop]
+        columns.update({col: values[:, idx] for idx, col in enumerate(_VALUE_COLUMNS)})
+        return DataFrame(columns, copy=False)
+
+
+def _cache_files(filename: Path, key: str) -> Tuple[Path, Path, Path]:
+    """
+    Cache files (dates, values, candles) for the data file with the given key.
+    """
+    cache_dir = filename.parent / OHLCV_CACHE_DIR
+    prefix = f'{filename.name}.{key}'
+    return (cache_dir / f'{prefix}.dates.npy', cache_dir / f'{prefix}.ohlcv.npy',
+            cache_dir / f'{prefix}.candles.npy')
+
+
+def _save_atomic(filename: Path, arr: np.ndarray) -> None:
+    """
+    Write to a temporary file first - so other processes never see partially written files.
+    """
+    tmp_file = filename.with_name(f'{filename.name}.{os.getpid()}.tmp')
+    with tmp_file.open('wb') as f:
+        np.save(f, arr)
+    tmp_file.replace(filename)
+
+
+def purge_ohlcv_mmap(filename: Path, keep: str = '') -> None:
+    """
+    Remove all cache files of this data file.
+    :param keep: Keep cache files whose key starts with this prefix
+    """
+    for cache_file in (filename.parent / OHLCV_CACHE_DIR).glob(f'{filename.name}.*.npy'):
+        if keep and cache_file.name.startswith(f'{filename.name}.{keep}'):
+            continue
+        try:
+            cache_file.unlink()
+        except OSError:
+            # Still mapped by another process (windows)
+            pass
+
+
+def _write_cache(filename: Path, stamp: int, data: DataFrame, candles: np.ndarray,
+                 files: Tuple[Path, Path, Path]) -> bool:
+    """
+    Write data to the cache, removing outdated cache files for this data file.
+    :return: True if the data was cached.
+    """
+    if data.empty or not data['date'].is_monotonic_increasing:
+        # Only sorted data can be sliced by timerange.
+        return False
+    purge_ohlcv_mmap(filename, keep=f'{stamp}.')
+    dates_file, values_file, candles_file = files
+    dates_file.parent.mkdir(exist_ok=True)
+    _save_atomic(dates_file, data['date'].values.astype('datetime64[ns]').view(np.int64))
+    _save_atomic(values_file, data[_VALUE_COLUMNS].to_numpy(dtype=np.float64))
+    _save_atomic(candles_file, np.asarray(candles, dtype=bool))
+    return True
+
+
+def load_ohlcv_mmap(filename: Path, stamp_paths: List[Path], variant: str,
+                    loader: Callable[[], Tuple[DataFrame, np.ndarray]]) -> Optional[OhlcvMmap]:
+    """
+    Load ohlcv data from the memory mapped cache, building the cache if necessary.
+    :param filename: Data file
+    :param stamp_paths: Paths whose modification time invalidates the cache
+                        (the data file, and everything else changing the loaded data).
+    :param variant: Key of the parameters used to load the data (e.g. the cleaning parameters)
+    :param loader: Loads the full data of the data file, returning the data and the candles mask
+                   (see OhlcvMmap.candles)
+    :return: Memory mapped data - or None if the data can't be cached.
+    """
+    stamp = max(path.stat().st_mtime_ns for path in stamp_paths if path.exists())
+    files = _cache_files(filename, f'{stamp}.{variant}')
+    if not all(file.exists() for file in files):
+        logger.debug(f"Building ohlcv cache for {filename}.")
+        if not _write_cache(filename, stamp, *loader(), files):
+            return None
+
+    return OhlcvMmap(*(np.load(file, mmap_mode='r') for file in files))
@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 from typing import Optional
 
 from pandas import DataFrame, read_parquet, to_datetime
@@ -16,6 +17,7 @@ logger = logging.getLogger(__name__)
 class ParquetDataHandler(IDataHandler):
 
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    OHLCV_APPEND_SUPPORTED = True
 
     def ohlcv_store(
             self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
@@ -31,8 +33,14 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
+        self._ohlcv_write(filename, data)
+        self._ohlcv_purge_segments(filename)
+        self._ohlcv_index_store(pair, timeframe, data, candle_type)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+    def _ohlcv_write(self, filename: Path, data: DataFrame) -> None:
+        # Smaller row groups allow skipping more data when loading a timerange.
+        data.reset_index(drop=True).loc[:, self._columns].to_parquet(
+            filename, row_group_size=100_000)
 
     def _ohlcv_load(self, pair: str, timeframe: str,
                     timerange: Optional[TimeRange], candle_type: CandleType
@@ -58,7 +66,7 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
 
-        pairdata = read_parquet(filename)
+        pairdata = self._load_arrow_dataset(filename, 'parquet', timeframe, timerange)
         pairdata.columns = self._columns
         pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
                                           'low': 'float', 'close': 'float', 'volume': 'float'})
@@ -79,7 +87,7 @@ class ParquetDataHandler(IDataHandler):
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        self._ohlcv_append_segment(pair, timeframe, data, candle_type)
 
     def _trades_store(self, pair: str, data: DataFrame) -> None:
         """
@@ -71,6 +71,23 @@ class DDosProtection(TemporaryError):
     """
 
 
+class DeferredRetryError(FreqtradeException):
+    """
+    A failed exchange call needs a backoff delay before it's retried, while backoff delays
+    are deferred (see exchange.common.deferred_backoff).
+    The caller should retry the operation once the delay (in seconds) has passed - with the
+    remaining retries (see exchange.common.resume_retries).
+    Not an ExchangeError, so it passes the error handling of the calling code.
+    """
+
+    def __init__(self, message: str, delay: float, function: str = '', count: int = 0) -> None:
+        super().__init__(message)
+        self.delay = delay
+        # Qualified name of the failed function, and its remaining retries
+        self.function = function
+        self.count = count
+
+
 class StrategyError(FreqtradeException):
     """
     Errors with custom user-code detected.
@@ -29,6 +29,8 @@ class Binance(Exchange):
         "trades_pagination": "id",
         "trades_pagination_arg": "fromId",
         "l2_limit_range": [5, 10, 20, 50, 100, 500, 1000],
+        # fetch_open_orders without symbol has the weight of 20 fetch_order calls
+        "open_orders_bulk_min": 20,
     }
     _ft_has_futures: Dict = {
         "stoploss_order_types": {"limit": "stop", "market": "stop_market"},
@@ -37,12 +39,16 @@ class Binance(Exchange):
         "floor_leverage": True,
         "stop_price_type_field": "workingType",
         "order_props_in_contracts": ['amount', 'cost', 'filled', 'remaining'],
+        "open_orders_bulk_min": 40,
         "stop_price_type_value_mapping": {
             PriceType.LAST: "CONTRACT_PRICE",
             PriceType.MARK: "MARK_PRICE",
         },
     }
 
+    # Allow fetch_open_orders() without symbol (see open_orders_bulk_min)
+    _ccxt_params: Dict = {'options': {'warnOnFetchOpenOrdersWithoutSymbol': False}}
+
     _supported_trading_mode_margin_pairs: List[Tuple[TradingMode, MarginMode]] = [
         # TradingMode.SPOT always supported and not required in this list
         # (TradingMode.MARGIN, MarginMode.CROSS),
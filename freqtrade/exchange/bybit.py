@@ -226,8 +226,8 @@ class Bybit(Exchange):
 
         return orders
 
-    def fetch_order(self, order_id: str, pair: str, params: Dict = {}) -> Dict:
-        order = super().fetch_order(order_id, pair, params)
+    def _parse_fetched_order(self, order: Dict) -> Dict:
+        order = super()._parse_fetched_order(order)
         if (
             order.get('status') == 'canceled'
             and order.get('filled') == 0.0
@@ -1,11 +1,15 @@
 import asyncio
 import logging
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Optional, TypeVar, cast, overload
+from typing import Any, Callable, Iterator, Optional, Tuple, TypeVar, cast, overload
 
 from freqtrade.constants import ExchangeConfig
-from freqtrade.exceptions import DDosProtection, RetryableOrderError, TemporaryError
+from freqtrade.exceptions import (DDosProtection, DeferredRetryError, RetryableOrderError,
+                                  TemporaryError)
 from freqtrade.mixins import LoggingMixin
 
 
@@ -110,6 +114,62 @@ def calculate_backoff(retrycount, max_retries):
     return (max_retries - retrycount) ** 2 + 1
 
 
+@dataclass
+class RetryStats:
+    """
+    Counters of the retrier decorators.
+    """
+    # Retries of failed exchange calls
+    retries: int = 0
+    # Retries deferred instead of waiting for the backoff delay
+    deferred: int = 0
+    # Time spent waiting for backoff delays of synchronous calls (seconds)
+    backoff_time: float = 0.0
+
+
+retry_stats = RetryStats()
+
+_defer_backoff: ContextVar[Optional[bool]] = ContextVar('defer_backoff', default=None)
+_resume_retries: ContextVar[Optional[Tuple[str, int]]] = ContextVar(
+    'resume_retries', default=None)
+
+
+@contextmanager
+def deferred_backoff(defer: bool = True) -> Iterator[None]:
+    """
+    Within this context, synchronous calls needing a backoff delay (see retrier) raise
+    DeferredRetryError instead of blocking the bot - so the caller can retry them later.
+    Only use it around calls whose callers handle DeferredRetryError.
+    :param defer: False blocks on backoff delays again - also within nested contexts.
+    """
+    token = _defer_backoff.set(defer and _defer_backoff.get() is not False)
+    try:
+        yield
+    finally:
+        _defer_backoff.reset(token)
+
+
+@contextmanager
+def resume_retries(error: DeferredRetryError) -> Iterator[None]:
+    """
+    Within this context, the next call of the function which raised error continues with
+    its remaining retries, instead of starting over.
+    """
+    token = _resume_retries.set((error.function, error.count))
+    try:
+        yield
+    finally:
+        _resume_retries.reset(token)
+
+
+def backoff_sleep(delay: float) -> None:
+    """
+    Block for a backoff delay, counting it in retry_stats.
+    """
+    retry_stats.backoff_time += delay
+    time.sleep(delay)
+
+
 def retrier_async(f):
     async def wrapper(*args, **kwargs):
         count = kwargs.pop('count', API_RETRY_COUNT)
@@ -122,6 +182,7 @@ def retrier_async(f):
                 msg += f'Retrying still for {count} times.'
                 count -= 1
                 kwargs['count'] = count
+                retry_stats.retries += 1
                 if isinstance(ex, DDosProtection):
                     if kucoin and "429000" in str(ex):
                         # Temporary fix for 429000 error on kucoin
@@ -162,20 +223,33 @@ def retrier(_func: Optional[F] = None, *, retries=API_RETRY_COUNT):
     def decorator(f: F) -> F:
         @wraps(f)
         def wrapper(*args, **kwargs):
-            count = kwargs.pop('count', retries)
+            count = kwargs.pop('count', None)
+            if count is None:
+                count = retries
+                resume = _resume_retries.get()
+                if resume and resume[0] == f.__qualname__:
+                    count = resume[1]
+                    _resume_retries.set(None)
             try:
                 return f(*args, **kwargs)
             except (TemporaryError, RetryableOrderError) as ex:
                 msg = f'{f.__name__}() returned exception: "{ex}". '
                 if count > 0:
+                    backoff = isinstance(ex, (DDosProtection, RetryableOrderError))
+                    # increasing backoff
+                    backoff_delay = calculate_backoff(count, retries)
+                    if backoff and _defer_backoff.get():
+                        retry_stats.deferred += 1
+                        logger.warning(msg + f'Deferring retry by {backoff_delay}s.')
+                        raise DeferredRetryError(
+                            msg, backoff_delay, f.__qualname__, count - 1) from ex
                     logger.warning(msg + f'Retrying still for {count} times.')
+                    retry_stats.retries += 1
                     count -= 1
                     kwargs.update({'count': count})
-                    if isinstance(ex, (DDosProtection, RetryableOrderError)):
-                        # increasing backoff
-                        backoff_delay = calculate_backoff(count + 1, retries)
+                    if backoff:
                         logger.info(f"Applying DDosProtection backoff delay: {backoff_delay}")
-                        time.sleep(backoff_delay)
+                        backoff_sleep(backoff_delay)
                     return wrapper(*args, **kwargs)
                 else:
                     logger.warning(msg + 'Giving up.')
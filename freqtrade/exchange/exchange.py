@@ -6,6 +6,7 @@ import asyncio
 import inspect
 import logging
 import signal
+import time
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import floor
@@ -22,11 +23,13 @@ from pandas import DataFrame, concat
 from freqtrade.constants import (DEFAULT_AMOUNT_RESERVE_PERCENT, NON_OPEN_EXCHANGE_STATES, BidAsk,
                                  BuySell, Config, EntryExit, ExchangeConfig,
                                  ListPairsWithTimeframes, MakerTaker, OBLiteral, PairWithTimeframe)
-from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe, trades_dict_to_list
-from freqtrade.enums import OPTIMIZE_MODES, CandleType, MarginMode, PriceType, TradingMode
-from freqtrade.exceptions import (DDosProtection, ExchangeError, InsufficientFundsError,
-                                  InvalidOrderException, OperationalException, PricingError,
-                                  RetryableOrderError, TemporaryError)
+from freqtrade.data.converter import clean_ohlcv_dataframes, ohlcv_to_dataframe, trades_dict_to_list
+from freqtrade.enums import (OPTIMIZE_MODES, TRADING_MODES, CandleType, MarginMode, PriceType,
+                             TradingMode)
+from freqtrade.exceptions import (DDosProtection, DeferredRetryError, ExchangeError,
+                                  InsufficientFundsError, InvalidOrderException,
+                                  OperationalException, PricingError, RetryableOrderError,
+                                  TemporaryError)
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, remove_exchange_credentials,
                                        retrier, retrier_async)
 from freqtrade.exchange.exchange_utils import (ROUND, ROUND_DOWN, ROUND_UP, CcxtModuleType,
@@ -37,6 +40,7 @@ from freqtrade.exchange.exchange_utils import (ROUND, ROUND_DOWN, ROUND_UP, Ccxt
                                                timeframe_to_minutes, timeframe_to_msecs,
                                                timeframe_to_next_date, timeframe_to_prev_date,
                                                timeframe_to_seconds)
+from freqtrade.exchange.exchange_ws import ExchangeWS
 from freqtrade.exchange.types import OHLCVResponse, OrderBook, Ticker, Tickers
 from freqtrade.misc import (chunks, deep_merge_dicts, file_dump_json, file_load_json,
                             safe_value_fallback2)
@@ -47,6 +51,10 @@ from freqtrade.util.datetime_helpers import dt_humanize, dt_ts
 
 logger = logging.getLogger(__name__)
 
+# Delay (seconds) of REST candle requests after the candle start, to ensure a new candle
+# has been issued (see _async_after_rest_offset).
+REST_CANDLE_OFFSET = 1
+
 
 class Exchange:
 
@@ -85,6 +93,11 @@ class Exchange:
         "order_props_in_contracts": ['amount', 'filled', 'remaining'],
         # Override createMarketBuyOrderRequiresPrice where ccxt has it wrong
         "marketOrderRequiresPrice": False,
+        # Maximum time to wait for a closed candle from the websocket candle feed (seconds)
+        "ohlcv_ws_timeout": 3,
+        # Minimum number of orders to refresh with one fetch_open_orders() call without symbol
+        # (instead of fetching them one by one). 0 disables.
+        "open_orders_bulk_min": 0,
     }
     _ft_has: Dict = {}
     _ft_has_futures: Dict = {}
@@ -102,6 +115,7 @@ class Exchange:
         """
         self._api: ccxt.Exchange
         self._api_async: ccxt_async.Exchange = None
+        self._exchange_ws: Optional[ExchangeWS] = None
         self._markets: Dict = {}
         self._trading_fees: Dict[str, Any] = {}
         self._leverage_tiers: Dict[str, List[Dict]] = {}
@@ -197,6 +211,10 @@ class Exchange:
             self.fill_leverage_tiers()
         self.additional_exchange_init()
 
+        if (exchange_conf.get('enable_ws', False)
+                and config.get('runmode') in TRADING_MODES and validate):
+            self._exchange_ws = self._init_exchange_ws(exchange_conf, ccxt_async_config)
+
     def __del__(self):
         """
         Destructor - clean up async stuff
@@ -205,6 +223,9 @@ class Exchange:
 
     def close(self):
         logger.debug("Exchange object destroyed, closing async loop")
+        if self._exchange_ws:
+            self._exchange_ws.close()
+            self._exchange_ws = None
         if (self._api_async and inspect.iscoroutinefunction(self._api_async.close)
                 and self._api_async.session):
             logger.debug("Closing async ccxt session.")
@@ -266,6 +287,32 @@ class Exchange:
 
         return api
 
+    def _init_exchange_ws(self, exchange_config: Dict[str, Any],
+                          ccxt_kwargs: Dict) -> Optional[ExchangeWS]:
+        """
+        Initialize the websocket candle feed - if ccxt.pro supports candle streams of this exchange.
+        """
+        import ccxt.pro as ccxt_pro
+
+        api_ws = None
+        if is_exchange_known_ccxt(exchange_config['name'], ccxt_pro):
+            api_ws = self._init_ccxt(exchange_config, ccxt_pro, ccxt_kwargs)
+        if not api_ws or not api_ws.has.get('watchOHLCV'):
+            logger.warning(f"Exchange {self.name} does not support websocket candles, "
+                           "candles will be downloaded via REST.")
+            return None
+        exchange_ws = ExchangeWS(api_ws)
+        exchange_ws.set_markets(self._markets)
+        logger.info("Using websocket candle feed.")
+        return exchange_ws
+
+    @property
+    def ws_ohlcv_enabled(self) -> bool:
+        """
+        Candles of the traded candle types are streamed via websocket (see ExchangeWS).
+        """
+        return self._exchange_ws is not None
+
     @property
     def _ccxt_config(self) -> Dict:
         # Parameters to add directly to ccxt sync/async initialization.
@@ -480,6 +527,8 @@ class Exchange:
             self._markets = self._api.load_markets(params={})
             self._load_async_markets()
             self._last_markets_refresh = dt_ts()
+            if self._exchange_ws:
+                self._exchange_ws.set_markets(self._markets)
             if self._ft_has['needs_trading_fees']:
                 self._trading_fees = self.fetch_trading_fees()
 
@@ -498,6 +547,8 @@ class Exchange:
             # Also reload async markets to avoid issues with newly listed pairs
             self._load_async_markets(reload=True)
             self._last_markets_refresh = dt_ts()
+            if self._exchange_ws:
+                self._exchange_ws.set_markets(self._markets)
             self.fill_leverage_tiers()
         except ccxt.BaseError:
             logger.exception("Could not reload markets.")
@@ -1247,6 +1298,12 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    def _parse_fetched_order(self, order: Dict) -> Dict:
+        """
+        Adjust an order returned by the exchange (amounts in contracts) to freqtrade's format.
+        """
+        return self._order_contracts_to_amount(order)
+
     @retrier(retries=API_FETCH_ORDER_RETRY_COUNT)
     def fetch_order(self, order_id: str, pair: str, params: Dict = {}) -> Dict:
         if self._config['dry_run']:
@@ -1254,7 +1311,7 @@ class Exchange:
         try:
             order = self._api.fetch_order(order_id, pair, params=params)
             self._log_exchange_response('fetch_order', order)
-            order = self._order_contracts_to_amount(order)
+            order = self._parse_fetched_order(order)
             return order
         except ccxt.OrderNotFound as e:
             raise RetryableOrderError(
@@ -1270,6 +1327,91 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    async def _async_fetch_order(self, order_id: str, pair: str) -> Dict:
+        """
+        Single attempt of fetch_order on the async api - see fetch_orders_by_id for retries.
+        """
+        try:
+            order = await self._api_async.fetch_order(order_id, pair)
+            self._log_exchange_response('fetch_order', order)
+            return self._parse_fetched_order(order)
+        except ccxt.OrderNotFound as e:
+            raise RetryableOrderError(
+                f'Order not found (pair: {pair} id: {order_id}). Message: {e}') from e
+        except ccxt.InvalidOrder as e:
+            raise InvalidOrderException(
+                f'Tried to get an invalid order (pair: {pair} id: {order_id}). Message: {e}') from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f'Could not get order due to {e.__class__.__name__}. Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
+    def _fetch_all_open_orders(self) -> List[Dict]:
+        """
+        Fetch the open orders of all pairs - empty if the request fails.
+        """
+        try:
+            orders = self._api.fetch_open_orders()
+            self._log_exchange_response('fetch_open_orders', orders)
+            return [self._parse_fetched_order(order) for order in orders]
+        except ccxt.BaseError as e:
+            logger.warning(f'Could not fetch open orders due to {e.__class__.__name__}. '
+                           f'Message: {e}')
+            return []
+
+    def fetch_orders_by_id(
+            self, orders: List[Tuple[str, str]]
+    ) -> Dict[str, Union[Dict, ExchangeError, DeferredRetryError]]:
+        """
+        Fetch multiple orders (like fetch_order) with as few blocking requests as possible.
+        Orders which are still open are taken from one fetch_open_orders() call (if enabled via
+        open_orders_bulk_min), all others are fetched concurrently on the async api.
+        Orders failing with a temporary error are fetched again with fetch_order (and its
+        retries / backoff).
+        :param orders: List of (order_id, pair) tuples
+        :return: Dict of order_id -> order, or the ExchangeError (or DeferredRetryError, see
+            deferred_backoff) raised while fetching it
+        """
+        results: Dict[str, Union[Dict, ExchangeError, DeferredRetryError]] = {}
+        if self._config['dry_run'] or len(orders) == 1:
+            for order_id, pair in orders:
+                try:
+                    results[order_id] = self.fetch_order(order_id, pair)
+                except (ExchangeError, DeferredRetryError) as e:
+                    results[order_id] = e
+            return results
+
+        bulk_min = self._ft_has['open_orders_bulk_min']
+        if bulk_min and len(orders) >= bulk_min and self.exchange_has('fetchOpenOrders'):
+            order_ids = {order_id for order_id, _ in orders}
+            results.update({order['id']: order for order in self._fetch_all_open_orders()
+                            if order['id'] in order_ids})
+        pending = [(order_id, pair) for order_id, pair in orders if order_id not in results]
+
+        async def gather_orders():
+            return await asyncio.gather(
+                *(self._async_fetch_order(order_id, pair) for order_id, pair in pending),
+                return_exceptions=True)
+
+        with self._loop_lock:
+            fetched = self.loop.run_until_complete(gather_orders())
+
+        for (order_id, pair), order in zip(pending, fetched):
+            if isinstance(order, (TemporaryError, RetryableOrderError)):
+                # Order not found (yet), or temporary errors (e.g. rate limits hit by the
+                # concurrent requests) - retry with the regular retrier and backoff.
+                try:
+                    order = self.fetch_order(order_id, pair)
+                except (ExchangeError, DeferredRetryError) as e:
+                    order = e
+            elif isinstance(order, BaseException) and not isinstance(order, ExchangeError):
+                raise order
+            results[order_id] = order
+        return results
+
     def fetch_stoploss_order(self, order_id: str, pair: str, params: Dict = {}) -> Dict:
         return self.fetch_order(order_id, pair, params)
 
@@ -1919,10 +2061,23 @@ class Exchange:
         :param candle_type: '', mark, index, premiumIndex, or funding_rate
         :return: List with candle (OHLCV) data
         """
-        pair, _, _, data, _ = self.loop.run_until_complete(
-            self._async_get_historic_ohlcv(pair=pair, timeframe=timeframe,
-                                           since_ms=since_ms, until_ms=until_ms,
-                                           is_new_pair=is_new_pair, candle_type=candle_type))
+        return self.loop.run_until_complete(
+            self.async_get_historic_ohlcv(pair=pair, timeframe=timeframe,
+                                          since_ms=since_ms, until_ms=until_ms,
+                                          is_new_pair=is_new_pair, candle_type=candle_type))
+
+    async def async_get_historic_ohlcv(self, pair: str, timeframe: str,
+                                       since_ms: int, candle_type: CandleType,
+                                       is_new_pair: bool = False,
+                                       until_ms: Optional[int] = None) -> List:
+        """
+        Async version of get_historic_ohlcv - to be awaited on the exchange's event loop,
+        e.g. to download multiple pairs concurrently.
+        :return: List with candle (OHLCV) data
+        """
+        pair, _, _, data, _ = await self._async_get_historic_ohlcv(
+            pair=pair, timeframe=timeframe, since_ms=since_ms, until_ms=until_ms,
+            is_new_pair=is_new_pair, candle_type=candle_type)
         logger.info(f"Downloaded data for {pair} with length {len(data)}.")
         return data
 
@@ -1985,6 +2140,13 @@ class Exchange:
                     f"Time jump detected. Evicting cache for {pair}, {timeframe}, {candle_type}")
                 del self._klines[(pair, timeframe, candle_type)]
 
+        if (cache and self._exchange_ws
+                and candle_type in (CandleType.SPOT, CandleType.FUTURES)):
+            self._exchange_ws.schedule_ohlcv(pair, timeframe, candle_type)
+            if (not since_ms and not not_all_data
+                    and (pair, timeframe, candle_type) in self._klines):
+                return self._async_get_ws_candle_history(pair, timeframe, candle_type)
+
         if (not since_ms and (self._ft_has["ohlcv_require_since"] or not_all_data)):
             # Multiple calls for one pair - to get more history
             one_call = timeframe_to_msecs(timeframe) * self.ohlcv_candle_limit(
@@ -1994,12 +2156,15 @@ class Exchange:
             since_ms = int((now - timedelta(seconds=move_to // 1000)).timestamp() * 1000)
 
         if since_ms:
-            return self._async_get_historic_ohlcv(
+            coro = self._async_get_historic_ohlcv(
                 pair, timeframe, since_ms=since_ms, raise_=True, candle_type=candle_type)
         else:
             # One call ... "regular" refresh
-            return self._async_get_candle_history(
+            coro = self._async_get_candle_history(
                 pair, timeframe, since_ms=since_ms, candle_type=candle_type)
+        if self._exchange_ws:
+            return self._async_after_rest_offset(timeframe, coro)
+        return coro
 
     def _build_ohlcv_dl_jobs(
             self, pair_list: ListPairsWithTimeframes, since_ms: Optional[int],
@@ -2032,29 +2197,42 @@ class Exchange:
 
         return input_coroutines, cached_pairs
 
-    def _process_ohlcv_df(self, pair: str, timeframe: str, c_type: CandleType, ticks: List[List],
-                          cache: bool, drop_incomplete: bool) -> DataFrame:
-        # keeping last candle time as last refreshed time of the pair
-        if ticks and cache:
-            idx = -2 if drop_incomplete and len(ticks) > 1 else -1
-            self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[idx][0] // 1000
-        # keeping parsed dataframe in cache
-        ohlcv_df = ohlcv_to_dataframe(ticks, timeframe, pair=pair, fill_missing=True,
-                                      drop_incomplete=drop_incomplete)
-        if cache:
-            if (pair, timeframe, c_type) in self._klines:
+    def _process_ohlcv_dfs(self, results: List[OHLCVResponse], cache: bool,
+                           drop_incomplete: Optional[bool]) -> Dict[PairWithTimeframe, DataFrame]:
+        """
+        Convert downloaded candles to dataframes, merging them with the cached candles.
+        Merged dataframes of all pairs are cleaned in one call (see clean_ohlcv_dataframes).
+        :param results: Download results (pair, timeframe, candle_type, ticks, drop_hint)
+        :param drop_incomplete: Control candle dropping. None uses the drop_hint of the result.
+        """
+        results_df: Dict[PairWithTimeframe, DataFrame] = {}
+        merged: List[PairWithTimeframe] = []
+        for pair, timeframe, c_type, ticks, drop_hint in results:
+            drop_incomplete_ = drop_hint if drop_incomplete is None else drop_incomplete
+            # keeping last candle time as last refreshed time of the pair
+            if ticks and cache:
+                idx = -2 if drop_incomplete_ and len(ticks) > 1 else -1
+                self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[idx][0] // 1000
+            ohlcv_df = ohlcv_to_dataframe(ticks, timeframe, pair=pair, fill_missing=True,
+                                          drop_incomplete=drop_incomplete_)
+            if cache and (pair, timeframe, c_type) in self._klines:
                 old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(concat([old, ohlcv_df], axis=0), timeframe, pair,
-                                                 fill_missing=True, drop_incomplete=False)
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config['candle_type_def'])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-        return ohlcv_df
+                ohlcv_df = concat([old, ohlcv_df], axis=0)
+                merged.append((pair, timeframe, c_type))
+            results_df[(pair, timeframe, c_type)] = ohlcv_df
+
+        for key, ohlcv_df in clean_ohlcv_dataframes(
+                {key: results_df[key] for key in merged},
+                fill_missing=True, drop_incomplete=False).items():
+            candle_limit = self.ohlcv_candle_limit(key[1], self._config['candle_type_def'])
+            # Age out old candles
+            ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
+            results_df[key] = ohlcv_df.reset_index(drop=True)
+
+        if cache:
+            # keeping parsed dataframe in cache
+            self._klines.update(results_df)
+        return results_df
 
     def refresh_latest_ohlcv(self, pair_list: ListPairsWithTimeframes, *,
                              since_ms: Optional[int] = None, cache: bool = True,
@@ -2072,6 +2250,8 @@ class Exchange:
         :return: Dict of [{(pair, timeframe): Dataframe}]
         """
         logger.debug("Refreshing candle (OHLCV) data for %d pairs", len(pair_list))
+        if self._exchange_ws:
+            self._exchange_ws.cleanup_expired()
 
         # Gather coroutines to run
         input_coroutines, cached_pairs = self._build_ohlcv_dl_jobs(pair_list, since_ms, cache)
@@ -2085,17 +2265,13 @@ class Exchange:
             with self._loop_lock:
                 results = self.loop.run_until_complete(gather_stuff())
 
+            responses = []
             for res in results:
                 if isinstance(res, Exception):
                     logger.warning(f"Async code raised an exception: {repr(res)}")
                     continue
-                # Deconstruct tuple (has 5 elements)
-                pair, timeframe, c_type, ticks, drop_hint = res
-                drop_incomplete_ = drop_hint if drop_incomplete is None else drop_incomplete
-                ohlcv_df = self._process_ohlcv_df(
-                    pair, timeframe, c_type, ticks, cache, drop_incomplete_)
-
-                results_df[(pair, timeframe, c_type)] = ohlcv_df
+                responses.append(res)
+            results_df.update(self._process_ohlcv_dfs(responses, cache, drop_incomplete))
 
         # Return cached klines
         for pair, timeframe, c_type in cached_pairs:
@@ -2106,6 +2282,46 @@ class Exchange:
 
         return results_df
 
+    async def _async_get_ws_candle_history(
+            self, pair: str, timeframe: str, candle_type: CandleType) -> OHLCVResponse:
+        """
+        Get the candles following the cached candles from the websocket candle feed.
+        Waits for the candle which just closed (up to ohlcv_ws_timeout) - and falls back to
+        fetch_ohlcv if it doesn't arrive or the websocket candles have gaps.
+        """
+        assert self._exchange_ws is not None
+        tf_ms = timeframe_to_msecs(timeframe)
+        # Open date of the current (incomplete) candle
+        candle_ms = int(timeframe_to_prev_date(timeframe).timestamp() * 1000)
+        last_ms = self._pairs_last_refresh_time.get((pair, timeframe, candle_type), 0) * 1000
+        candles = await self._exchange_ws.get_ohlcv(
+            pair, timeframe, candle_type, candle_ms, self._ft_has['ohlcv_ws_timeout'])
+        new_candles = [c for c in candles if c[0] > last_ms]
+        # Candles are unique and sorted - so first, last and count show gaps.
+        if (new_candles and new_candles[0][0] == last_ms + tf_ms
+                and new_candles[-1][0] == candle_ms
+                and len(new_candles) == (candle_ms - last_ms) // tf_ms):
+            # The last candle is still open
+            return pair, timeframe, candle_type, new_candles, True
+        logger.debug(f"Websocket candles of {pair}, {timeframe}, {candle_type} don't follow "
+                     "the cached candles, downloading them.")
+        return await self._async_after_rest_offset(
+            timeframe, self._async_get_candle_history(pair, timeframe, candle_type))
+
+    async def _async_after_rest_offset(
+            self, timeframe: str, coro: Coroutine[Any, Any, OHLCVResponse]) -> OHLCVResponse:
+        """
+        Run a REST candle request at least REST_CANDLE_OFFSET seconds after the candle start.
+        With the websocket candle feed, the bot wakes up right at the candle close - while
+        fetch_ohlcv may not return the new candle yet (so the just closed candle would be
+        dropped as incomplete).
+        """
+        delay = (timeframe_to_prev_date(timeframe).timestamp() + REST_CANDLE_OFFSET
+                 - time.time())
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await coro
+
     def _now_is_time_to_refresh(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         # Timeframe in seconds
         interval_in_sec = timeframe_to_seconds(timeframe)
@@ -0,0 +1,164 @@
+"""
+Candle (OHLCV) feed from exchange websocket streams, using ccxt.pro.
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import Future
+from threading import Thread
+from typing import Any, Dict, List
+
+import ccxt
+
+from freqtrade.constants import PairWithTimeframe
+from freqtrade.enums import CandleType
+from freqtrade.exchange.exchange_utils import timeframe_to_seconds
+
+
+logger = logging.getLogger(__name__)
+
+# Delay before resubscribing after a failed websocket stream (seconds) - doubled after each
+# consecutive failure, up to WS_MAX_RETRY_DELAY.
+WS_RETRY_DELAY = 2
+WS_MAX_RETRY_DELAY = 60
+
+
+class ExchangeWS:
+    """
+    Watches the candles of the scheduled pairs in a background thread (with its own event loop),
+    so websocket connections stay alive between bot iterations.
+    Candles are kept by ccxt.pro (ccxt_object.ohlcvs) and only accessed from the feed's loop.
+    """
+
+    def __init__(self, ccxt_object: Any) -> None:
+        self._ccxt_object = ccxt_object
+        # Time of the last request of each pair - watches of unused pairs are stopped
+        self._klines_last_request: Dict[PairWithTimeframe, float] = {}
+        self._watches: Dict[PairWithTimeframe, Future] = {}
+        self._updated: Dict[PairWithTimeframe, asyncio.Event] = {}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._loop.run_forever, name='ft_exchange_ws', daemon=True)
+        self._thread.start()
+        # Bind ccxt (and its http session) to the feed's loop
+        self._loop.call_soon_threadsafe(self._ccxt_object.open)
+
+    def set_markets(self, markets: Dict) -> None:
+        """
+        Share the markets of the REST api, so ccxt.pro doesn't have to load them.
+        """
+        self._loop.call_soon_threadsafe(self._ccxt_object.set_markets, markets)
+
+    def schedule_ohlcv(self, pair: str, timeframe: str, candle_type: CandleType) -> None:
+        """
+        Start watching the candles of this pair (if it's not watched yet).
+        """
+        key = (pair, timeframe, candle_type)
+        self._klines_last_request[key] = time.time()
+        if key not in self._watches:
+            logger.debug(f"Watching websocket candles for {pair}, {timeframe}, {candle_type}.")
+            self._watches[key] = asyncio.run_coroutine_threadsafe(
+                self._watch_ohlcv(key), self._loop)
+
+    def cleanup_expired(self) -> None:
+        """
+        Stop watching pairs which were not requested for 2 candles.
+        """
+        now = time.time()
+        for key, last_request in list(self._klines_last_request.items()):
+            if now - last_request > 2 * timeframe_to_seconds(key[1]):
+                logger.debug(f"Stop watching websocket candles for {key}.")
+                self._watches.pop(key).cancel()
+                del self._klines_last_request[key]
+                asyncio.run_coroutine_threadsafe(self._unwatch_ohlcv(key), self._loop)
+
+    async def _unwatch_ohlcv(self, key: PairWithTimeframe) -> None:
+        """
+        Close the exchange subscription of this pair - if supported by ccxt.
+        Without un_watch_ohlcv (older ccxt versions), the subscription stays open until the
+        feed is closed, and ccxt keeps updating the candles of the pair.
+        """
+        unwatch = getattr(self._ccxt_object, 'un_watch_ohlcv', None)
+        if unwatch is None:
+            return
+        try:
+            await unwatch(key[0], key[1])
+        except Exception as e:
+            logger.debug(f"Could not unsubscribe websocket candles for {key}: {e}")
+
+    async def _watch_ohlcv(self, key: PairWithTimeframe) -> None:
+        """
+        Watch the candles of this pair until cancelled.
+        Network errors are retried with increasing delay - other exchange errors (e.g. a
+        delisted pair) stop the watch, so the pair's candles are downloaded via REST.
+        """
+        pair, timeframe, _ = key
+        retry_delay = WS_RETRY_DELAY
+        while True:
+            try:
+                candles = await self._ccxt_object.watch_ohlcv(pair, timeframe)
+            except ccxt.NetworkError as e:
+                logger.warning(f"Websocket candle stream for {pair}, {timeframe} failed: {e}. "
+                               f"Retrying in {retry_delay}s.")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, WS_MAX_RETRY_DELAY)
+                continue
+            except Exception as e:
+                logger.warning(f"Websocket candle stream for {pair}, {timeframe} failed: {e}. "
+                               "Candles of this pair will be downloaded via REST.")
+                return
+            retry_delay = WS_RETRY_DELAY
+            if candles:
+                if event := self._updated.pop(key, None):
+                    event.set()
+
+    def _candles(self, key: PairWithTimeframe) -> List[List]:
+        return self._ccxt_object.ohlcvs.get(key[0], {}).get(key[1], [])
+
+    async def _wait_ohlcv(self, key: PairWithTimeframe, candle_ms: int,
+                          timeout: float) -> List[List]:
+        deadline = self._loop.time() + timeout
+        candles = self._candles(key)
+        watch = self._watches.get(key)
+        if watch is not None and watch.done():
+            # Stopped due to an error - no new candles will arrive
+            return list(candles)
+        while candles and candles[-1][0] < candle_ms:
+            event = self._updated.setdefault(key, asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), deadline - self._loop.time())
+            except asyncio.TimeoutError:
+                break
+            candles = self._candles(key)
+        return list(candles)
+
+    async def get_ohlcv(self, pair: str, timeframe: str, candle_type: CandleType,
+                        candle_ms: int, timeout: float) -> List[List]:
+        """
+        Candles of this pair, once the candle starting at candle_ms was received.
+        To be awaited from any other event loop.
+        Returns the candles received so far after the timeout - and immediately if no candles
+        were received yet (e.g. the pair was just scheduled).
+        :param candle_ms: Open date (ms) of the candle to wait for
+        :param timeout: Maximum time to wait, in seconds
+        :return: List of candles [timestamp, open, high, low, close, volume], oldest first
+        """
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+            self._wait_ohlcv((pair, timeframe, candle_type), candle_ms, timeout), self._loop))
+
+    def close(self) -> None:
+        """
+        Stop all watches, close the websocket connections and stop the feed's loop.
+        """
+        for watch in self._watches.values():
+            watch.cancel()
+        self._watches.clear()
+        if self._loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._ccxt_object.close(), self._loop).result(10)
+        except Exception as e:
+            logger.warning(f"Could not close websocket connections: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -5,10 +5,11 @@ import logging
 import traceback
 from copy import deepcopy
 from datetime import datetime, time, timedelta, timezone
+from functools import partial
 from math import isclose
 from threading import Lock
-from time import sleep
-from typing import Any, Dict, List, Optional, Tuple
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from schedule import Scheduler
 
@@ -20,10 +21,11 @@ from freqtrade.data.dataprovider import DataProvider
 from freqtrade.edge import Edge
 from freqtrade.enums import (ExitCheckTuple, ExitType, RPCMessageType, RunMode, SignalDirection,
                              State, TradingMode)
-from freqtrade.exceptions import (DependencyException, ExchangeError, InsufficientFundsError,
-                                  InvalidOrderException, PricingError)
+from freqtrade.exceptions import (DeferredRetryError, DependencyException, ExchangeError,
+                                  InsufficientFundsError, InvalidOrderException, PricingError)
 from freqtrade.exchange import (ROUND_DOWN, ROUND_UP, remove_exchange_credentials,
                                 timeframe_to_minutes, timeframe_to_next_date, timeframe_to_seconds)
+from freqtrade.exchange.common import backoff_sleep, deferred_backoff, resume_retries, retry_stats
 from freqtrade.misc import safe_value_fallback, safe_value_fallback2
 from freqtrade.mixins import LoggingMixin
 from freqtrade.persistence import Order, PairLocks, Trade, init_db
@@ -117,6 +119,8 @@ class FreqtradeBot(LoggingMixin):
 
         # Protect exit-logic from forcesell and vice versa
         self._exit_lock = Lock()
+        # Exchange calls deferred due to a backoff delay - (retry time, error, call) tuples
+        self._deferred_calls: List[Tuple[float, DeferredRetryError, Callable[[], Any]]] = []
         LoggingMixin.__init__(self, logger, timeframe_to_seconds(self.strategy.timeframe))
 
         self.trading_mode: TradingMode = self.config.get('trading_mode', TradingMode.SPOT)
@@ -239,6 +243,11 @@ class FreqtradeBot(LoggingMixin):
             # First process current opened trades (positions)
             self.exit_positions(trades)
 
+        # Order fetches throttled above are retried once the other trades were handled,
+        # so one pair's backoff delay doesn't stall all other pairs.
+        with self._exit_lock:
+            self.process_deferred_calls()
+
         # Check if we need to adjust our current positions before attempting to buy new trades.
         if self.strategy.position_adjustment_enable:
             with self._exit_lock:
@@ -1109,6 +1118,8 @@ class FreqtradeBot(LoggingMixin):
                 if not trade.has_open_orders and trade.is_open and self.handle_trade(trade):
                     trades_closed += 1
 
+            except DeferredRetryError as exception:
+                self._defer_call(exception, partial(self.exit_positions, [trade]))
             except DependencyException as exception:
                 logger.warning(f'Unable to exit trade {trade.pair}: {exception}')
 
@@ -1229,8 +1240,10 @@ class FreqtradeBot(LoggingMixin):
 
         try:
             # First we check if there is already a stoploss on exchange
-            stoploss_order = self.exchange.fetch_stoploss_order(
-                trade.stoploss_order_id, trade.pair) if trade.stoploss_order_id else None
+            # A backoff delay is deferred - exit_positions retries the trade later.
+            with deferred_backoff():
+                stoploss_order = self.exchange.fetch_stoploss_order(
+                    trade.stoploss_order_id, trade.pair) if trade.stoploss_order_id else None
         except InvalidOrderException as exception:
             logger.warning('Unable to fetch stoploss order: %s', exception)
 
@@ -1331,32 +1344,90 @@ class FreqtradeBot(LoggingMixin):
         Timeout setting takes priority over limit order adjustment request.
         :return: None
         """
-        for trade in Trade.get_open_trades():
-            open_order: Order
-            for open_order in trade.open_orders:
-                try:
-                    order = self.exchange.fetch_order(open_order.order_id, trade.pair)
+        open_orders: List[Tuple[Trade, Order]] = [
+            (trade, open_order)
+            for trade in Trade.get_open_trades() for open_order in trade.open_orders]
+        if not open_orders:
+            return
+        # A backoff delay is deferred - manage_open_order retries the order later.
+        with deferred_backoff():
+            orders = self.exchange.fetch_orders_by_id(
+                [(open_order.order_id, trade.pair) for trade, open_order in open_orders])
 
-                except (ExchangeError):
-                    logger.info(
-                        'Cannot query order for %s due to %s', trade, traceback.format_exc()
-                    )
-                    continue
+        for trade, open_order in open_orders:
+            self.manage_open_order(trade, open_order, orders[open_order.order_id])
+
+    def manage_open_order(
+            self, trade: Trade, open_order: Order,
+            order: Union[Dict, ExchangeError, DeferredRetryError, None] = None) -> None:
+        """
+        Update one open order - and cancel or replace it if necessary (see manage_open_orders).
+        :param order: Order dict grabbed from the exchange, or the error raised fetching it.
+            The order is fetched if not provided.
+        :return: None
+        """
+        if not open_order.ft_is_open:
+            # Order was closed since this call was deferred
+            return
+        try:
+            if order is None:
+                order = self.exchange.fetch_order(open_order.order_id, trade.pair)
+            elif isinstance(order, (ExchangeError, DeferredRetryError)):
+                raise order
+        except DeferredRetryError as e:
+            self._defer_call(e, partial(self.manage_open_order, trade, open_order))
+            return
+        except ExchangeError as e:
+            logger.info('Cannot query order for %s due to %s', trade, ''.join(
+                traceback.format_exception(type(e), e, e.__traceback__)))
+            return
 
-                fully_cancelled = self.update_trade_state(trade, open_order.order_id, order)
-                not_closed = order['status'] == 'open' or fully_cancelled
+        if open_order.differs_from_ccxt_object(order):
+            fully_cancelled = self.update_trade_state(trade, open_order.order_id, order)
+        else:
+            fully_cancelled = self.exchange.check_order_canceled_empty(order)
+        not_closed = order['status'] == 'open' or fully_cancelled
 
-                if not_closed:
-                    if fully_cancelled or (
-                        open_order and self.strategy.ft_check_timed_out(
-                            trade, open_order, datetime.now(timezone.utc)
-                        )
-                    ):
-                        self.handle_cancel_order(
-                            order, open_order, trade, constants.CANCEL_REASON['TIMEOUT']
-                        )
-                    else:
-                        self.replace_order(order, open_order, trade)
+        if not_closed:
+            if fully_cancelled or (
+                open_order and self.strategy.ft_check_timed_out(
+                    trade, open_order, datetime.now(timezone.utc)
+                )
+            ):
+                self.handle_cancel_order(
+                    order, open_order, trade, constants.CANCEL_REASON['TIMEOUT']
+                )
+            else:
+                self.replace_order(order, open_order, trade)
+
+    def _defer_call(self, error: DeferredRetryError, call: Callable[[], Any]) -> None:
+        """
+        Retry call once the backoff delay of error has passed (see process_deferred_calls).
+        """
+        logger.info(f"Retrying in {error.delay}s, after handling all other trades: {error}")
+        self._deferred_calls.append((monotonic() + error.delay, error, call))
+
+    def process_deferred_calls(self) -> None:
+        """
+        Retry the exchange calls deferred due to a backoff delay - waiting for the remaining
+        delay if necessary.
+        Retries continue with the remaining retries of the deferred call, and block on further
+        backoff delays - as all other trades were handled by now.
+        :return: None
+        """
+        if not self._deferred_calls:
+            return
+        deferred_calls = sorted(self._deferred_calls, key=lambda deferred: deferred[0])
+        self._deferred_calls = []
+        for retry_time, error, call in deferred_calls:
+            delay = retry_time - monotonic()
+            if delay > 0:
+                backoff_sleep(delay)
+            with deferred_backoff(False), resume_retries(error):
+                call()
+        logger.info(f"Retried {len(deferred_calls)} deferred exchange calls. "
+                    f"Total retries: {retry_stats.retries}, deferred: {retry_stats.deferred}, "
+                    f"backoff time: {retry_stats.backoff_time:.1f}s.")
 
     def handle_cancel_order(self, order: Dict, order_obj: Order, trade: Trade, reason: str) -> None:
         """
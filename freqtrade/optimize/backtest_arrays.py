@@ -0,0 +1,221 @@
+"""
+Columnar (numpy backed) candle storage used by the "numpy" backtest engine.
+"""
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from freqtrade.util import dt_ts
+
+
+class PairArrays:
+    """
+    Holds the backtest columns of one pair as contiguous numpy arrays.
+    Rows are only materialized (in the same layout as the "lists" engine) when they are accessed,
+    so candles without signal and without open trade never create python objects.
+    """
+
+    def __init__(self, df: DataFrame, headers: List[str]) -> None:
+        """
+        :param df: Dataframe with (already shifted) signal columns
+        :param headers: Columns to use - the first column must be the date column.
+        """
+        self._length = len(df)
+        if not self._length:
+            # Signal columns are not added to empty dataframes.
+            df = DataFrame(columns=headers)
+        # Timestamps (with timezone) are returned from the DatetimeArray as-is.
+        self._dates = df[headers[0]].array
+        # Candle open dates as epoch milliseconds - used for comparisons in the backtest loop.
+        self.dates_ms: np.ndarray = (
+            df[headers[0]].values.astype('datetime64[ms]').astype(np.int64))
+        self._columns: List[np.ndarray] = [df[col].to_numpy() for col in headers[1:]]
+        self._numeric = [col.dtype.kind in 'biuf' for col in self._columns]
+        self.arrays: Dict[str, np.ndarray] = dict(zip(headers[1:], self._columns))
+        self.has_entry: np.ndarray = (
+            (self.arrays['enter_long'] == 1) | (self.arrays['enter_short'] == 1))
+        self.steps: np.ndarray = np.array([], dtype=np.int64)
+        # Rows before quiet_until can be skipped unless they carry an entry signal.
+        self.quiet_until: int = self._length
+        # First row which was not processed since the last processed row.
+        self.quiet_from: int = 0
+
+    def set_steps(self, start_ms: int, timeframe_ms: int) -> None:
+        """
+        Calculate the global step (see CandleSchedule) at which every row will be processed.
+        A row is processed at the first step whose time is at or after the candle date, but
+        never in the same step as the previous row of this pair (pairs with gaps lag behind).
+        """
+        # First step where step time (start + (step + 1) * timeframe) reaches the candle date.
+        first_step = np.maximum(-((start_ms - self.dates_ms) // timeframe_ms) - 1, 0)
+        rng = np.arange(self._length, dtype=np.int64)
+        self.steps = np.maximum.accumulate(first_step - rng) + rng if self._length else rng
+
+    def row_index_at_step(self, step: int) -> int:
+        """
+        Index of the first row which is processed at or after the given step.
+        """
+        return int(self.steps.searchsorted(step))
+
+    def get_high_low(self, start: int, stop: int) -> Tuple[float, float]:
+        """
+        Highest high and lowest low of the rows between start and stop (exclusive).
+        """
+        return (self.arrays['high'][start:stop].max().item(),
+                self.arrays['low'][start:stop].min().item())
+
+    def find_exit_candidate(self, start: int, *, stop_loss: float, open_ms: int,
+                            roi_minutes: np.ndarray, roi_rates: np.ndarray,
+                            exit_signal: bool) -> int:
+        """
+        Vectorized search for the first row (at or after start) on which a long trade with a
+        static stoploss may exit - either by stoploss, ROI or exit signal.
+        Returned rows may not result in an exit - but no exit can happen on earlier rows.
+        :param stop_loss: Stoploss rate of the trade
+        :param open_ms: Trade open date as epoch milliseconds
+        :param roi_minutes: Sorted ROI table durations (minutes)
+        :param roi_rates: Rate above which the ROI of the corresponding ROI entry is reached
+        :param exit_signal: Exit signals are used
+        :return: row index - or the length of the data if no exit was found.
+        """
+        window = 64
+        while start < self._length:
+            stop = min(start + window, self._length)
+            candidate = self.arrays['low'][start:stop] <= stop_loss
+            if exit_signal:
+                candidate |= self.arrays['exit_long'][start:stop] == 1
+            if len(roi_minutes):
+                trade_dur = (self.dates_ms[start:stop] - open_ms) // 60000
+                roi_idx = roi_minutes.searchsorted(trade_dur, side='right') - 1
+                candidate |= ((roi_idx >= 0)
+                              & (self.arrays['high'][start:stop] >= roi_rates[roi_idx.clip(0)]))
+            idx = int(candidate.argmax())
+            if candidate[idx]:
+                return start + idx
+            start = stop
+            window *= 4
+        return self._length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Tuple:
+        """
+        Materialize one row. Raises IndexError (like a list) if index is out of range.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('PairArrays index out of range')
+        return (self._dates[index], *(
+            col[index].item() if numeric else col[index]
+            for col, numeric in zip(self._columns, self._numeric)
+        ))
+
+
+class CandleSchedule:
+    """
+    Global candle index for the numpy backtest engine.
+    Step ``n`` corresponds to the time ``start_date + (n + 1) * timeframe``.
+    Pair start and end steps are calculated once, so pairs which start late (or end early)
+    cost nothing while they're not live.
+    """
+
+    def __init__(self, data: Dict[str, PairArrays], start_date: datetime,
+                 timeframe_min: int) -> None:
+        start_ms = dt_ts(start_date)
+        timeframe_ms = timeframe_min * 60 * 1000
+        # Live range per pair - the end step is the first step after the last row.
+        self._ranges: Dict[str, Tuple[int, int]] = {}
+        entry_steps = []
+        for pair, pair_data in data.items():
+            pair_data.set_steps(start_ms, timeframe_ms)
+            if len(pair_data):
+                self._ranges[pair] = (int(pair_data.steps[0]), int(pair_data.steps[-1]) + 1)
+                entry_steps.append(pair_data.steps[pair_data.has_entry])
+        self._changes = sorted({step for rng in self._ranges.values() for step in rng})
+        self._next_change = self._changes[0] if self._changes else np.iinfo(np.int64).max
+        # Steps where at least one pair has an entry signal.
+        self.entry_steps: np.ndarray = np.unique(
+            np.concatenate(entry_steps) if entry_steps else np.array([], dtype=np.int64))
+        self.live_pairs: List[str] = []
+
+    @property
+    def pairs_by_start(self) -> List[str]:
+        """
+        Pairs with data, sorted by the step they become live (keeping the original order).
+        """
+        return sorted(self._ranges, key=lambda pair: self._ranges[pair][0])
+
+    def get_live_pairs(self, step: int) -> List[str]:
+        """
+        Pairs which have data at or before this step - in the order of the original data dict.
+        Steps must be increasing, but may skip steps.
+        """
+        if step >= self._next_change:
+            self.live_pairs = [pair for pair, (start, end) in self._ranges.items()
+                               if start <= step < end]
+            idx = bisect_right(self._changes, step)
+            self._next_change = (self._changes[idx] if idx < len(self._changes)
+                                 else np.iinfo(np.int64).max)
+        return self.live_pairs
+
+    def next_entry_step(self, step: int) -> Optional[int]:
+        """
+        First step at or after ``step`` where any pair has an entry signal.
+        """
+        idx = self.entry_steps.searchsorted(step)
+        return int(self.entry_steps[idx]) if idx < len(self.entry_steps) else None
+
+
+class DetailArrays:
+    """
+    Detail timeframe candles of one pair as numpy views of the dataframe's columns.
+    The detail candles of all main candles are located once per backtest (set_main_candles,
+    one vectorized binary search), so looking up the candles of one main candle is constant.
+    """
+
+    def __init__(self, df: DataFrame) -> None:
+        """
+        :param df: Detail timeframe dataframe (date, open, high, low, close)
+        """
+        # Views only - the detail data is not copied.
+        self._dates = df['date'].array
+        self._dates_np: np.ndarray = df['date'].values
+        self._ohlc: List[np.ndarray] = [df[col].to_numpy()
+                                        for col in ('open', 'high', 'low', 'close')]
+        self._starts = np.zeros(0, dtype=np.int64)
+        self._stops = np.zeros(0, dtype=np.int64)
+
+    def set_main_candles(self, main_dates: np.ndarray, timeframe_min: int) -> None:
+        """
+        Locate the detail candles of each main timeframe candle.
+        :param main_dates: Dates of the main timeframe candles (datetime64[ns], sorted)
+        :param timeframe_min: Main timeframe in minutes
+        """
+        self._starts = self._dates_np.searchsorted(main_dates)
+        self._stops = self._dates_np.searchsorted(
+            main_dates + np.timedelta64(timeframe_min, 'm'))
+
+    def get_range(self, main_row: int) -> Tuple[int, int]:
+        """
+        Row offsets (start, stop) of the detail candles of the main candle at main_row
+        (position within the dates passed to set_main_candles).
+        """
+        return int(self._starts[main_row]), int(self._stops[main_row])
+
+    def get_rows(self, start: int, stop: int, signals: Tuple) -> List[Tuple]:
+        """
+        Materialize the rows between start and stop (exclusive) in the layout of the
+        main timeframe rows.
+        :param signals: Signal columns (everything after close) of the main candle.
+        """
+        return [(date, *ohlc, *signals)
+                for date, *ohlc in zip(self._dates[start:stop],
+                                       *(col[start:stop].tolist() for col in self._ohlc))]
+
+    def __len__(self) -> int:
+        return len(self._dates_np)
@@ -3,14 +3,18 @@
 """
 This module contains the backtesting logic
 """
+import hashlib
 import logging
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+from cachetools import LRUCache
 from numpy import nan
 from pandas import DataFrame
+from pandas.util import hash_pandas_object
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -26,6 +30,7 @@ from freqtrade.exchange import (amount_to_contract_precision, price_to_precision
                                 timeframe_to_minutes, timeframe_to_seconds)
 from freqtrade.exchange.exchange import Exchange
 from freqtrade.mixins import LoggingMixin
+from freqtrade.optimize.backtest_arrays import CandleSchedule, DetailArrays, PairArrays
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (generate_backtest_stats, generate_rejected_signals,
@@ -40,6 +45,7 @@ from freqtrade.resolvers import ExchangeResolver, StrategyResolver
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.types import BacktestResultType, get_BacktestResultType_default
+from freqtrade.util import dt_ts
 from freqtrade.util.binance_mig import migrate_binance_futures_data
 from freqtrade.wallets import Wallets
 
@@ -157,6 +163,15 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get('position_stacking', False)
         self.enable_protections: bool = self.config.get('enable_protections', False)
+        self.backtest_engine: str = self.config.get('backtest_engine',
+                                                    constants.BACKTEST_ENGINE_DEFAULT)
+        # State of the "numpy" engine, set per backtest run (see _backtest_numpy)
+        self._skip_open_trades = False
+        self._roi_table: Tuple[np.ndarray, np.ndarray] = (np.array([], dtype=np.int64),
+                                                          np.array([], dtype=np.float64))
+        # Backtest results by signal signature (see get_signal_signature) - enabled by hyperopt.
+        self.result_cache: Optional[LRUCache] = None
+        self.result_cache_hits = 0
         migrate_binance_futures_data(config)
 
         self.init_backtest()
@@ -191,6 +206,7 @@ class Backtesting:
         else:
             self.timeframe_detail_min = 0
         self.detail_data: Dict[str, DataFrame] = {}
+        self._detail_arrays: Dict[str, DetailArrays] = {}
         self.futures_data: Dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -242,6 +258,8 @@ class Backtesting:
             startup_candles=self.config['startup_candle_count'],
             fail_without_data=True,
             data_format=self.config['dataformat_ohlcv'],
+            mmap_cache=self.config.get('ohlcv_mmap_cache', False),
+            compact_dataframes=self.config.get('compact_dataframes', False),
             candle_type=self.config.get('candle_type_def', CandleType.SPOT)
         )
 
@@ -271,10 +289,13 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config['dataformat_ohlcv'],
+                mmap_cache=self.config.get('ohlcv_mmap_cache', False),
+                compact_dataframes=self.config.get('compact_dataframes', False),
                 candle_type=self.config.get('candle_type_def', CandleType.SPOT)
             )
         else:
             self.detail_data = {}
+        self._detail_arrays = {}
         if self.trading_mode == TradingMode.FUTURES:
             # Load additional futures data.
             funding_rates_dict = history.load_data(
@@ -285,6 +306,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config['dataformat_ohlcv'],
+                mmap_cache=self.config.get('ohlcv_mmap_cache', False),
+                compact_dataframes=self.config.get('compact_dataframes', False),
                 candle_type=CandleType.FUNDING_RATE
             )
 
@@ -297,6 +320,8 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config['dataformat_ohlcv'],
+                mmap_cache=self.config.get('ohlcv_mmap_cache', False),
+                compact_dataframes=self.config.get('compact_dataframes', False),
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price"))
             )
             # Combine data to avoid combining the data per trade.
@@ -341,6 +366,13 @@ class Backtesting:
         if enable_protections:
             self._load_protections(self.strategy)
 
+    def _is_default_callback(self, callback: str) -> bool:
+        """
+        Check if the strategy uses the (no-op) IStrategy implementation of a callback.
+        """
+        return getattr(getattr(self.strategy, callback), '__func__', None) is getattr(
+            IStrategy, callback)
+
     def check_abort(self):
         """
         Check if abort was requested, raise DependencyException if that's the case
@@ -350,9 +382,11 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: Dict[str, DataFrame]) -> Dict[str, Tuple]:
+    def _get_ohlcv_as_lists(self, processed: Dict[str, DataFrame]) -> Dict[str, Any]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
+        With the "numpy" backtest engine, columnar PairArrays are returned instead,
+        which materialize rows only on access.
 
         Used by backtest() - so keep this optimized for performance.
 
@@ -381,15 +415,20 @@ class Backtesting:
             df_analyzed = processed[pair] = pair_data = trim_dataframe(
                 df_analyzed, self.timerange, startup_candles=self.required_startup)
 
-            # Create a copy of the dataframe before shifting, that way the entry signal/tag
-            # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
+            # Create a copy of the backtest columns before shifting, that way the entry
+            # signal/tag remains on the correct candle for callbacks.
+            # Indicator columns are not needed (nor copied) from here on.
+            df_analyzed = df_analyzed[
+                [col for col in HEADERS if col in df_analyzed.columns]].copy()
 
             # To avoid using data from future, we use entry/exit signals shifted
             # from the previous candle
             for col in HEADERS[5:]:
                 tag_col = col in ('enter_tag', 'exit_tag')
                 if col in df_analyzed.columns:
+                    if tag_col and df_analyzed[col].dtype == 'category':
+                        # Categorical tags (compact_dataframes) can't be replaced by None
+                        df_analyzed[col] = df_analyzed[col].astype(object)
                     df_analyzed[col] = df_analyzed.loc[:, col].replace(
                         [nan], [0 if not tag_col else None]).shift(1)
                 elif not df_analyzed.empty:
@@ -397,11 +436,38 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            if self.timeframe_detail and pair in self.detail_data:
+                self._get_detail_arrays(pair).set_main_candles(
+                    df_analyzed['date'].values, self.timeframe_min)
+            if self.backtest_engine == 'numpy':
+                data[pair] = PairArrays(df_analyzed, HEADERS)
+            else:
+                # Convert from Pandas to list for performance reasons
+                # (Looping Pandas is slow.)
+                data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def get_signal_signature(self, processed: Dict[str, DataFrame]) -> str:
+        """
+        Hash of everything a backtest result depends on (besides constant configuration),
+        assuming the strategy doesn't implement callbacks: the signals of all pairs as well
+        as ROI, stoploss, trailing stop, max_open_trades and protection settings.
+        :param processed: Dataframes with signals - as left by _get_ohlcv_as_lists()
+        """
+        strategy = self.strategy
+        signature = hashlib.sha1(repr((
+            strategy.minimal_roi, strategy.stoploss, strategy.trailing_stop,
+            strategy.trailing_stop_positive, strategy.trailing_stop_positive_offset,
+            strategy.trailing_only_offset_is_reached, strategy.max_open_trades,
+            strategy.protections if self.enable_protections else None,
+        )).encode())
+        for pair, df in processed.items():
+            columns = [col for col in HEADERS[5:] if col in df.columns]
+            signature.update(repr((pair, len(df), columns)).encode())
+            if columns:
+                signature.update(hash_pandas_object(df[columns], index=False).values.tobytes())
+        return signature.hexdigest()
+
     def _get_close_rate(self, row: Tuple, trade: LocalTrade, exit: ExitCheckTuple,
                         trade_dur: int) -> float:
         """
@@ -1166,28 +1232,142 @@ class Backtesting:
                 self.run_protections(pair, current_time, trade.trade_direction)
         return open_trade_count_start
 
-    def backtest(self, processed: Dict,
-                 start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    def _get_detail_arrays(self, pair: str) -> DetailArrays:
         """
-        Implement backtesting functionality
+        Columnar detail data for this pair - created on first use after loading the data.
+        """
+        detail = self._detail_arrays.get(pair)
+        if detail is None:
+            detail = self._detail_arrays[pair] = DetailArrays(self.detail_data[pair])
+        return detail
+
+    def _backtest_detail(
+            self, row: Tuple, pair: str, row_index: int, current_time: datetime,
+            end_date: datetime, open_trade_count_start: int,
+            trade_dir: Optional[LongShort]) -> int:
+        """
+        Run backtest_loop for all detail candles within the main candle.
+        :param row_index: Index of the row after this candle.
+        """
+        detail = self._get_detail_arrays(pair)
+        start, stop = detail.get_range(row_index - 1)
+        if start == stop:
+            # Fall back to "regular" data if no detail data was found for this candle
+            return self.backtest_loop(
+                row, pair, current_time, end_date,
+                open_trade_count_start, trade_dir)
+        is_first = True
+        current_time_det = current_time
+        for det_row in detail.get_rows(start, stop, row[LONG_IDX:]):
+            self.dataprovider._set_dataframe_max_date(current_time_det)
+            open_trade_count_start = self.backtest_loop(
+                det_row, pair, current_time_det, end_date,
+                open_trade_count_start, trade_dir, is_first)
+            current_time_det += timedelta(minutes=self.timeframe_detail_min)
+            is_first = False
+        return open_trade_count_start
 
-        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
-        Of course try to not have ugly code. By some accessor are sometime slower than functions.
-        Avoid extensive logging in this method and functions it calls.
+    def _process_pair_candle(
+            self, row: Tuple, pair: str, row_index: int, current_time: datetime,
+            end_date: datetime, open_trade_count_start: int) -> int:
+        """
+        Process one candle of one pair (spreading into the detail timeframe if necessary).
+        :param row_index: Index of the row after this candle (used to limit the dataprovider).
+        :return: updated open_trade_count_start
+        """
+        self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
+        self.dataprovider._set_dataframe_max_date(current_time)
+        trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
 
-        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
-        optimize memory usage!
-        :param start_date: backtesting timerange start datetime
-        :param end_date: backtesting timerange end datetime
-        :return: DataFrame with trades (results of backtesting)
+        if (
+            (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
+            and self.timeframe_detail and pair in self.detail_data
+        ):
+            # Spread out into detail timeframe.
+            # Should only happen when we are either in a trade for this pair
+            # or when we got the signal for a new trade.
+            return self._backtest_detail(
+                row, pair, row_index, current_time, end_date, open_trade_count_start, trade_dir)
+
+        self.dataprovider._set_dataframe_max_date(current_time)
+        return self.backtest_loop(
+            row, pair, current_time, end_date, open_trade_count_start, trade_dir)
+
+    def _fast_forward(self, schedule: CandleSchedule, data: Dict[str, PairArrays],
+                      indexes: Dict[str, int], step: int, last_step: int) -> int:
         """
-        self.prepare_backtest(self.enable_protections)
-        # Ensure wallets are uptodate (important for --strategy-list)
-        self.wallets.update()
-        # Use dict of lists with data for performance
-        # (looping lists is a lot faster than pandas DataFrames)
-        data: Dict = self._get_ohlcv_as_lists(processed)
+        Jump to the next step with an entry signal, or where an open trade needs to be
+        processed again (the last step is always processed).
+        :return: step to continue with
+        """
+        next_step = schedule.next_entry_step(step)
+        next_step = last_step if next_step is None else min(next_step, last_step)
+        for pair, trades in LocalTrade.bt_trades_open_pp.items():
+            if trades and data[pair].quiet_until < len(data[pair]):
+                next_step = min(next_step, int(data[pair].steps[data[pair].quiet_until]))
+        if next_step <= step:
+            return step
+        for pair in data:
+            indexes[pair] = data[pair].row_index_at_step(next_step)
+        self.progress.set_new_value(next_step)
+        return next_step
+
+    def _can_skip_open_trades(self) -> bool:
+        """
+        Exits of open trades can be found with a vectorized search if the outcome of
+        should_exit() only depends on prices and signals (no callbacks, no funding fees).
+        """
+        return (
+            self.trading_mode == TradingMode.SPOT
+            and not self.timeframe_detail
+            and not self.strategy.use_custom_stoploss
+            and not self.strategy.trailing_stop
+            and not self.strategy.position_adjustment_enable
+            and self._is_default_callback('custom_exit')
+        )
 
+    def _get_quiet_until(self, pair: str, pair_data: PairArrays, row_index: int) -> int:
+        """
+        Get the first row (at or after row_index) which must be processed for this pair,
+        as an exit of one of the open trades may happen on this candle.
+        Rows with entry signals are always processed.
+        """
+        trades = LocalTrade.bt_trades_open_pp[pair]
+        if not trades:
+            return len(pair_data)
+        if not self._skip_open_trades or any(
+                t.has_open_orders or t.stop_loss is None for t in trades):
+            return row_index
+        roi_minutes, roi_values = self._roi_table
+        return min(
+            pair_data.find_exit_candidate(
+                row_index,
+                stop_loss=trade.stop_loss,
+                open_ms=dt_ts(trade.open_date_utc),
+                roi_minutes=roi_minutes,
+                # Rates above which profit exceeds the ROI. The small offset accounts for
+                # rounding in calc_profit_ratio - an early candidate is checked regularly.
+                roi_rates=((1 + roi_values - 1e-6) * trade.open_trade_value
+                           / (trade.amount * (1 - (trade.fee_close or 0.0)))),
+                exit_signal=self.strategy.use_exit_signal,
+            ) for trade in trades)
+
+    def _update_skipped_candles(self, pair: str, pair_data: PairArrays, row_index: int) -> None:
+        """
+        Apply min / max rates of candles skipped since the last processed candle
+        to the open trades of this pair.
+        """
+        if pair_data.quiet_from < row_index:
+            high, low = pair_data.get_high_low(pair_data.quiet_from, row_index)
+            for trade in LocalTrade.bt_trades_open_pp[pair]:
+                trade.adjust_min_max_rates(high, low)
+        pair_data.quiet_from = row_index
+
+    def _backtest_lists(self, data: Dict[str, List], start_date: datetime,
+                        end_date: datetime) -> None:
+        """
+        Backtest loop of the "lists" engine, processing every candle of every pair.
+        """
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: Dict = defaultdict(int)
         current_time = start_date + timedelta(minutes=self.timeframe_min)
@@ -1208,61 +1388,124 @@ class Backtesting:
 
                 row_index += 1
                 indexes[pair] = row_index
-                self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
-                self.dataprovider._set_dataframe_max_date(current_time)
-                current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-                trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
+                open_trade_count_start = self._process_pair_candle(
+                    row, pair, row_index, current_time, end_date, open_trade_count_start)
 
-                if (
-                    (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
-                    and self.timeframe_detail and pair in self.detail_data
-                ):
-                    # Spread out into detail timeframe.
-                    # Should only happen when we are either in a trade for this pair
-                    # or when we got the signal for a new trade.
-                    exit_candle_end = current_detail_time + timedelta(minutes=self.timeframe_min)
-
-                    detail_data = self.detail_data[pair]
-                    detail_data = detail_data.loc[
-                        (detail_data['date'] >= current_detail_time) &
-                        (detail_data['date'] < exit_candle_end)
-                    ].copy()
-                    if len(detail_data) == 0:
-                        # Fall back to "regular" data if no detail data was found for this candle
-                        open_trade_count_start = self.backtest_loop(
-                            row, pair, current_time, end_date,
-                            open_trade_count_start, trade_dir)
-                        continue
-                    detail_data.loc[:, 'enter_long'] = row[LONG_IDX]
-                    detail_data.loc[:, 'exit_long'] = row[ELONG_IDX]
-                    detail_data.loc[:, 'enter_short'] = row[SHORT_IDX]
-                    detail_data.loc[:, 'exit_short'] = row[ESHORT_IDX]
-                    detail_data.loc[:, 'enter_tag'] = row[ENTER_TAG_IDX]
-                    detail_data.loc[:, 'exit_tag'] = row[EXIT_TAG_IDX]
-                    is_first = True
-                    current_time_det = current_time
-                    for det_row in detail_data[HEADERS].values.tolist():
-                        self.dataprovider._set_dataframe_max_date(current_time_det)
-                        open_trade_count_start = self.backtest_loop(
-                            det_row, pair, current_time_det, end_date,
-                            open_trade_count_start, trade_dir, is_first)
-                        current_time_det += timedelta(minutes=self.timeframe_detail_min)
-                        is_first = False
-                else:
-                    self.dataprovider._set_dataframe_max_date(current_time)
-                    open_trade_count_start = self.backtest_loop(
-                        row, pair, current_time, end_date,
-                        open_trade_count_start, trade_dir)
+            # Move time one configured time_interval ahead.
+            self.progress.increment()
+            current_time += timedelta(minutes=self.timeframe_min)
+
+    def _backtest_numpy(self, data: Dict[str, PairArrays],
+                        start_date: datetime, end_date: datetime) -> None:
+        """
+        Backtest loop of the "numpy" engine.
+        Candles are only materialized for pairs with an entry signal, or with open trades
+        which may exit on this candle.
+        """
+        # Indexes per pair, so some pairs are allowed to have a missing start.
+        indexes: Dict[str, int] = defaultdict(int)
+        current_time = start_date + timedelta(minutes=self.timeframe_min)
+        # Align all pairs to one global candle index once, avoiding per-row date checks.
+        schedule = CandleSchedule(data, start_date, self.timeframe_min)
+        for pair in schedule.pairs_by_start:
+            # Keep the order of pairs with open trades identical to the lists engine
+            # (left open trades are closed in this order).
+            LocalTrade.bt_trades_open_pp.setdefault(pair, [])
+        # Without per-candle callbacks, candles without open trade and without entry signal
+        # can be skipped entirely.
+        fast_forward = self._is_default_callback('bot_loop_start')
+        self._skip_open_trades = self._can_skip_open_trades()
+        roi = sorted(self.strategy.minimal_roi.items())
+        self._roi_table = (np.array([k for k, _ in roi], dtype=np.int64),
+                           np.array([v for _, v in roi], dtype=np.float64))
+        step = 0
+        last_step = (end_date - start_date) // timedelta(minutes=self.timeframe_min) - 1
+
+        self.progress.init_step(BacktestState.BACKTEST, int(
+            (end_date - start_date) / timedelta(minutes=self.timeframe_min)))
+        # Loop timerange and get candle for each pair at that point in time
+        while current_time <= end_date:
+            open_trade_count_start = LocalTrade.bt_open_open_trade_count
+            self.check_abort()
+            strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+                current_time=current_time)
+            skipped_index: Optional[int] = None
+            for pair in schedule.get_live_pairs(step):
+                pair_data = data[pair]
+                row_index = indexes[pair]
+                if pair_data.steps[row_index] != step:
+                    # Gap in the data of this pair.
+                    continue
+                indexes[pair] = row_index + 1
+                if not pair_data.has_entry[row_index] and row_index < pair_data.quiet_until:
+                    # Nothing can happen for this pair on this candle.
+                    skipped_index = row_index + 1
+                    continue
+                skipped_index = None
+                self._update_skipped_candles(pair, pair_data, row_index)
+                open_trade_count_start = self._process_pair_candle(
+                    pair_data[row_index], pair, row_index + 1, current_time, end_date,
+                    open_trade_count_start)
+                pair_data.quiet_from = row_index + 1
+                pair_data.quiet_until = self._get_quiet_until(pair, pair_data, row_index + 1)
+
+            if skipped_index is not None:
+                # Leave the dataprovider in the same state as if the last pair had been processed.
+                self.dataprovider._set_dataframe_max_index(self.required_startup + skipped_index)
+                self.dataprovider._set_dataframe_max_date(current_time)
 
             # Move time one configured time_interval ahead.
             self.progress.increment()
             current_time += timedelta(minutes=self.timeframe_min)
+            step += 1
+            if fast_forward:
+                next_step = self._fast_forward(schedule, data, indexes, step, last_step)
+                current_time += timedelta(minutes=self.timeframe_min * (next_step - step))
+                step = next_step
+
+        for pair, trades in LocalTrade.bt_trades_open_pp.items():
+            if trades:
+                self._update_skipped_candles(pair, data[pair], indexes[pair])
+
+    def backtest(self, processed: Dict,
+                 start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """
+        Implement backtesting functionality
+
+        NOTE: This method is used by Hyperopt at each iteration. Please keep it optimized.
+        Of course try to not have ugly code. By some accessor are sometime slower than functions.
+        Avoid extensive logging in this method and functions it calls.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        :param start_date: backtesting timerange start datetime
+        :param end_date: backtesting timerange end datetime
+        :return: DataFrame with trades (results of backtesting)
+        """
+        self.prepare_backtest(self.enable_protections)
+        # Ensure wallets are uptodate (important for --strategy-list)
+        self.wallets.update()
+        # Use dict of lists with data for performance
+        # (looping lists is a lot faster than pandas DataFrames)
+        data: Dict = self._get_ohlcv_as_lists(processed)
+        signature = None
+        if self.result_cache is not None:
+            signature = self.get_signal_signature(processed)
+            if signature in self.result_cache:
+                self.result_cache_hits += 1
+                cached = self.result_cache[signature]
+                return {**cached, 'results': cached['results'].copy()}
+
+        if self.backtest_engine == 'numpy':
+            self._backtest_numpy(data, start_date, end_date)
+        else:
+            self._backtest_lists(data, start_date, end_date)
 
         self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
         self.wallets.update()
 
         results = trade_list_to_dataframe(LocalTrade.trades)
-        return {
+        bt_results = {
             'results': results,
             'config': self.strategy.config,
             'locks': PairLocks.get_all_locks(),
@@ -1274,6 +1517,20 @@ class Backtesting:
             'replaced_entry_orders': self.replaced_entry_orders,
             'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
         }
+        if self.result_cache is not None and signature is not None:
+            self.result_cache[signature] = {**bt_results, 'results': results.copy()}
+        return bt_results
+
+    @staticmethod
+    def _log_dataframe_footprint(processed: Dict[str, DataFrame]) -> None:
+        """
+        Log the memory usage of the analyzed dataframes - and the memory usage without
+        compact_dataframes (all columns using 8 bytes per row).
+        """
+        usage = sum(df.memory_usage(index=False).sum() for df in processed.values())
+        full_usage = sum(len(df) * len(df.columns) * 8 for df in processed.values())
+        logger.info(f"Memory usage of analyzed dataframes: {usage / 1024 ** 2:.1f} MB "
+                    f"({full_usage / 1024 ** 2:.1f} MB without compact_dataframes).")
 
     def backtest_one_strategy(self, strat: IStrategy, data: Dict[str, DataFrame],
                               timerange: TimeRange):
@@ -1292,6 +1549,8 @@ class Backtesting:
 
         # need to reprocess data every time to populate signals
         preprocessed = self.strategy.advise_all_indicators(data)
+        if self.config.get('compact_dataframes', False):
+            self._log_dataframe_footprint(preprocessed)
 
         # Trim startup period from analyzed dataframe
         # This only used to determine if trimming would result in an empty dataframe
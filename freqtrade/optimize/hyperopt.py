@@ -8,18 +8,21 @@ import logging
 import random
 import sys
 import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime, timezone
-from math import ceil
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
 
 import rapidjson
+from cachetools import LRUCache
 from colorama import init as colorama_init
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
+from joblib import Parallel, cpu_count, delayed, dump, load
 from joblib.externals import cloudpickle
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame
-from rich.progress import (BarColumn, MofNCompleteColumn, Progress, TaskProgressColumn, TextColumn,
-                           TimeElapsedColumn, TimeRemainingColumn)
+from rich.progress import (BarColumn, MofNCompleteColumn, Progress, TaskID, TaskProgressColumn,
+                           TextColumn, TimeElapsedColumn, TimeRemainingColumn)
 
 from freqtrade.constants import DATETIME_PRINT_FORMAT, FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
 from freqtrade.data.converter import trim_dataframes
@@ -55,6 +58,35 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Number of backtest results kept to reuse for epochs with identical signals
+SIGNAL_CACHE_SIZE = 100
+# Strategy callbacks which could depend on buy / sell parameters (not covered by signals)
+SIGNAL_CACHE_CALLBACKS = [
+    'bot_loop_start', 'check_buy_timeout', 'check_entry_timeout', 'check_sell_timeout',
+    'check_exit_timeout', 'confirm_trade_entry', 'confirm_trade_exit', 'custom_stoploss',
+    'custom_entry_price', 'custom_exit_price', 'custom_sell', 'custom_exit',
+    'custom_stake_amount', 'adjust_trade_position', 'adjust_entry_price', 'leverage',
+]
+
+# Preprocessed data of the current hyperopt run, memory-mapped once per (worker) process.
+_processed_data: Dict[str, Any] = {'id': None, 'data': {}}
+# Hyperopt instance evaluating epochs in this (worker) process.
+_hyperopt_worker: Dict[str, Any] = {'id': None, 'hyperopt': None}
+
+
+def _evaluate_epoch(worker_file: Path, run_id: str, raw_params: List[Any]) -> Dict[str, Any]:
+    """
+    Evaluate one epoch with the hyperopt instance of this process.
+    Worker processes load the instance (including backtesting and strategy) on the first
+    epoch of a run and keep it for all further epochs - so only parameters and results
+    are serialized per epoch.
+    """
+    if _hyperopt_worker['id'] != run_id:
+        with worker_file.open('rb') as f:
+            _hyperopt_worker['hyperopt'] = cloudpickle.load(f)
+        _hyperopt_worker['id'] = run_id
+    return _hyperopt_worker['hyperopt'].generate_optimizer(raw_params)
+
 
 class Hyperopt:
     """
@@ -105,6 +137,10 @@ class Hyperopt:
                                    f'strategy_{strategy}_{time_now}.fthypt')
         self.data_pickle_file = (self.config['user_data_dir'] /
                                  'hyperopt_results' / 'hyperopt_tickerdata.pkl')
+        # Identifies this hyperopt run in (reused) worker processes.
+        self.run_id = uuid4().hex
+        self.worker_pickle_file = (self.config['user_data_dir'] / 'hyperopt_results' /
+                                   f'hyperopt_worker_{self.run_id}.pkl')
         self.total_epochs = config.get('epochs', 0)
 
         self.current_best_loss = 100
@@ -113,6 +149,10 @@ class Hyperopt:
 
         self.market_change = 0.0
         self.num_epochs_saved = 0
+        self.signal_cache_hits = 0
+        # Hashed index of the points told to the optimizer (see get_asked_points)
+        self.tried_points: Set[Tuple[Any, ...]] = set()
+        self.num_points_indexed = 0
         self.current_best_epoch: Optional[Dict[str, Any]] = None
 
         # Use max_open_trades for hyperopt as well, except --disable-max-market-positions is set
@@ -351,12 +391,12 @@ class Hyperopt:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open('rb') as f:
-            processed = load(f, mmap_mode='r')
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        processed = self._load_processed_data()
+        if self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(processed)
 
+        cache_hits = self.backtesting.result_cache_hits
         bt_results = self.backtesting.backtest(
             processed=processed,
             start_date=self.min_date,
@@ -368,9 +408,40 @@ class Hyperopt:
             'backtest_end_time': int(backtest_end_time.timestamp()),
         })
 
-        return self._get_results_dict(bt_results, self.min_date, self.max_date,
-                                      params_dict,
-                                      processed=processed)
+        results = self._get_results_dict(bt_results, self.min_date, self.max_date,
+                                         params_dict,
+                                         processed=processed)
+        if self.backtesting.result_cache is not None:
+            results['signal_cache_hit'] = self.backtesting.result_cache_hits > cache_hits
+        return results
+
+    def init_signal_cache(self) -> None:
+        """
+        Reuse backtest results for epochs which produce identical signals (and use identical
+        roi / stoploss / trailing / protection / max_open_trades settings).
+        Not possible if the strategy implements callbacks - as these could use parameters
+        of the buy / sell spaces.
+        """
+        callbacks = [callback for callback in SIGNAL_CACHE_CALLBACKS
+                     if not self.backtesting._is_default_callback(callback)]
+        if callbacks:
+            logger.info(f"Not caching results of identical signals, as the strategy "
+                        f"implements {', '.join(callbacks)}.")
+            return
+        self.backtesting.result_cache = LRUCache(maxsize=SIGNAL_CACHE_SIZE)
+
+    def _load_processed_data(self) -> Dict[str, DataFrame]:
+        """
+        Load the data stored by prepare_hyperopt_data.
+        The file is only memory-mapped on the first epoch a process evaluates. All epochs
+        share the mapped arrays - each receives shallow dataframe copies, so columns added
+        by the strategy (signals) never leak into the shared data.
+        """
+        if _processed_data['id'] != self.run_id:
+            with self.data_pickle_file.open('rb') as f:
+                _processed_data['data'] = load(f, mmap_mode='r')
+            _processed_data['id'] = self.run_id
+        return {pair: df.copy(deep=False) for pair, df in _processed_data['data'].items()}
 
     def _get_results_dict(self, backtesting_results, min_date, max_date,
                           params_dict, processed: Dict[str, DataFrame]
@@ -436,14 +507,65 @@ class Hyperopt:
     def run_optimizer_parallel(
             self, parallel: Parallel, asked: List[List]) -> List[Dict[str, Any]]:
         """ Start optimizer in a parallel way """
-        return parallel(delayed(
-                        wrap_non_picklable_objects(self.generate_optimizer))(v) for v in asked)
+        return parallel(delayed(_evaluate_epoch)(self.worker_pickle_file, self.run_id, v)
+                        for v in asked)
+
+    def run_optimizer_async(self, jobs: int, start: int, pbar: Progress, task: TaskID) -> None:
+        """
+        Keep all workers busy - a new point is asked as soon as any worker finishes.
+        Results are told to the optimizer as they arrive, but evaluated (printed and saved)
+        in epoch order.
+        :param start: Number of epochs evaluated already
+        """
+        executor = get_reusable_executor(max_workers=jobs)
+        # Epochs being evaluated - future: (epoch, point, is_random)
+        running: Dict[Future, Tuple[int, List[Any], bool]] = {}
+        # Evaluated epochs waiting for earlier epochs to finish
+        finished: Dict[int, Tuple[Dict[str, Any], bool]] = {}
+        # Use human-friendly indexes here (starting from 1)
+        next_epoch = next_to_save = start + 1
+        try:
+            while next_to_save <= self.total_epochs:
+                while len(running) < jobs and next_epoch <= self.total_epochs:
+                    asked, asked_random = self.get_asked_points(
+                        n_points=1, pending=[x for _, x, _ in running.values()])
+                    future = executor.submit(
+                        _evaluate_epoch, self.worker_pickle_file, self.run_id, asked[0])
+                    running[future] = (next_epoch, asked[0], asked_random[0])
+                    next_epoch += 1
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                results = [(running.pop(future), future.result()) for future in done]
+                self.opt.tell([x for (_, x, _), _ in results], [v['loss'] for _, v in results])
+                for (epoch, _, is_random), val in results:
+                    finished[epoch] = (val, is_random)
+
+                while next_to_save in finished:
+                    val, is_random = finished.pop(next_to_save)
+                    self.evaluate_result(val, next_to_save, is_random)
+                    pbar.update(task, advance=1)
+                    next_to_save += 1
+        finally:
+            for future in running:
+                future.cancel()
+
+    def prepare_workers(self, jobs: int) -> None:
+        """
+        Use this instance to evaluate epochs in the current process, and store it
+        for worker processes if epochs are evaluated in parallel.
+        """
+        _hyperopt_worker.update({'id': self.run_id, 'hyperopt': self})
+        if jobs > 1:
+            with self.worker_pickle_file.open('wb') as f:
+                cloudpickle.dump(self, f)
 
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
 
     def advise_and_trim(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
         preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        if self.config.get('compact_dataframes', False):
+            self.backtesting._log_dataframe_footprint(preprocessed)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -476,9 +598,11 @@ class Hyperopt:
         else:
             dump(data, self.data_pickle_file)
 
-    def get_asked_points(self, n_points: int) -> Tuple[List[List[Any]], List[bool]]:
+    def get_asked_points(self, n_points: int, pending: Optional[List[List[Any]]] = None
+                         ) -> Tuple[List[List[Any]], List[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
+        (or are being evaluated, as listed in `pending`)
 
         Steps:
         1. Try to get points using `self.opt.ask` first
@@ -488,29 +612,28 @@ class Hyperopt:
         5. Repeat until at least `n_points` points in the `asked_non_tried` list
         6. Return a list with length truncated at `n_points`
         """
-        def unique_list(a_list):
-            new_list = []
-            for item in a_list:
-                if item not in new_list:
-                    new_list.append(item)
-            return new_list
+        # Index points told to the optimizer since the last call
+        self.tried_points.update(tuple(x) for x in self.opt.Xi[self.num_points_indexed:])
+        self.num_points_indexed = len(self.opt.Xi)
+        # Pending points, as well as points selected in this call
+        skip = {tuple(x) for x in pending or []}
         i = 0
         asked_non_tried: List[List[Any]] = []
         is_random_non_tried: List[bool] = []
         while i < 5 and len(asked_non_tried) < n_points:
             if i < 3:
                 self.opt.cache_ = {}
-                asked = unique_list(self.opt.ask(n_points=n_points * 5))
-                is_random = [False for _ in range(len(asked))]
+                asked = self.opt.ask(n_points=n_points * 5)
+                is_random = False
             else:
-                asked = unique_list(self.opt.space.rvs(n_samples=n_points * 5))
-                is_random = [True for _ in range(len(asked))]
-            is_random_non_tried += [rand for x, rand in zip(asked, is_random)
-                                    if x not in self.opt.Xi
-                                    and x not in asked_non_tried]
-            asked_non_tried += [x for x in asked
-                                if x not in self.opt.Xi
-                                and x not in asked_non_tried]
+                asked = self.opt.space.rvs(n_samples=n_points * 5)
+                is_random = True
+            for x in asked:
+                key = tuple(x)
+                if key not in self.tried_points and key not in skip:
+                    skip.add(key)
+                    asked_non_tried.append(x)
+                    is_random_non_tried.append(is_random)
             i += 1
 
         if asked_non_tried:
@@ -526,6 +649,8 @@ class Hyperopt:
         Evaluate results returned from generate_optimizer
         """
         val['current_epoch'] = current
+        if val.pop('signal_cache_hit', False):
+            self.signal_cache_hits += 1
         val['is_initial_point'] = current <= INITIAL_POINTS
 
         logger.debug("Optimizer epoch evaluated: %s", val)
@@ -575,59 +700,62 @@ class Hyperopt:
             colorama_init(autoreset=True)
 
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f'Effective number of parallel workers used: {jobs}')
-
-                # Define progressbar
-                with Progress(
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(bar_width=None),
-                    MofNCompleteColumn(),
-                    TaskProgressColumn(),
-                    "•",
-                    TimeElapsedColumn(),
-                    "•",
-                    TimeRemainingColumn(),
-                    expand=True,
-                ) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
-
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(n_points=1)
-                        f_val0 = self.generate_optimizer(asked[0])
-                        self.opt.tell(asked, [f_val0['loss']])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(task, advance=1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
+            parallel = Parallel(n_jobs=config_jobs)
+            jobs = parallel._effective_n_jobs()
+            logger.info(f'Effective number of parallel workers used: {jobs}')
+            self.init_signal_cache()
+
+            # Define progressbar
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(bar_width=None),
+                MofNCompleteColumn(),
+                TaskProgressColumn(),
+                "•",
+                TimeElapsedColumn(),
+                "•",
+                TimeRemainingColumn(),
+                expand=True,
+            ) as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs)
+
+                start = 0
+
+                if self.analyze_per_epoch:
+                    # First analysis not in parallel mode when using --analyze-per-epoch.
+                    # This allows dataprovider to load it's informative cache.
+                    asked, is_random = self.get_asked_points(n_points=1)
+                    f_val0 = self.generate_optimizer(asked[0])
+                    self.opt.tell(asked, [f_val0['loss']])
+                    self.evaluate_result(f_val0, 1, is_random[0])
+                    pbar.update(task, advance=1)
+                    start += 1
+
+                # After the first epoch, so workers start with the informative cache.
+                self.prepare_workers(jobs)
+                if jobs > 1:
+                    self.run_optimizer_async(jobs, start, pbar, task)
+                else:
+                    with parallel:
+                        for current in range(start + 1, self.total_epochs + 1):
+                            asked, is_random = self.get_asked_points(n_points=1)
+                            f_val = self.run_optimizer_parallel(parallel, asked)
+                            self.opt.tell(asked, [v['loss'] for v in f_val])
+
+                            self.evaluate_result(f_val[0], current, is_random[0])
                             pbar.update(task, advance=1)
 
         except KeyboardInterrupt:
             print('User interrupted..')
+        finally:
+            self.worker_pickle_file.unlink(missing_ok=True)
 
         logger.info(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
                     f"saved to '{self.results_file}'.")
+        if self.backtesting.result_cache is not None:
+            logger.info(f"{self.signal_cache_hits} of {self.num_epochs_saved} "
+                        f"{plural(self.num_epochs_saved, 'epoch')} reused the backtest result "
+                        f"of an earlier epoch with identical signals.")
 
         if self.current_best_epoch:
             HyperoptTools.try_export_params(
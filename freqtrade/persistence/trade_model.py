@@ -180,6 +180,14 @@ class Order(ModelBase):
                 )
         self.order_update_date = datetime.now(timezone.utc)
 
+    def differs_from_ccxt_object(self, order: Dict[str, Any]) -> bool:
+        """
+        Status or fill of the ccxt order differ from this order - so updating from it is necessary
+        """
+        return any(order.get(key, current) != current for key, current in (
+            ('status', self.status), ('amount', self.amount), ('filled', self.filled),
+            ('remaining', self.remaining), ('average', self.average)))
+
     def to_ccxt_object(self, stopPriceName: str = 'stopPrice') -> Dict[str, Any]:
         order: Dict[str, Any] = {
             'id': self.order_id,
@@ -1,8 +1,9 @@
 import logging
 from copy import deepcopy
+from importlib.util import find_spec
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
 from fastapi.exceptions import HTTPException
 
 from freqtrade import __version__
@@ -53,7 +54,11 @@ logger = logging.getLogger(__name__)
 # 2.32: new /backtest/history/ patch endpoint
 # 2.33: Additional weekly/monthly metrics
 # 2.34: new entries/exits/mix_tags endpoints
-API_VERSION = 2.34
+# 2.35: pair_candles and pair_history support Arrow IPC responses
+API_VERSION = 2.35
+
+# Media type of (binary) Arrow IPC stream responses
+ARROW_MEDIA_TYPE = 'application/vnd.apache.arrow.stream'
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -281,15 +286,31 @@ def reload_config(rpc: RPC = Depends(get_rpc)):
     return rpc._rpc_reload_config()
 
 
-@router.get('/pair_candles', response_model=PairHistory, tags=['candle data'])
+def _accepts_arrow(accept: Optional[str]) -> bool:
+    """
+    Arrow IPC stream is requested via Accept header (and pyarrow is available).
+    """
+    if not accept or find_spec('pyarrow') is None:
+        return False
+    return any(media_type.split(';')[0].strip() == ARROW_MEDIA_TYPE
+               for media_type in accept.split(','))
+
+
+@router.get('/pair_candles', response_model=PairHistory, tags=['candle data'],
+            responses={200: {'content': {ARROW_MEDIA_TYPE: {}}}})
 def pair_candles(
-        pair: str, timeframe: str, limit: Optional[int] = None, rpc: RPC = Depends(get_rpc)):
+        pair: str, timeframe: str, limit: Optional[int] = None, rpc: RPC = Depends(get_rpc),
+        accept: Optional[str] = Header(None)):
+    if _accepts_arrow(accept):
+        return Response(rpc._rpc_analysed_dataframe_arrow(pair, timeframe, limit),
+                        media_type=ARROW_MEDIA_TYPE, headers={'Vary': 'Accept'})
     return rpc._rpc_analysed_dataframe(pair, timeframe, limit)
 
 
-@router.get('/pair_history', response_model=PairHistory, tags=['candle data'])
+@router.get('/pair_history', response_model=PairHistory, tags=['candle data'],
+            responses={200: {'content': {ARROW_MEDIA_TYPE: {}}}})
 def pair_history(pair: str, timeframe: str, timerange: str, strategy: str,
-                 freqaimodel: Optional[str] = None,
+                 freqaimodel: Optional[str] = None, accept: Optional[str] = Header(None),
                  config=Depends(get_config), exchange=Depends(get_exchange)):
     # The initial call to this endpoint can be slow, as it may need to initialize
     # the exchange class.
@@ -300,6 +321,9 @@ def pair_history(pair: str, timeframe: str, timerange: str, strategy: str,
         'freqaimodel': freqaimodel if freqaimodel else config.get('freqaimodel'),
     })
     try:
+        if _accepts_arrow(accept):
+            return Response(RPC._rpc_analysed_history_arrow(config, pair, timeframe, exchange),
+                            media_type=ARROW_MEDIA_TYPE, headers={'Vary': 'Accept'})
         return RPC._rpc_analysed_history_full(config, pair, timeframe, exchange)
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
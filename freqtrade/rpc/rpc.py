@@ -7,6 +7,7 @@ from datetime import date, datetime, timedelta, timezone
 from math import isnan
 from typing import Any, Dict, Generator, List, Optional, Sequence, Tuple, Union
 
+import orjson
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
@@ -1142,17 +1143,18 @@ class RPC:
         return self._freqtrade.edge.accepted_pairs()
 
     @staticmethod
-    def _convert_dataframe_to_dict(strategy: str, pair: str, timeframe: str, dataframe: DataFrame,
-                                   last_analyzed: datetime) -> Dict[str, Any]:
-        has_content = len(dataframe) != 0
+    def _add_signal_columns(dataframe: DataFrame) -> Dict[str, int]:
+        """
+        Add the date timestamp and signal close columns (used for plotting) to the dataframe.
+        :return: Number of signals per signal type
+        """
         signals = {
             'enter_long': 0,
             'exit_long': 0,
             'enter_short': 0,
             'exit_short': 0,
         }
-        if has_content:
-
+        if len(dataframe) != 0:
             dataframe.loc[:, '__date_ts'] = dataframe.loc[:, 'date'].view(int64) // 1000 // 1000
             # Move signal close to separate column when signal for easy plotting
             for sig_type in signals.keys():
@@ -1160,24 +1162,21 @@ class RPC:
                     mask = (dataframe[sig_type] == 1)
                     signals[sig_type] = int(mask.sum())
                     dataframe.loc[mask, f'_{sig_type}_signal_close'] = dataframe.loc[mask, 'close']
+        return signals
 
-            # band-aid until this is fixed:
-            # https://github.com/pandas-dev/pandas/issues/45836
-            datetime_types = ['datetime', 'datetime64', 'datetime64[ns, UTC]']
-            date_columns = dataframe.select_dtypes(include=datetime_types)
-            for date_column in date_columns:
-                # replace NaT with `None`
-                dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
-
-            dataframe = dataframe.replace({inf: None, -inf: None, NAN: None})
-
+    @staticmethod
+    def _analysed_dataframe_info(strategy: str, pair: str, timeframe: str, dataframe: DataFrame,
+                                 signals: Dict[str, int], last_analyzed: datetime
+                                 ) -> Dict[str, Any]:
+        """
+        Everything but the candle data of the pair_candles / pair_history response.
+        """
         res = {
             'pair': pair,
             'timeframe': timeframe,
             'timeframe_ms': timeframe_to_msecs(timeframe),
             'strategy': strategy,
             'columns': list(dataframe.columns),
-            'data': dataframe.values.tolist(),
             'length': len(dataframe),
             'buy_signals': signals['enter_long'],  # Deprecated
             'sell_signals': signals['exit_long'],  # Deprecated
@@ -1192,7 +1191,7 @@ class RPC:
             'data_stop': '',
             'data_stop_ts': 0,
         }
-        if has_content:
+        if len(dataframe) != 0:
             res.update({
                 'data_start': str(dataframe.iloc[0]['date']),
                 'data_start_ts': int(dataframe.iloc[0]['__date_ts']),
@@ -1201,6 +1200,53 @@ class RPC:
             })
         return res
 
+    @staticmethod
+    def _convert_dataframe_to_dict(strategy: str, pair: str, timeframe: str, dataframe: DataFrame,
+                                   last_analyzed: datetime) -> Dict[str, Any]:
+        signals = RPC._add_signal_columns(dataframe)
+        if len(dataframe) != 0:
+            # band-aid until this is fixed:
+            # https://github.com/pandas-dev/pandas/issues/45836
+            datetime_types = ['datetime', 'datetime64', 'datetime64[ns, UTC]']
+            date_columns = dataframe.select_dtypes(include=datetime_types)
+            for date_column in date_columns:
+                # replace NaT with `None`
+                dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
+
+            dataframe = dataframe.replace({inf: None, -inf: None, NAN: None})
+
+        res = RPC._analysed_dataframe_info(strategy, pair, timeframe, dataframe, signals,
+                                           last_analyzed)
+        res['data'] = dataframe.values.tolist()
+        return res
+
+    @staticmethod
+    def _convert_dataframe_to_arrow(strategy: str, pair: str, timeframe: str,
+                                    dataframe: DataFrame, last_analyzed: datetime) -> bytes:
+        """
+        Arrow IPC stream of the dataframe - the binary alternative to _convert_dataframe_to_dict.
+        The remaining fields of the json response are stored (as json) in the "freqtrade"
+        key of the schema metadata.
+        """
+        import pyarrow as pa
+
+        signals = RPC._add_signal_columns(dataframe)
+        info = RPC._analysed_dataframe_info(strategy, pair, timeframe, dataframe, signals,
+                                            last_analyzed)
+        try:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Object columns with mixed types (e.g. tags) - send them as strings.
+            for col in dataframe.select_dtypes(include='object'):
+                dataframe[col] = dataframe[col].map(lambda x: x if x is None else str(x))
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {'freqtrade': orjson.dumps(info, option=orjson.OPT_UTC_Z)})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
     def _rpc_analysed_dataframe(self, pair: str, timeframe: str,
                                 limit: Optional[int]) -> Dict[str, Any]:
         """ Analyzed dataframe in Dict form """
@@ -1209,6 +1255,14 @@ class RPC:
         return RPC._convert_dataframe_to_dict(self._freqtrade.config['strategy'],
                                               pair, timeframe, _data, last_analyzed)
 
+    def _rpc_analysed_dataframe_arrow(self, pair: str, timeframe: str,
+                                      limit: Optional[int]) -> bytes:
+        """ Analyzed dataframe as Arrow IPC stream """
+
+        _data, last_analyzed = self.__rpc_analysed_dataframe_raw(pair, timeframe, limit)
+        return RPC._convert_dataframe_to_arrow(self._freqtrade.config['strategy'],
+                                               pair, timeframe, _data, last_analyzed)
+
     def __rpc_analysed_dataframe_raw(
         self,
         pair: str,
@@ -1275,6 +1329,26 @@ class RPC:
     @staticmethod
     def _rpc_analysed_history_full(config: Config, pair: str, timeframe: str,
                                    exchange) -> Dict[str, Any]:
+        strategy_name, df_analyzed = RPC._rpc_analysed_history_raw(
+            config, pair, timeframe, exchange)
+        return RPC._convert_dataframe_to_dict(strategy_name, pair, timeframe,
+                                              df_analyzed, dt_now())
+
+    @staticmethod
+    def _rpc_analysed_history_arrow(config: Config, pair: str, timeframe: str,
+                                    exchange) -> bytes:
+        strategy_name, df_analyzed = RPC._rpc_analysed_history_raw(
+            config, pair, timeframe, exchange)
+        return RPC._convert_dataframe_to_arrow(strategy_name, pair, timeframe,
+                                               df_analyzed, dt_now())
+
+    @staticmethod
+    def _rpc_analysed_history_raw(config: Config, pair: str, timeframe: str,
+                                  exchange) -> Tuple[str, DataFrame]:
+        """
+        Load and analyze the history of the pair.
+        :return: Tuple of (strategy name, analyzed dataframe)
+        """
         timerange_parsed = TimeRange.parse_timerange(config.get('timerange'))
 
         from freqtrade.data.converter import trim_dataframe
@@ -1303,8 +1377,7 @@ class RPC:
         df_analyzed = strategy.analyze_ticker(_data[pair], {'pair': pair})
         df_analyzed = trim_dataframe(df_analyzed, timerange_parsed, startup_candles=startup_candles)
 
-        return RPC._convert_dataframe_to_dict(strategy.get_strategy_name(), pair, timeframe,
-                                              df_analyzed.copy(), dt_now())
+        return strategy.get_strategy_name(), df_analyzed.copy()
 
     def _rpc_plot_config(self) -> Dict[str, Any]:
         if (self._freqtrade.strategy.plot_config and
@@ -3,13 +3,19 @@ IStrategy interface
 This module defines the interface to apply for strategies
 """
 import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple, Union
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, concat
+from pandas.api.types import is_numeric_dtype
 
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
+from freqtrade.data.converter import reduce_dataframe_footprint, reduce_tags_footprint
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import (CandleType, ExitCheckTuple, ExitType, MarketDirection, RunMode,
                              SignalDirection, SignalTagType, SignalType, TradingMode)
@@ -21,6 +27,7 @@ from freqtrade.strategy.hyper import HyperStrategyMixin
 from freqtrade.strategy.informative_decorator import (InformativeData, PopulateIndicators,
                                                       _create_and_merge_informative_pair,
                                                       _format_pair_name)
+from freqtrade.strategy.parallel_analysis import ParallelAnalysis
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now
 from freqtrade.wallets import Wallets
@@ -87,6 +94,14 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
 
+    # Analyze only the new candles (see populate_incremental) - requires process_only_new_candles
+    incremental_analysis: bool = False
+    # Candles before the new candles passed to populate_incremental as warm-up period.
+    # Defaults to startup_candle_count.
+    incremental_overlap: Optional[int] = None
+    # Dry-run only - compare every n-th incremental analysis of a pair with a full analysis
+    incremental_check_interval: int = 0
+
     use_exit_signal: bool
     exit_profit_only: bool
     exit_profit_offset: float
@@ -128,6 +143,11 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: Dict[str, datetime] = {}
+        # Duration (seconds) of the last analysis per pair
+        self._analysis_latency: Dict[str, float] = {}
+        # Number of analyses per pair with a previous analysis (see incremental_check_interval)
+        self._incremental_count: Dict[str, int] = {}
+        self._parallel_analysis: Optional[ParallelAnalysis] = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -190,11 +210,19 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         self.ft_load_hyper_params(self.config.get('runmode') == RunMode.HYPEROPT)
 
+        workers = self.config.get('analysis_workers', 0)
+        if workers > 1 and self.config.get('runmode') in (RunMode.DRY_RUN, RunMode.LIVE):
+            self._parallel_analysis = ParallelAnalysis(
+                self, workers, self.config.get('analysis_executor', 'thread'))
+
     def ft_bot_cleanup(self) -> None:
         """
         Clean up FreqAI and child threads
         """
         self.freqai.shutdown()
+        if self._parallel_analysis:
+            self._parallel_analysis.shutdown()
+            self._parallel_analysis = None
 
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -864,19 +892,17 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         pair = str(metadata.get('pair'))
 
-        new_candle = self._last_candle_seen_per_pair.get(pair, None) != dataframe.iloc[-1]['date']
+        new_candle = self._is_new_candle(pair, dataframe)
         # Test if seen this pair and last candle before.
         # always run if process_only_new_candles is set to false
         if not self.process_only_new_candles or new_candle:
 
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            start = time.perf_counter()
+            dataframe = self._ft_analyze_ticker(dataframe, metadata, *self._previous_analysis(pair))
+            self._analysis_latency[pair] = time.perf_counter() - start
 
-            self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
-
-            candle_type = self.config.get('candle_type_def', CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            self._store_analyzed_df(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -886,25 +912,157 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
-    def analyze_pair(self, pair: str) -> None:
+    def populate_incremental(self, previous: DataFrame, dataframe: DataFrame,
+                             metadata: dict) -> DataFrame:
         """
-        Fetch data for this pair from dataprovider and analyze.
-        Stores the dataframe into the dataprovider.
-        The analyzed dataframe is then accessible via `dp.get_analyzed_dataframe()`.
-        :param pair: Pair to analyze.
+        Analyze only the newest candles of a pair - used instead of a full analysis of all candles
+        in dry / live mode if `incremental_analysis` is enabled.
+        By default, indicators and signals are populated (like for a full analysis) for the new
+        candles and the `incremental_overlap` candles before them.
+        Override this to reuse values of the previous analysis (e.g. for recursive indicators).
+        :param previous: Previous analysis of the pair (must not be modified)
+        :param dataframe: New candles, preceded by `incremental_overlap` candles of warm-up period
+        :param metadata: Additional information, like the currently traded pair
+        :return: Dataframe with indicators and signals. Only the new candles (the last rows)
+            are used - the previous analysis is kept for all other candles.
+        """
+        return self.analyze_ticker(dataframe, metadata)
+
+    def _previous_analysis(self, pair: str) -> Tuple[Optional[DataFrame], bool]:
+        """
+        Previous analysis of the pair for incremental analysis.
+        :return: Tuple of (previous analyzed dataframe - or None, if the incremental analysis
+            should be verified against a full analysis)
+        """
+        if not (self.incremental_analysis and self.process_only_new_candles):
+            return None, False
+        previous, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if previous.empty:
+            return None, False
+        count = self._incremental_count[pair] = self._incremental_count.get(pair, 0) + 1
+        verify = (self.incremental_check_interval > 0
+                  and self.config.get('runmode') == RunMode.DRY_RUN
+                  and count % self.incremental_check_interval == 0)
+        return previous, verify
+
+    def _ft_analyze_ticker(self, dataframe: DataFrame, metadata: dict,
+                           previous: Optional[DataFrame] = None,
+                           verify: bool = False) -> DataFrame:
+        """
+        Analyze the dataframe - only the new candles if a previous analysis is available
+        (see populate_incremental).
+        :param previous: Previous analysis of the pair - None for a full analysis
+        :param verify: Compare the incremental analysis with a full analysis
+        """
+        new_rows = self._incremental_new_rows(dataframe, previous)
+        if previous is None or not new_rows:
+            return self.analyze_ticker(dataframe, metadata)
+
+        overlap = (self.startup_candle_count if self.incremental_overlap is None
+                   else self.incremental_overlap)
+        window = dataframe.iloc[-(new_rows + overlap):].reset_index(drop=True)
+        analyzed = self.populate_incremental(previous, window, metadata).iloc[-new_rows:]
+        if set(analyzed.columns) != set(previous.columns):
+            logger.debug(f"Columns of incremental analysis of {metadata['pair']} differ from "
+                         "the previous analysis - running full analysis.")
+            return self.analyze_ticker(dataframe, metadata)
+        result = concat([previous.iloc[-(len(dataframe) - new_rows):],
+                         analyzed[previous.columns]], ignore_index=True)
+
+        if verify:
+            full = self.analyze_ticker(dataframe.copy(), metadata)
+            mismatch = self._find_mismatching_columns(result.iloc[-new_rows:],
+                                                      full.iloc[-new_rows:])
+            if mismatch:
+                logger.warning(
+                    f"Incremental analysis of {metadata['pair']} differs from the full analysis "
+                    f"in columns {', '.join(mismatch)} - using the full analysis. "
+                    "Consider increasing `incremental_overlap`.")
+                return full
+        return result
+
+    @staticmethod
+    def _incremental_new_rows(dataframe: DataFrame, previous: Optional[DataFrame]) -> int:
+        """
+        Number of new candles in dataframe, if all other candles are contained in previous.
+        0 if incremental analysis is not possible.
+        """
+        if previous is None or previous.empty:
+            return 0
+        last_date = previous['date'].iloc[-1]
+        known_rows = int(dataframe['date'].searchsorted(last_date, side='right'))
+        if (not 0 < known_rows < len(dataframe) or known_rows > len(previous)
+                or dataframe['date'].iloc[known_rows - 1] != last_date
+                or previous['date'].iloc[-known_rows] != dataframe['date'].iloc[0]
+                or previous['close'].iloc[-1] != dataframe['close'].iloc[known_rows - 1]):
+            return 0
+        return len(dataframe) - known_rows
+
+    @staticmethod
+    def _find_mismatching_columns(dataframe: DataFrame, expected: DataFrame) -> List[str]:
+        """
+        Columns whose values differ between both dataframes (with the same rows).
+        """
+        mismatch = []
+        for col in expected.columns:
+            if col not in dataframe.columns:
+                mismatch.append(col)
+                continue
+            values = dataframe[col].reset_index(drop=True)
+            expected_values = expected[col].reset_index(drop=True)
+            if is_numeric_dtype(values) and is_numeric_dtype(expected_values):
+                equal = np.allclose(values.astype(float), expected_values.astype(float),
+                                    rtol=1e-6, equal_nan=True)
+            else:
+                equal = values.equals(expected_values)
+            if not equal:
+                mismatch.append(col)
+        return mismatch
+
+    def _is_new_candle(self, pair: str, dataframe: DataFrame) -> bool:
+        return self._last_candle_seen_per_pair.get(pair, None) != dataframe.iloc[-1]['date']
+
+    def _store_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider, and emit it to consumers.
         """
+        self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
+
+        candle_type = self.config.get('candle_type_def', CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
+    def _get_pair_ohlcv(self, pair: str) -> Optional[DataFrame]:
         dataframe = self.dp.ohlcv(
             pair, self.timeframe, candle_type=self.config.get('candle_type_def', CandleType.SPOT)
         )
         if not isinstance(dataframe, DataFrame) or dataframe.empty:
             logger.warning('Empty candle (OHLCV) data for pair %s', pair)
-            return
+            return None
+        return dataframe
 
+    def analyze_pair(self, pair: str) -> None:
+        """
+        Fetch data for this pair from dataprovider and analyze.
+        Stores the dataframe into the dataprovider.
+        The analyzed dataframe is then accessible via `dp.get_analyzed_dataframe()`.
+        :param pair: Pair to analyze.
+        """
+        dataframe = self._get_pair_ohlcv(pair)
+        if dataframe is not None:
+            self._analyze_pair_df(pair, dataframe, self._analyze_ticker_internal)
+
+    def _analyze_pair_df(self, pair: str, dataframe: DataFrame,
+                         analyze: Callable[[DataFrame, dict], DataFrame]) -> None:
+        """
+        Analyze the dataframe using analyze (see _analyze_ticker_internal),
+        verifying the analyzed dataframe.
+        """
         try:
             df_len, df_close, df_date = self.preserve_df(dataframe)
 
             dataframe = strategy_safe_wrapper(
-                self._analyze_ticker_internal, message=""
+                analyze, message=""
             )(dataframe, {'pair': pair})
 
             self.assert_df(dataframe, df_len, df_close, df_date)
@@ -919,10 +1077,66 @@ class IStrategy(ABC, HyperStrategyMixin):
     def analyze(self, pairs: List[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `analysis_workers` configured, pairs are analyzed concurrently - analyzed
+        dataframes are still stored (and emitted) in the order of pairs, but only once all
+        pairs were analyzed.
         :param pairs: List of pairs to analyze
         """
+        self._analysis_latency = {}
+        start = time.perf_counter()
+        if self._parallel_analysis and len(pairs) > 1:
+            self._analyze_parallel(self._parallel_analysis, pairs)
+        else:
+            for pair in pairs:
+                self.analyze_pair(pair)
+
+        if self._analysis_latency:
+            duration = time.perf_counter() - start
+            slowest = sorted(self._analysis_latency.items(), key=lambda x: x[1], reverse=True)
+            if self._parallel_analysis:
+                pair, latency = slowest[0]
+                logger.info(
+                    f"Analyzed {len(self._analysis_latency)} pairs in {duration:.2f}s using "
+                    f"{self._parallel_analysis.workers} {self._parallel_analysis.executor_type} "
+                    f"workers, slowest: {pair} ({latency:.2f}s)")
+            else:
+                logger.debug(
+                    f"Analyzed {len(self._analysis_latency)} pairs in {duration:.2f}s, slowest: "
+                    + ', '.join(f"{pair} ({latency:.2f}s)" for pair, latency in slowest[:3]))
+
+    def _analyze_parallel(self, parallel: ParallelAnalysis, pairs: List[str]) -> None:
+        """
+        Analyze all pairs which need analysis concurrently - then store the results
+        (like _analyze_ticker_internal) in the order of pairs.
+        """
+        jobs: List[Tuple[str, DataFrame, Optional['Future[Tuple[DataFrame, float]]']]] = []
         for pair in pairs:
-            self.analyze_pair(pair)
+            dataframe = self._get_pair_ohlcv(pair)
+            if dataframe is None:
+                continue
+            future = None
+            if not self.process_only_new_candles or self._is_new_candle(pair, dataframe):
+                future = parallel.submit(dataframe.copy(), {'pair': pair},
+                                         *self._previous_analysis(pair))
+            jobs.append((pair, dataframe, future))
+
+        for pair, dataframe, future in jobs:
+            if future is None:
+                self._analyze_pair_df(pair, dataframe, self._analyze_ticker_internal)
+                continue
+
+            self._analyze_pair_df(pair, dataframe, partial(self._collect_analyzed_df, future))
+
+    def _collect_analyzed_df(self, future: 'Future[Tuple[DataFrame, float]]',
+                             dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Wait for the concurrent analysis of the pair, and store the result.
+        """
+        pair = metadata['pair']
+        new_candle = self._is_new_candle(pair, dataframe)
+        analyzed, self._analysis_latency[pair] = future.result()
+        self._store_analyzed_df(pair, analyzed, new_candle)
+        return analyzed
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> Tuple[int, float, datetime]:
@@ -1375,7 +1589,10 @@ class IStrategy(ABC, HyperStrategyMixin):
             dataframe = _create_and_merge_informative_pair(
                 self, dataframe, metadata, inf_data, populate_fn)
 
-        return self.populate_indicators(dataframe, metadata)
+        dataframe = self.populate_indicators(dataframe, metadata)
+        if self.config.get('compact_dataframes', False):
+            dataframe = reduce_dataframe_footprint(dataframe)
+        return dataframe
 
     def advise_entry(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
@@ -1408,4 +1625,6 @@ class IStrategy(ABC, HyperStrategyMixin):
         df = self.populate_exit_trend(dataframe, metadata)
         if 'exit_long' not in df.columns:
             df = df.rename({'sell': 'exit_long'}, axis='columns')
+        if self.config.get('compact_dataframes', False):
+            df = reduce_tags_footprint(df)
         return df
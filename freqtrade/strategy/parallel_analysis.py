@@ -0,0 +1,122 @@
+"""
+Concurrent analysis of multiple pairs for IStrategy.analyze().
+"""
+import copy
+import logging
+import sys
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from pandas import DataFrame
+
+from freqtrade.exceptions import OperationalException
+
+
+if TYPE_CHECKING:
+    from freqtrade.strategy.interface import IStrategy
+
+logger = logging.getLogger(__name__)
+
+# Strategy of the current worker process (process executor only)
+_worker_strategy: Optional['IStrategy'] = None
+
+
+def _run_analysis(strategy: 'IStrategy', dataframe: DataFrame, metadata: dict,
+                  previous: Optional[DataFrame], verify: bool) -> Tuple[DataFrame, float]:
+    """
+    Analyze one pair (see IStrategy._ft_analyze_ticker).
+    :return: Tuple of (analyzed dataframe, analysis duration in seconds)
+    """
+    start = time.perf_counter()
+    dataframe = strategy._ft_analyze_ticker(dataframe, metadata, previous, verify)
+    return dataframe, time.perf_counter() - start
+
+
+def _init_worker(pickled_strategy: bytes) -> None:
+    from joblib.externals import cloudpickle
+
+    global _worker_strategy
+    _worker_strategy = cloudpickle.loads(pickled_strategy)
+
+
+def _run_worker_analysis(dataframe: DataFrame, metadata: dict, previous: Optional[DataFrame],
+                         verify: bool) -> Tuple[DataFrame, float]:
+    assert _worker_strategy is not None
+    return _run_analysis(_worker_strategy, dataframe, metadata, previous, verify)
+
+
+def _pickle_strategy(strategy: 'IStrategy') -> bytes:
+    """
+    Pickle a copy of the strategy without dataprovider and wallets (which hold the exchange).
+    Strategy modules are pickled by value, as worker processes can't import them.
+    """
+    from joblib.externals import cloudpickle
+
+    worker_strategy = copy.copy(strategy)
+    worker_strategy.__dict__.pop('dp', None)
+    worker_strategy.wallets = None
+    worker_strategy._parallel_analysis = None
+    for cls in type(strategy).__mro__:
+        if cls.__name__ == 'IStrategy':
+            break
+        cloudpickle.register_pickle_by_value(sys.modules[cls.__module__])
+    try:
+        return cloudpickle.dumps(worker_strategy)
+    except Exception as e:
+        raise OperationalException(
+            f'Strategy can not be used with the "process" analysis executor: {e}') from e
+
+
+class ParallelAnalysis:
+    """
+    Runs IStrategy.analyze_ticker() for multiple pairs concurrently.
+    The "thread" executor shares the strategy (and dataprovider) with the bot - it's faster for
+    strategies whose indicators release the GIL (TA-Lib, numpy, pandas).
+    The "process" executor analyzes a copy of the strategy in worker processes, for strategies
+    with pure python indicators. These strategies can't use the dataprovider (or informative
+    pairs) in populate_* methods, and changes to the strategy state are not returned.
+    """
+
+    def __init__(self, strategy: 'IStrategy', workers: int, executor: str = 'thread') -> None:
+        self._strategy = strategy
+        self.workers = workers
+        self.executor_type = executor
+        self._executor: Executor
+        if strategy.config.get('freqai', {}).get('enabled', False):
+            raise OperationalException('Concurrent analysis does not support FreqAI strategies.')
+        if executor == 'process':
+            self._validate_process_strategy(strategy)
+            from joblib.externals.loky import get_reusable_executor
+
+            self._executor = get_reusable_executor(
+                max_workers=workers, initializer=_init_worker,
+                initargs=(_pickle_strategy(strategy), ))
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers,
+                                                thread_name_prefix='ft_analysis')
+        logger.info(f"Analyzing pairs in {workers} {executor} workers.")
+
+    @staticmethod
+    def _validate_process_strategy(strategy: 'IStrategy') -> None:
+        if strategy._ft_informative or strategy.informative_pairs():
+            raise OperationalException(
+                'The "process" analysis executor does not support informative pairs, as the '
+                'dataprovider is not available in worker processes.')
+
+    def submit(self, dataframe: DataFrame, metadata: dict, previous: Optional[DataFrame] = None,
+               verify: bool = False) -> 'Future[Tuple[DataFrame, float]]':
+        """
+        Start the analysis of one pair.
+        The future's result is a tuple of (analyzed dataframe, analysis duration in seconds).
+        :param previous: Previous analysis, for incremental analysis
+        :param verify: Verify incremental analysis against a full analysis
+        """
+        if self.executor_type == 'process':
+            return self._executor.submit(
+                _run_worker_analysis, dataframe, metadata, previous, verify)
+        return self._executor.submit(
+            _run_analysis, self._strategy, dataframe, metadata, previous, verify)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
@@ -112,10 +112,12 @@ class Worker:
             # Ping systemd watchdog before throttling
             self._notify("WATCHDOG=1\nSTATUS=State: RUNNING.")
 
-            # Use an offset of 1s to ensure a new candle has been issued
+            # Use an offset of 1s to ensure a new candle has been issued.
+            # The websocket candle feed waits for new candles itself - and REST candle
+            # requests are delayed by the exchange in this case.
             self._throttle(func=self._process_running, throttle_secs=self._throttle_secs,
                            timeframe=self._config['timeframe'] if self._config else None,
-                           timeframe_offset=1)
+                           timeframe_offset=0 if self.freqtrade.exchange.ws_ohlcv_enabled else 1)
 
         if self._heartbeat_interval:
             now = time.time()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for OHLCV dataframe cleaning (duplicate removal and gap filling).
+
+Compares the groupby / resample based cleaning with clean_ohlcv_dataframe (per pair)
+and clean_ohlcv_dataframes (all pairs in one call) - for gap free data, for data with overlapping
+candles (like the cached and new candles merged in live mode) and for data with gaps.
+
+Usage:
+    python scripts/benchmark_ohlcv_cleaning.py --pairs 100 --candles 1000
+"""
+import argparse
+import timeit
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.data.converter import clean_ohlcv_dataframe, clean_ohlcv_dataframes
+
+
+def make_data(pairs: int, candles: int, case: str) -> Dict:
+    rng = np.random.default_rng(42)
+    data = {}
+    for idx in range(pairs):
+        close = 100 + rng.standard_normal(candles).cumsum()
+        df = pd.DataFrame({
+            'date': pd.date_range('2023-01-01', periods=candles, freq='5min', tz='UTC'),
+            'open': close + rng.standard_normal(candles),
+            'high': close + 2,
+            'low': close - 2,
+            'close': close,
+            'volume': rng.random(candles) * 1000,
+        })
+        if case == 'overlap':
+            df = pd.concat([df, df.tail(3)])
+        elif case == 'gaps':
+            df = df.drop(index=rng.choice(candles, 5, replace=False))
+        data[(f'PAIR{idx}/USDT', '5m', '')] = df
+    return data
+
+
+def groupby_resample(data: Dict) -> None:
+    for df in data.values():
+        df = df.groupby(by='date', as_index=False, sort=True).agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'max'})
+        df = df.resample('5min', on='date').agg({
+            'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'})
+        df['close'] = df['close'].ffill()
+        df.loc[:, ['open', 'high', 'low']] = df[['open', 'high', 'low']].fillna(
+            value={'open': df['close'], 'high': df['close'], 'low': df['close']})
+
+
+def per_pair(data: Dict) -> None:
+    for (pair, timeframe, _), df in data.items():
+        clean_ohlcv_dataframe(df, timeframe, pair, fill_missing=True, drop_incomplete=False)
+
+
+def batched(data: Dict) -> None:
+    clean_ohlcv_dataframes(data, fill_missing=True, drop_incomplete=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pairs', type=int, default=100)
+    parser.add_argument('--candles', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    functions: Dict[str, Callable[[Dict], None]] = {
+        'groupby/resample': groupby_resample,
+        'clean_ohlcv_dataframe': per_pair,
+        'clean_ohlcv_dataframes': batched,
+    }
+    print(f"{args.pairs} pairs, {args.candles} candles - best of {args.repeat} (ms)")
+    print(f"{'case':<10}" + ''.join(f"{name:>25}" for name in functions))
+    for case in ('clean', 'overlap', 'gaps'):
+        data = make_data(args.pairs, args.candles, case)
+        timings = [min(timeit.repeat(lambda: func(data), number=1, repeat=args.repeat)) * 1000
+                   for func in functions.values()]
+        print(f"{case:<10}" + ''.join(f"{timing:>25.1f}" for timing in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ import re
 from datetime import datetime, timedelta
 from io import BytesIO
 from pathlib import Path
+from shutil import copyfile
 from unittest.mock import MagicMock, PropertyMock
 from zipfile import ZipFile
 
@@ -12,9 +13,9 @@ from freqtrade.commands import (start_backtesting_show, start_convert_data, star
                                 start_create_userdir, start_download_data, start_hyperopt_list,
                                 start_hyperopt_show, start_install_ui, start_list_data,
                                 start_list_exchanges, start_list_markets, start_list_strategies,
-                                start_list_timeframes, start_new_strategy, start_show_trades,
-                                start_strategy_update, start_test_pairlist, start_trading,
-                                start_webserver)
+                                start_list_timeframes, start_new_strategy, start_rebuild_data_index,
+                                start_show_trades, start_strategy_update, start_test_pairlist,
+                                start_trading, start_webserver)
 from freqtrade.commands.db_commands import start_convert_db
 from freqtrade.commands.deploy_commands import (clean_ui_subdir, download_and_install_ui,
                                                 get_ui_download_url, read_ui_version)
@@ -1453,6 +1454,35 @@ def test_start_list_data(testdatadir, capsys):
             in captured.out)
 
 
+def test_start_rebuild_data_index(testdatadir, tmp_path, capsys, caplog):
+    for file in testdatadir.glob('XRP_ETH-*.feather'):
+        copyfile(file, tmp_path / file.name)
+    args = [
+        "rebuild-data-index",
+        "--datadir",
+        str(tmp_path),
+    ]
+    pargs = get_args(args)
+    pargs['config'] = None
+    start_rebuild_data_index(pargs)
+    assert log_has(f"Indexed 2 feather files in {tmp_path}.", caplog)
+    assert (tmp_path / '.ohlcv_index.sqlite').is_file()
+
+    # list-data lists from the index - files removed without freqtrade until it's rebuilt
+    (tmp_path / 'XRP_ETH-1m.feather').unlink()
+    list_pargs = get_args(["list-data", "--datadir", str(tmp_path)])
+    list_pargs['config'] = None
+    start_list_data(list_pargs)
+    captured = capsys.readouterr()
+    assert "\n| XRP/ETH |      1m, 5m |   spot |\n" in captured.out
+
+    start_rebuild_data_index(pargs)
+    assert log_has(f"Indexed 1 feather files in {tmp_path}.", caplog)
+    start_list_data(list_pargs)
+    captured = capsys.readouterr()
+    assert "\n| XRP/ETH |          5m |   spot |\n" in captured.out
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_show_trades(mocker, fee, capsys, caplog):
     mocker.patch("freqtrade.persistence.init_db")
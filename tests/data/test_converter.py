@@ -8,14 +8,17 @@ import pytest
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
-from freqtrade.data.converter import (convert_ohlcv_format, convert_trades_format,
-                                      convert_trades_to_ohlcv, ohlcv_fill_up_missing_data,
-                                      ohlcv_to_dataframe, reduce_dataframe_footprint,
-                                      trades_df_remove_duplicates, trades_dict_to_list,
-                                      trades_to_ohlcv, trim_dataframe)
+from freqtrade.data.converter import (clean_ohlcv_dataframe, clean_ohlcv_dataframes,
+                                      convert_ohlcv_format, convert_trades_format,
+                                      convert_trades_to_ohlcv, converter,
+                                      ohlcv_fill_up_missing_data, ohlcv_to_dataframe,
+                                      reduce_dataframe_footprint, reduce_ohlcv_footprint,
+                                      reduce_tags_footprint, trades_df_remove_duplicates,
+                                      trades_dict_to_list, trades_to_ohlcv, trades_to_ohlcv_chunked,
+                                      trim_dataframe)
 from freqtrade.data.history import (get_timerange, load_data, load_pair_history,
                                     validate_backtest_data)
-from freqtrade.data.history.idatahandler import IDataHandler
+from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler, get_datahandlerclass
 from freqtrade.enums import CandleType
 from tests.conftest import generate_test_data, log_has, log_has_re
 from tests.data.test_history import _clean_test_file
@@ -53,6 +56,21 @@ def test_trades_to_ohlcv(trades_history_df, caplog):
     assert df.iloc[0, :]['low'] == 0.019626
 
 
+def test_trades_to_ohlcv_chunked(testdatadir):
+    trades = get_datahandler(testdatadir, 'feather').trades_load('XRP/ETH')
+    with pytest.raises(ValueError, match="Trade-list empty."):
+        list(trades_to_ohlcv_chunked([trades.iloc[:0]], ['1m']))
+
+    # Chunk boundaries within candles
+    chunks = [trades.iloc[i:i + 1000] for i in range(0, len(trades), 1000)]
+    result = list(trades_to_ohlcv_chunked(chunks, ['1m', '5m', '1h']))
+    # One result per chunk, and the remaining candles
+    assert len(result) == len(chunks) + 1
+    for timeframe in ('1m', '5m', '1h'):
+        ohlcv = pd.concat([candles[timeframe] for candles in result if timeframe in candles])
+        assert_frame_equal(ohlcv, trades_to_ohlcv(trades, timeframe))
+
+
 def test_ohlcv_fill_up_missing_data(testdatadir, caplog):
     data = load_pair_history(datadir=testdatadir,
                              timeframe='1m',
@@ -249,6 +267,87 @@ def test_ohlcv_drop_incomplete(caplog):
     assert log_has("Dropping last candle", caplog)
 
 
+def _clean_ohlcv_reference(data, timeframe):
+    # groupby / resample based cleaning, without fast paths
+    data = data.groupby(by='date', as_index=False, sort=True).agg({
+        'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'max'})
+    data = data.resample(timeframe.replace('m', 'min'), on='date').agg({
+        'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last', 'volume': 'sum'})
+    data['close'] = data['close'].ffill()
+    data.loc[:, ['open', 'high', 'low']] = data[['open', 'high', 'low']].fillna(
+        value={'open': data['close'], 'high': data['close'], 'low': data['close']})
+    return data.reset_index()
+
+
+@pytest.mark.parametrize('case,resampled', [
+    ('clean', False),
+    ('overlap', False),
+    ('duplicates', False),
+    ('unsorted', False),
+    ('gaps', True),
+    ('misaligned', True),
+    ('nan', True),
+])
+def test_clean_ohlcv_dataframe_fast_path(mocker, case, resampled):
+    data = generate_test_data('5m', 200)
+    if case == 'overlap':
+        # Cached candles with (partially updated) new candles appended - like in live mode
+        new = data.tail(20).copy()
+        new['close'] += 1
+        data = pd.concat([data, new])
+    elif case == 'duplicates':
+        data = pd.concat([data, data.iloc[[50, 51]]])
+    elif case == 'unsorted':
+        data = data.sample(frac=1, random_state=42)
+    elif case == 'gaps':
+        data = data.drop(index=[10, 11, 150])
+    elif case == 'misaligned':
+        data['date'] += pd.Timedelta(minutes=2)
+    elif case == 'nan':
+        data.loc[20, 'volume'] = np.nan
+
+    resample_mock = mocker.spy(pd.DataFrame, 'resample')
+    res = clean_ohlcv_dataframe(data.copy(), '5m', 'UNITTEST/USDT',
+                                fill_missing=True, drop_incomplete=False)
+    assert resample_mock.call_count == int(resampled)
+    assert_frame_equal(res, _clean_ohlcv_reference(data, '5m'))
+
+    res = clean_ohlcv_dataframes({('UNITTEST/USDT', '5m', ''): data.copy()},
+                                 fill_missing=True, drop_incomplete=False)
+    assert_frame_equal(res[('UNITTEST/USDT', '5m', '')], _clean_ohlcv_reference(data, '5m'))
+
+
+def test_clean_ohlcv_dataframes(mocker):
+    data = {
+        ('XRP/USDT', '5m', ''): generate_test_data('5m', 100),
+        ('XRP/USDT', '1h', ''): generate_test_data('1h', 100),
+        ('ETH/USDT', '5m', ''): generate_test_data('5m', 100).drop(index=[20]),
+        ('BTC/USDT', '5m', ''): generate_test_data('5m', 0),
+        ('NEO/USDT', '5m', ''): generate_test_data('5m', 100, '2020-07-05 00:03:00'),
+        ('LTC/USDT', '1M', ''): generate_test_data('1d', 100, '2020-07-01'),
+    }
+    data[('ETH/USDT', '5m', '')]['volume'] = 10.0
+    clean_mock = mocker.spy(converter, 'clean_ohlcv_dataframe')
+    fill_mock = mocker.spy(converter, 'ohlcv_fill_up_missing_data')
+    res = clean_ohlcv_dataframes(data, fill_missing=True, drop_incomplete=True)
+
+    assert list(res) == list(data)
+    # Only the empty dataframe takes the slow path
+    assert clean_mock.call_count == 1
+    # Gaps, misaligned candles, monthly candles (and the empty dataframe) are filled up
+    assert fill_mock.call_count == 4
+    for (pair, timeframe, _), df in res.items():
+        assert_frame_equal(df, clean_ohlcv_dataframe(data[(pair, timeframe, '')], timeframe, pair,
+                                                     fill_missing=True, drop_incomplete=True))
+    assert len(res[('XRP/USDT', '5m', '')]) == 99
+    assert len(res[('ETH/USDT', '5m', '')]) == 99
+    assert res[('ETH/USDT', '5m', '')].loc[20, 'volume'] == 0
+    assert len(res[('LTC/USDT', '1M', '')]) == 4
+    assert res[('BTC/USDT', '5m', '')].empty
+
+    assert clean_ohlcv_dataframes({}, fill_missing=True, drop_incomplete=True) == {}
+
+
 def test_trim_dataframe(testdatadir) -> None:
     data = load_data(
         datadir=testdatadir,
@@ -322,6 +421,60 @@ def test_trades_dict_to_list(fetch_trades_result):
         assert t[6] == fetch_trades_result[i]['cost']
 
 
+@pytest.mark.parametrize('data_format_ohlcv', ['feather', 'json'])
+def test_convert_trades_to_ohlcv_chunked(testdatadir, tmp_path, mocker, data_format_ohlcv):
+    pair = 'XRP/ETH'
+    copyfile(testdatadir / 'XRP_ETH-trades.feather', tmp_path / 'XRP_ETH-trades.feather')
+    # Existing data is replaced
+    copyfile(testdatadir / 'XRP_ETH-5m.feather', tmp_path / f'XRP_ETH-5m.{data_format_ohlcv}')
+    mocker.patch('freqtrade.data.history.idatahandler.TRADES_CHUNKSIZE', 1000)
+    append_mock = mocker.spy(get_datahandlerclass(data_format_ohlcv), 'ohlcv_append')
+    trades = get_datahandler(testdatadir, 'feather').trades_load(pair)
+    dh = get_datahandler(tmp_path, data_format_ohlcv)
+    dh.rebuild_ohlcv_index()
+
+    convert_trades_to_ohlcv([pair], timeframes=['1m', '5m'], datadir=tmp_path,
+                            timerange=TimeRange(), data_format_ohlcv=data_format_ohlcv)
+
+    if data_format_ohlcv == 'feather':
+        # Candles are appended once per chunk and timeframe
+        assert append_mock.call_count == 2 * (len(trades) // 1000 + 2)
+    else:
+        assert append_mock.call_count == 0
+    for timeframe in ('1m', '5m'):
+        df = load_pair_history(datadir=tmp_path, timeframe=timeframe, pair=pair,
+                               data_format=data_format_ohlcv, fill_up_missing=False)
+        assert_frame_equal(df, trades_to_ohlcv(trades, timeframe).reset_index(drop=True),
+                           check_freq=False)
+        assert dh.ohlcv_index_entry(pair, timeframe, CandleType.SPOT).rows == len(df)
+
+
+@pytest.mark.parametrize('data_format_ohlcv', ['feather', 'json'])
+def test_convert_trades_to_ohlcv_failure_keeps_data(testdatadir, tmp_path, mocker, caplog,
+                                                    data_format_ohlcv):
+    pair = 'XRP/ETH'
+    file5 = tmp_path / f'XRP_ETH-5m.{data_format_ohlcv}'
+    copyfile(testdatadir / 'XRP_ETH-5m.feather', file5)
+    stored = file5.read_bytes()
+    trades = get_datahandler(testdatadir, 'feather').trades_load(pair)
+
+    def trades_load_chunks(*args, **kwargs):
+        yield trades.iloc[:1000]
+        raise ValueError('Broken trades file.')
+
+    mocker.patch.object(get_datahandlerclass('feather'), 'trades_load_chunks', trades_load_chunks)
+    purge_mock = mocker.spy(get_datahandlerclass(data_format_ohlcv), 'ohlcv_purge')
+
+    convert_trades_to_ohlcv([pair], timeframes=['1m', '5m'], datadir=tmp_path,
+                            timerange=TimeRange(), data_format_ohlcv=data_format_ohlcv)
+
+    assert log_has('Could not convert XRP/ETH to OHLCV.', caplog)
+    # Stored data is untouched, and the temporary data is removed.
+    assert purge_mock.call_count == 0
+    assert file5.read_bytes() == stored
+    assert sorted(p.name for p in tmp_path.iterdir()) == [file5.name]
+
+
 def test_convert_trades_format(default_conf, testdatadir, tmp_path):
     files = [{'old': tmp_path / "XRP_ETH-trades.json.gz",
               'new': tmp_path / "XRP_ETH-trades.json"},
@@ -442,6 +595,45 @@ def test_reduce_dataframe_footprint():
     assert df2['close_copy'].dtype == np.float32
 
 
+def test_reduce_ohlcv_footprint(testdatadir, caplog):
+    caplog.set_level(logging.DEBUG)
+    data = generate_test_data('15m', 40)
+    data.loc[:, ['open', 'high', 'low', 'close']] = (
+        (data[['open', 'high', 'low', 'close']] * 100).round(2).values)
+
+    df2 = reduce_ohlcv_footprint(data)
+    # Does not modify original dataframe
+    assert data['open'].dtype == np.float64
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        assert df2[col].dtype == np.float32
+    # Price steps of 0.01 are preserved
+    assert (df2['close'].astype(np.float64).round(2) == data['close']).all()
+
+    # 8 decimals at ~0.1 don't fit into float32
+    data = load_pair_history(datadir=testdatadir, timeframe='5m', pair='UNITTEST/BTC')
+    df2 = reduce_ohlcv_footprint(data)
+    assert df2['close'].dtype == np.float64
+    assert df2['volume'].dtype == np.float32
+    assert log_has("Keeping float64 prices, as float32 can't represent all price steps.", caplog)
+
+    df2 = reduce_ohlcv_footprint(data.iloc[0:0])
+    assert df2.empty
+
+
+def test_reduce_tags_footprint():
+    data = generate_test_data('15m', 40)
+    data['enter_tag'] = None
+    data.loc[data.index[::2], 'enter_tag'] = 'tag_a'
+    data['exit_tag'] = 1
+
+    df2 = reduce_tags_footprint(data)
+    assert df2['enter_tag'].dtype == 'category'
+    assert df2['enter_tag'].isna().sum() == 20
+    assert set(df2['enter_tag'].dropna()) == {'tag_a'}
+    # Non-object columns are not touched
+    assert df2['exit_tag'].dtype == np.int64
+
+
 def test_convert_trades_to_ohlcv(testdatadir, tmp_path, caplog):
     pair = 'XRP/ETH'
     file1 = tmp_path / 'XRP_ETH-1m.feather'
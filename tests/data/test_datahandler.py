@@ -1,16 +1,22 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import os
 import re
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import MagicMock
+from shutil import copyfile
+from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pandas as pd
 import pytest
 from pandas import DataFrame, Timestamp
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import AVAILABLE_DATAHANDLERS
+from freqtrade.data.history import idatahandler
+from freqtrade.data.history.datadir_index import DatadirIndex, file_checksum
 from freqtrade.data.history.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.hdf5datahandler import HDF5DataHandler
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler, get_datahandlerclass
@@ -263,7 +269,7 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize('datahandler', ['json', 'jsongz', 'hdf5'])
 def test_datahandler_ohlcv_append(datahandler, testdatadir, ):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
@@ -428,6 +434,256 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert ohlcv.empty
 
 
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_arrow_datahandler_ohlcv_load_timerange(datahandler, testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, 'feather')._ohlcv_load(
+        'UNITTEST/BTC', '5m', None, candle_type=CandleType.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store('UNITTEST/BTC', '5m', ohlcv, candle_type=CandleType.SPOT)
+
+    timerange = TimeRange.parse_timerange('20180115-20180119')
+    ohlcv1 = dh._ohlcv_load('UNITTEST/BTC', '5m', timerange, candle_type=CandleType.SPOT)
+    # Only the timerange is loaded - plus one candle after the end
+    end = timerange.stopdt + timedelta(minutes=5)
+    expected = ohlcv[(ohlcv['date'] >= timerange.startdt) & (ohlcv['date'] <= end)]
+    assert ohlcv1['date'].iloc[0] == timerange.startdt
+    assert ohlcv1['date'].iloc[-1] == end
+    assert ohlcv1.equals(expected.reset_index(drop=True))
+
+    # Last candle is not dropped as incomplete, as the data was trimmed
+    ohlcv2 = dh.ohlcv_load('UNITTEST/BTC', '5m', timerange=timerange,
+                           candle_type=CandleType.SPOT, drop_incomplete=True)
+    assert ohlcv2['date'].iloc[-1] == timerange.stopdt
+
+    # Open start
+    timerange = TimeRange.parse_timerange('-20180115')
+    ohlcv1 = dh._ohlcv_load('UNITTEST/BTC', '5m', timerange, candle_type=CandleType.SPOT)
+    assert ohlcv1['date'].iloc[0] == ohlcv['date'].iloc[0]
+    assert ohlcv1['date'].iloc[-1] == timerange.stopdt + timedelta(minutes=5)
+
+
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_arrow_datahandler_ohlcv_append(datahandler, testdatadir, tmp_path, mocker):
+    ohlcv = get_datahandler(testdatadir, 'feather')._ohlcv_load(
+        'UNITTEST/BTC', '5m', None, candle_type=CandleType.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    filename = dh._pair_data_filename(tmp_path, 'UNITTEST/BTC', '5m', CandleType.SPOT)
+    segment_dir = tmp_path / f'UNITTEST_BTC-5m.{datahandler}.parts'
+
+    # Appending without existing data stores the data
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[:1000], candle_type=CandleType.SPOT)
+    assert filename.is_file()
+    assert not segment_dir.exists()
+
+    # Overlapping candles are ignored
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[990:1500], candle_type=CandleType.SPOT)
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[1500:2000], candle_type=CandleType.SPOT)
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[1900:2000], candle_type=CandleType.SPOT)
+    assert [f.name for f in segment_dir.iterdir()] == [
+        f'00001.{datahandler}', f'00002.{datahandler}']
+    # Appended data is not visible as separate pair
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT) == [
+        ('UNITTEST/BTC', '5m', CandleType.SPOT)]
+    assert dh.ohlcv_get_pairs(tmp_path, '5m', CandleType.SPOT) == ['UNITTEST/BTC']
+
+    ohlcv1 = dh._ohlcv_load('UNITTEST/BTC', '5m', None, candle_type=CandleType.SPOT)
+    assert_frame_equal(ohlcv1, ohlcv.iloc[:2000])
+    timerange = TimeRange.parse_timerange('20180113-20180115')
+    ohlcv1 = dh._ohlcv_load('UNITTEST/BTC', '5m', timerange, candle_type=CandleType.SPOT)
+    assert ohlcv1['date'].iloc[0] == timerange.startdt
+    assert ohlcv1['date'].iloc[-1] == timerange.stopdt + timedelta(minutes=5)
+    assert ohlcv1['date'].is_monotonic_increasing
+
+    # Segments are compacted into the main file
+    mocker.patch.object(IDataHandler, 'MAX_OHLCV_SEGMENTS', 2)
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[2000:], candle_type=CandleType.SPOT)
+    assert not segment_dir.exists()
+    assert_frame_equal(dh._ohlcv_load('UNITTEST/BTC', '5m', None, candle_type=CandleType.SPOT),
+                       ohlcv)
+
+    # Purge removes segments
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[:1000], candle_type=CandleType.SPOT)
+    dh.ohlcv_store('UNITTEST/BTC', '5m', ohlcv.iloc[:1000], candle_type=CandleType.SPOT)
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[1000:], candle_type=CandleType.SPOT)
+    assert segment_dir.is_dir()
+    assert dh.ohlcv_purge('UNITTEST/BTC', '5m', CandleType.SPOT)
+    assert not segment_dir.exists()
+    assert not filename.exists()
+
+
+@pytest.mark.parametrize('datahandler', ['json', 'jsongz', 'hdf5', 'feather', 'parquet'])
+def test_datahandler_ohlcv_index(datahandler, testdatadir, tmp_path, mocker):
+    ohlcv = get_datahandler(testdatadir, 'feather')._ohlcv_load(
+        'UNITTEST/BTC', '5m', None, candle_type=CandleType.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    index = DatadirIndex(tmp_path)
+    assert not index.exists()
+    assert dh.ohlcv_index_entry('UNITTEST/BTC', '5m', CandleType.SPOT) is None
+
+    # The index is opt-in - storing data doesn't create it
+    dh.ohlcv_store('UNITTEST/BTC', '5m', ohlcv.iloc[:10], candle_type=CandleType.SPOT)
+    assert not index.exists()
+    assert dh.rebuild_ohlcv_index() == 1
+    assert index.exists()
+
+    dh.ohlcv_store('UNITTEST/BTC', '5m', ohlcv.iloc[:1000], candle_type=CandleType.SPOT)
+    dh.ohlcv_store('XRP/USDT:USDT', '1h', ohlcv, candle_type=CandleType.FUTURES)
+
+    filename = dh._pair_data_filename(tmp_path, 'UNITTEST/BTC', '5m', CandleType.SPOT)
+    entry = dh.ohlcv_index_entry('UNITTEST/BTC', '5m', CandleType.SPOT)
+    assert entry.filename == filename.name
+    assert entry.rows == 1000
+    assert entry.start_ts == ohlcv['date'].iloc[0].timestamp() * 1000
+    assert entry.end_ts == ohlcv['date'].iloc[999].timestamp() * 1000
+    assert entry.checksum == file_checksum([filename])
+    assert dh.ohlcv_index_entry('XRP/USDT:USDT', '1h', CandleType.FUTURES).filename.startswith(
+        'futures/')
+
+    # Date range without loading the data
+    mocker.patch.object(dh, '_ohlcv_load', side_effect=AssertionError)
+    assert dh.ohlcv_data_min_max('UNITTEST/BTC', '5m', CandleType.SPOT) == (
+        ohlcv['date'].iloc[0], ohlcv['date'].iloc[999])
+    mocker.stopall()
+
+    # Entries of files changed without freqtrade are ignored
+    os.utime(filename, ns=(entry.stamp + 10**9, entry.stamp + 10**9))
+    assert dh.ohlcv_index_entry('UNITTEST/BTC', '5m', CandleType.SPOT) is None
+    assert dh.ohlcv_data_min_max('UNITTEST/BTC', '5m', CandleType.SPOT) == (
+        ohlcv['date'].iloc[0], ohlcv['date'].iloc[999])
+
+    assert dh.ohlcv_purge('UNITTEST/BTC', '5m', CandleType.SPOT)
+    assert index.get(filename) is None
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT) == []
+
+
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet'])
+def test_arrow_datahandler_ohlcv_index_append(datahandler, testdatadir, tmp_path, mocker):
+    ohlcv = get_datahandler(testdatadir, 'feather')._ohlcv_load(
+        'UNITTEST/BTC', '5m', None, candle_type=CandleType.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    filename = dh._pair_data_filename(tmp_path, 'UNITTEST/BTC', '5m', CandleType.SPOT)
+
+    dh.rebuild_ohlcv_index()
+    dh.ohlcv_store('UNITTEST/BTC', '5m', ohlcv.iloc[:1000], candle_type=CandleType.SPOT)
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[990:1500], candle_type=CandleType.SPOT)
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[1500:2000], candle_type=CandleType.SPOT)
+    entry = dh.ohlcv_index_entry('UNITTEST/BTC', '5m', CandleType.SPOT)
+    assert entry.rows == 2000
+    assert entry.end_ts == ohlcv['date'].iloc[1999].timestamp() * 1000
+    # Checksum continued with the appended segments
+    assert entry.checksum == file_checksum([filename, *dh._ohlcv_segment_files(filename)])
+    # Data is only loaded to reindex files without (valid) index entry
+    load_mock = mocker.spy(dh, '_ohlcv_load')
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[2000:2100], candle_type=CandleType.SPOT)
+    assert load_mock.call_count == 0
+    os.utime(filename, ns=(entry.stamp + 10**9, entry.stamp + 10**9))
+    dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv.iloc[2100:2200], candle_type=CandleType.SPOT)
+    assert load_mock.call_count == 1
+    entry = dh.ohlcv_index_entry('UNITTEST/BTC', '5m', CandleType.SPOT)
+    assert entry.rows == 2200
+
+    # Rebuilding results in the same entry
+    assert dh.rebuild_ohlcv_index() == 1
+    assert dh.ohlcv_index_entry('UNITTEST/BTC', '5m', CandleType.SPOT) == entry
+
+
+def test_datahandler_rebuild_ohlcv_index(testdatadir, tmp_path):
+    (tmp_path / 'futures').mkdir()
+    for file in [*testdatadir.glob('*.feather'), *testdatadir.glob('futures/*.feather')]:
+        if 'trades' not in file.name:
+            copyfile(file, tmp_path / file.relative_to(testdatadir))
+    dh = get_datahandler(tmp_path, 'feather')
+    spot_data = dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT)
+    futures_data = dh.ohlcv_get_available_data(tmp_path, TradingMode.FUTURES)
+    min_max = dh.ohlcv_data_min_max('XRP/ETH', '5m', CandleType.SPOT)
+
+    assert dh.rebuild_ohlcv_index() == len(spot_data) + len(futures_data)
+    assert dh.ohlcv_index_entry('XRP/ETH', '5m', CandleType.SPOT)
+    assert dh.ohlcv_data_min_max('XRP/ETH', '5m', CandleType.SPOT) == min_max
+
+    # Available data is listed from the index - without scanning the datadir
+    with patch.object(Path, 'glob', side_effect=AssertionError):
+        assert sorted(dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT)) == sorted(
+            spot_data)
+        assert sorted(dh.ohlcv_get_available_data(tmp_path, TradingMode.FUTURES)) == sorted(
+            futures_data)
+        assert 'XRP/ETH' in dh.ohlcv_get_pairs(tmp_path, '5m', CandleType.SPOT)
+        assert dh.ohlcv_get_pairs(tmp_path, '8h', CandleType.MARK) == ['XRP/USDT:USDT']
+
+    # Files added or removed without freqtrade are listed once the index is rebuilt
+    copyfile(tmp_path / 'XRP_ETH-5m.feather', tmp_path / 'XRP_ETH-1h.feather')
+    (tmp_path / 'UNITTEST_BTC-5m.feather').unlink()
+    spot_pairs = dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT)
+    assert ('XRP/ETH', '1h', CandleType.SPOT) not in spot_pairs
+    assert ('UNITTEST/BTC', '5m', CandleType.SPOT) in spot_pairs
+    dh.rebuild_ohlcv_index()
+    spot_pairs = dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT)
+    assert ('XRP/ETH', '1h', CandleType.SPOT) in spot_pairs
+    assert ('UNITTEST/BTC', '5m', CandleType.SPOT) not in spot_pairs
+
+    # Data formats which are not indexed are listed from the datadir
+    copyfile(testdatadir / 'UNITTEST_BTC-1m.json', tmp_path / 'UNITTEST_BTC-1m.json')
+    assert get_datahandler(tmp_path, 'json').ohlcv_get_available_data(
+        tmp_path, TradingMode.SPOT) == [('UNITTEST/BTC', '1m', CandleType.SPOT)]
+
+
+@pytest.mark.parametrize('datahandler', ['feather', 'parquet', 'jsongz'])
+def test_datahandler_ohlcv_mmap_cache(datahandler, testdatadir, tmp_path, mocker):
+    ohlcv = get_datahandler(testdatadir, 'feather')._ohlcv_load(
+        'UNITTEST/BTC', '5m', None, candle_type=CandleType.SPOT)
+    # Gaps - one of them at the start of the timerange
+    start = ohlcv.loc[1002, 'date']
+    ohlcv = ohlcv.drop(index=[*range(1000, 1010), 1500, 1501, 2300, 2301]).reset_index(drop=True)
+    get_datahandler(tmp_path, datahandler).ohlcv_store(
+        'UNITTEST/BTC', '5m', ohlcv.iloc[:-500], candle_type=CandleType.SPOT)
+    dh = get_datahandler(tmp_path, datahandler, mmap_cache=True)
+    dh_nocache = get_datahandler(tmp_path, datahandler)
+    load_mock = mocker.spy(dh, '_ohlcv_load')
+    cache_dir = tmp_path / '.ohlcv_cache'
+
+    for timerange in [TimeRange.parse_timerange('20180115-20180119'),
+                      TimeRange('date', 'date', int(start.timestamp()),
+                                int(ohlcv.iloc[-520]['date'].timestamp())),
+                      TimeRange('date', None, int(start.timestamp()), 0), None]:
+        for kwargs in [{}, {'drop_incomplete': True}, {'fill_missing': False},
+                       {'startup_candles': 20}]:
+            args = ('UNITTEST/BTC', '5m', CandleType.SPOT)
+            df = dh.ohlcv_load(*args, timerange=timerange, **kwargs)
+            assert_frame_equal(df, dh_nocache.ohlcv_load(*args, timerange=timerange, **kwargs))
+    # Data file is decoded once per cleaning variant
+    assert load_mock.call_count == 2
+    assert len(list(cache_dir.glob('UNITTEST_BTC-5m.*.npy'))) == 6
+
+    # Loaded data is a view on the memory mapped files - without copying
+    mmap_mock = mocker.spy(idatahandler, 'load_ohlcv_mmap')
+    timerange = TimeRange.parse_timerange('20180115-20180119')
+    df = dh.ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT, timerange=timerange)
+    cache = mmap_mock.spy_return
+    assert isinstance(cache.values, np.memmap)
+    for col in ['open', 'high', 'low', 'close', 'volume']:
+        assert np.shares_memory(df[col].values, cache.values)
+        assert not df[col].values.flags.writeable
+    assert np.shares_memory(df['date'].array._ndarray, cache.dates)
+
+    # Changed data rebuilds the cache
+    load_mock.reset_mock()
+    if datahandler != 'jsongz':
+        dh.ohlcv_append('UNITTEST/BTC', '5m', ohlcv, candle_type=CandleType.SPOT)
+    else:
+        dh.ohlcv_store('UNITTEST/BTC', '5m', ohlcv, candle_type=CandleType.SPOT)
+    assert_frame_equal(dh.ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT),
+                       dh_nocache.ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT))
+    assert load_mock.call_count == 1
+    # Outdated cache files are removed
+    assert len(list(cache_dir.glob('UNITTEST_BTC-5m.*.npy'))) == 3
+
+    assert dh.ohlcv_purge('UNITTEST/BTC', '5m', CandleType.SPOT)
+    assert not list(cache_dir.glob('UNITTEST_BTC-5m.*.npy'))
+    # Cache directory is not detected as data
+    assert dh.ohlcv_get_available_data(tmp_path, TradingMode.SPOT) == []
+    assert dh.ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT).empty
+
+
 def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     mocker.patch.object(Path, "exists", MagicMock(return_value=False))
     unlinkmock = mocker.patch.object(Path, "unlink", MagicMock())
@@ -456,6 +712,21 @@ def test_datahandler_trades_load(testdatadir, datahandler):
     assert trades1.empty
 
 
+@pytest.mark.parametrize('datahandler,chunks', [
+    ('jsongz', 1), ('hdf5', 1), ('feather', 3), ('parquet', 1)])
+def test_datahandler_trades_load_chunks(testdatadir, datahandler, chunks):
+    dh = get_datahandler(testdatadir, datahandler)
+    trades = dh.trades_load('XRP/ETH')
+    trade_chunks = list(dh.trades_load_chunks('XRP/ETH', chunksize=5000))
+    assert len(trade_chunks) == chunks
+    assert all(len(chunk) <= 5000 for chunk in trade_chunks) or chunks == 1
+    assert_frame_equal(pd.concat(trade_chunks, ignore_index=True), trades)
+
+    trade_chunks = list(dh.trades_load_chunks('UNITTEST/NONEXIST'))
+    assert len(trade_chunks) == 1
+    assert trade_chunks[0].empty
+
+
 @pytest.mark.parametrize('datahandler', ['jsongz', 'hdf5', 'feather', 'parquet'])
 def test_datahandler_trades_store(testdatadir, tmp_path, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pandas import DataFrame, Timestamp
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.data.history import get_datahandler
 from freqtrade.enums import CandleType, RunMode
 from freqtrade.exceptions import ExchangeError, OperationalException
 from freqtrade.plugins.pairlistmanager import PairListManager
@@ -87,6 +89,30 @@ def test_historic_ohlcv_dataformat(mocker, default_conf, ohlcv_history):
     featherloadmock.assert_not_called()
 
 
+def test_historic_pairs(default_conf, testdatadir, tmp_path):
+    default_conf["datadir"] = testdatadir
+    dp = DataProvider(default_conf, None)
+    assert set(dp.historic_pairs()) == {
+        'UNITTEST/BTC', 'XLM/BTC', 'ETH/BTC', 'TRX/BTC', 'LTC/BTC', 'XMR/BTC', 'ZEC/BTC',
+        'ADA/BTC', 'ETC/BTC', 'NXT/BTC', 'DASH/BTC', 'XRP/ETH'}
+    assert set(dp.historic_pairs('1m')) == {'UNITTEST/BTC', 'XRP/ETH'}
+
+    default_conf["datadir"] = tmp_path
+    dp = DataProvider(default_conf, None)
+    assert dp.historic_pairs() == []
+    data_handler = get_datahandler(tmp_path, default_conf['dataformat_ohlcv'])
+    data_handler.ohlcv_store('XRP/USDT:USDT', '1h', generate_test_data('1h', 10),
+                             CandleType.MARK)
+    assert dp.historic_pairs('1h', 'mark') == ['XRP/USDT:USDT']
+    assert dp.historic_pairs('1h') == []
+
+    # Listed from the datadir index
+    data_handler.rebuild_ohlcv_index()
+    with patch.object(Path, 'glob', side_effect=AssertionError):
+        assert dp.historic_pairs('1h', 'mark') == ['XRP/USDT:USDT']
+        assert dp.historic_pairs('1h') == []
+
+
 @pytest.mark.parametrize('candle_type', [
     'mark',
     'futures',
@@ -1,11 +1,13 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import logging
 import uuid
-from datetime import timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
 from shutil import copyfile
+from typing import Dict
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
@@ -15,6 +17,7 @@ from pandas.testing import assert_frame_equal
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
 from freqtrade.data.converter import ohlcv_to_dataframe
+from freqtrade.data.history import history_utils
 from freqtrade.data.history.history_utils import (_download_pair_history, _download_trades_history,
                                                   _load_cached_data_for_updating, get_timerange,
                                                   load_data, load_pair_history,
@@ -264,6 +267,31 @@ def test_load_cached_data_for_updating(mocker, testdatadir) -> None:
     assert end_ts is None
 
 
+def test_load_cached_data_for_updating_index(mocker, testdatadir, tmp_path) -> None:
+    ohlcv = get_datahandler(testdatadir, 'feather').ohlcv_load(
+        'UNITTEST/BTC', '5m', CandleType.SPOT, fill_missing=False)
+    data_handler = get_datahandler(tmp_path, 'feather')
+    data_handler.rebuild_ohlcv_index()
+    data_handler.ohlcv_store('UNITTEST/BTC', '5m', ohlcv, CandleType.SPOT)
+    load_mock = mocker.spy(data_handler, 'ohlcv_load')
+
+    timerange = TimeRange('date', None, ohlcv['date'].iloc[10].timestamp(), 0)
+    data, start_ts, end_ts = _load_cached_data_for_updating(
+        'UNITTEST/BTC', '5m', timerange, data_handler, CandleType.SPOT)
+    # Only the last candles are loaded, as new candles are appended.
+    assert load_mock.call_args[1]['timerange'].startts == ohlcv['date'].iloc[-11].timestamp()
+    assert_frame_equal(data, ohlcv.iloc[-11:-1].reset_index(drop=True))
+    assert start_ts == dt_ts(ohlcv['date'].iloc[-2])
+    assert end_ts is None
+
+    # Full data is loaded for prepending
+    data, start_ts, end_ts = _load_cached_data_for_updating(
+        'UNITTEST/BTC', '5m', timerange, data_handler, CandleType.SPOT, prepend=True)
+    assert load_mock.call_args[1]['timerange'] is None
+    assert len(data) == len(ohlcv) - 1
+    assert end_ts == dt_ts(ohlcv['date'].iloc[0])
+
+
 @pytest.mark.parametrize('candle_type,subdir,file_tail', [
     ('mark', 'futures/', '-mark'),
     ('spot', '', ''),
@@ -327,6 +355,9 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
     json_dump_mock = mocker.patch(
         'freqtrade.data.history.featherdatahandler.FeatherDataHandler.ohlcv_store',
         return_value=None)
+    append_mock = mocker.patch(
+        'freqtrade.data.history.featherdatahandler.FeatherDataHandler.ohlcv_append',
+        return_value=None)
     mocker.patch(f'{EXMS}.get_historic_ohlcv', return_value=tick)
     exchange = get_patched_exchange(mocker, default_conf)
     _download_pair_history(datadir=testdatadir, exchange=exchange, pair="UNITTEST/BTC",
@@ -335,6 +366,16 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
                            timeframe='3m', candle_type='spot')
     _download_pair_history(datadir=testdatadir, exchange=exchange, pair="UNITTEST/USDT",
                            timeframe='1h', candle_type='mark')
+    # Existing data is only appended to
+    assert append_mock.call_count == 1
+    assert len(append_mock.call_args_list[0][1]['data']) == 1
+    assert json_dump_mock.call_count == 2
+
+    # Datahandlers without append support store all data
+    append_mock.side_effect = NotImplementedError()
+    _download_pair_history(datadir=testdatadir, exchange=exchange, pair="UNITTEST/BTC",
+                           timeframe='1m', candle_type='spot')
+    assert append_mock.call_count == 2
     assert json_dump_mock.call_count == 3
 
 
@@ -382,6 +423,24 @@ def test_load_partial_missing(testdatadir, caplog) -> None:
                    caplog)
 
 
+@pytest.mark.parametrize('data_format', ['feather', 'json'])
+def test_load_data_multiple_pairs(testdatadir, mocker, data_format) -> None:
+    pairs = ['XRP/ETH', 'UNITTEST/BTC', 'NOPAIR/XXX', 'ZEC/BTC']
+    executor_mock = mocker.spy(history_utils.ThreadPoolExecutor, 'map')
+    data = load_data(testdatadir, '5m', pairs, data_format='feather')
+    # Pairs without data are skipped, the order of pairs is kept.
+    assert list(data.keys()) == ['XRP/ETH', 'UNITTEST/BTC', 'ZEC/BTC']
+    for pair, df in data.items():
+        assert_frame_equal(df, load_pair_history(pair, '5m', testdatadir, data_format='feather'))
+
+    executor_mock.reset_mock()
+    init_mock = mocker.spy(history_utils.ThreadPoolExecutor, '__init__')
+    load_data(testdatadir, '5m', pairs, data_format=data_format)
+    # The executor is only created for formats loaded in parallel.
+    assert init_mock.call_count == (1 if data_format == 'feather' else 0)
+    assert executor_mock.call_count == (1 if data_format == 'feather' else 0)
+
+
 def test_init(default_conf) -> None:
     assert {} == load_data(
         datadir=Path(),
@@ -503,7 +562,8 @@ def test_validate_backtest_data(default_conf, mocker, caplog, testdatadir) -> No
 def test_refresh_backtest_ohlcv_data(
         mocker, default_conf, markets, caplog, testdatadir, trademode, callcount):
     caplog.set_level(logging.DEBUG)
-    dl_mock = mocker.patch('freqtrade.data.history.history_utils._download_pair_history')
+    dl_mock = mocker.patch('freqtrade.data.history.history_utils._async_download_pair_history',
+                           return_value=0)
     mocker.patch(f'{EXMS}.markets', PropertyMock(return_value=markets))
 
     mocker.patch.object(Path, "exists", MagicMock(return_value=True))
@@ -524,8 +584,8 @@ def test_refresh_backtest_ohlcv_data(
 
 
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
-    dl_mock = mocker.patch('freqtrade.data.history.history_utils._download_pair_history',
-                           MagicMock())
+    dl_mock = mocker.patch('freqtrade.data.history.history_utils._async_download_pair_history',
+                           return_value=0)
 
     ex = get_patched_exchange(mocker, default_conf)
     mocker.patch(f'{EXMS}.markets', PropertyMock(return_value={}))
@@ -543,6 +603,64 @@ def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     assert log_has("Skipping pair BTT/BTC...", caplog)
 
 
+class FakeAsyncOHLCVApi:
+    """
+    Minimal async ccxt replacement, serving hourly candles between start and end.
+    """
+
+    def __init__(self, start: datetime, end: datetime) -> None:
+        self.start_ms = dt_ts(start)
+        self.end_ms = dt_ts(end)
+        self.in_flight: Dict[str, int] = {}
+        self.max_concurrent_pairs = 0
+        self.session = None
+
+    async def close(self):
+        pass
+
+    async def fetch_ohlcv(self, pair, timeframe, since, limit, params):
+        self.in_flight[pair] = self.in_flight.get(pair, 0) + 1
+        self.max_concurrent_pairs = max(self.max_concurrent_pairs,
+                                        len([p for p, cnt in self.in_flight.items() if cnt]))
+        await asyncio.sleep(0.01)
+        self.in_flight[pair] -= 1
+        start = max(since, self.start_ms)
+        end = min(start + limit * 3600 * 1000, self.end_ms)
+        return [[ts, 1.0, 2.0, 0.5, 1.5, 10.0] for ts in range(start, end, 3600 * 1000)]
+
+
+def test_refresh_backtest_ohlcv_data_concurrent(mocker, default_conf, markets, caplog, tmp_path):
+    mocker.patch(f'{EXMS}.markets', PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+    ex._api_async = FakeAsyncOHLCVApi(dt_utc(2022, 12, 30), dt_utc(2023, 1, 5))
+    pairs = ['ETH/BTC', 'XRP/BTC', 'LTC/BTC']
+
+    refresh_backtest_ohlcv_data(exchange=ex, pairs=pairs, timeframes=['1h'], datadir=tmp_path,
+                                timerange=TimeRange.parse_timerange('20230101-20230105'),
+                                trading_mode='spot', data_format='feather')
+
+    # Pairs are downloaded concurrently
+    assert ex._api_async.max_concurrent_pairs == len(pairs)
+    dh = get_datahandler(tmp_path, 'feather')
+    for pair in pairs:
+        data = dh.ohlcv_load(pair, '1h', candle_type=CandleType.SPOT)
+        assert len(data) == 95
+        assert data['date'].iloc[0] == dt_utc(2023, 1, 1)
+    assert log_has_re(r'Downloaded 288 candles from Binance in .* seconds '
+                      r'\(\d+ candles/s\)\.', caplog)
+
+    # Update - downloads start at the end of the stored data
+    caplog.clear()
+    ex._api_async.end_ms = dt_ts(dt_utc(2023, 1, 5, 1))
+    refresh_backtest_ohlcv_data(exchange=ex, pairs=pairs, timeframes=['1h'], datadir=tmp_path,
+                                trading_mode='spot', data_format='feather')
+    assert log_has_re(r'Downloaded 12 candles from Binance in .*', caplog)
+    for pair in pairs:
+        data = dh.ohlcv_load(pair, '1h', candle_type=CandleType.SPOT)
+        assert len(data) == 96
+        assert data['date'].iloc[-1] == dt_utc(2023, 1, 4, 23)
+
+
 def test_refresh_backtest_trades_data(mocker, default_conf, markets, caplog, testdatadir):
     dl_mock = mocker.patch('freqtrade.data.history.history_utils._download_trades_history',
                            MagicMock())
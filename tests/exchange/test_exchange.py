@@ -9,14 +9,17 @@ import ccxt
 import pytest
 from pandas import DataFrame
 
-from freqtrade.enums import CandleType, MarginMode, TradingMode
-from freqtrade.exceptions import (DDosProtection, DependencyException, ExchangeError,
-                                  InsufficientFundsError, InvalidOrderException,
+from freqtrade.enums import CandleType, MarginMode, RunMode, TradingMode
+from freqtrade.exceptions import (DDosProtection, DeferredRetryError, DependencyException,
+                                  ExchangeError, InsufficientFundsError, InvalidOrderException,
                                   OperationalException, PricingError, TemporaryError)
 from freqtrade.exchange import (Binance, Bittrex, Exchange, Kraken, market_is_active,
                                 timeframe_to_prev_date)
 from freqtrade.exchange.common import (API_FETCH_ORDER_RETRY_COUNT, API_RETRY_COUNT,
-                                       calculate_backoff, remove_exchange_credentials)
+                                       calculate_backoff, deferred_backoff,
+                                       remove_exchange_credentials, resume_retries, retrier,
+                                       retry_stats)
+from freqtrade.exchange.exchange import REST_CANDLE_OFFSET
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
 from freqtrade.util import dt_now, dt_ts
 from tests.conftest import (EXMS, generate_test_data_raw, get_mock_coro, get_patched_exchange,
@@ -2259,6 +2262,82 @@ def test_refresh_latest_ohlcv_cache(mocker, default_conf, candle_type, time_mach
     assert res[pair2].at[0, 'open']
 
 
+def test_refresh_latest_ohlcv_ws(mocker, default_conf, time_machine) -> None:
+    start = datetime(2021, 8, 1, 0, 0, 0, 0, tzinfo=timezone.utc)
+    ohlcv = generate_test_data_raw('1h', 100, start.strftime('%Y-%m-%d'))
+    time_machine.move_to(start + timedelta(hours=99, minutes=30))
+
+    exchange = get_patched_exchange(mocker, default_conf)
+    mocker.patch(f"{EXMS}.ohlcv_candle_limit", return_value=100)
+    exchange._exchange_ws = MagicMock()
+    exchange._exchange_ws.get_ohlcv = get_mock_coro()
+    exchange._api_async.fetch_ohlcv = get_mock_coro(ohlcv)
+    pair = ('IOTA/ETH', '1h', CandleType.SPOT)
+    mark_pair = ('IOTA/ETH', '1h', CandleType.MARK)
+
+    # Not cached yet - downloaded via REST
+    res = exchange.refresh_latest_ohlcv([pair, mark_pair])
+    assert exchange._api_async.fetch_ohlcv.call_count == 2
+    assert exchange._exchange_ws.get_ohlcv.call_count == 0
+    exchange._exchange_ws.schedule_ohlcv.assert_called_once_with(*pair)
+    assert exchange._exchange_ws.cleanup_expired.call_count == 1
+    assert len(res[pair]) == 99
+    exchange._api_async.fetch_ohlcv.reset_mock()
+
+    # Next candle - streamed candles follow the cached candles
+    time_machine.move_to(start + timedelta(hours=100, minutes=1))
+    ws_candles = [c[:] for c in ohlcv[-3:]] + [[ohlcv[-1][0] + 3600_000, 1, 2, 0.5, 1.5, 10]]
+    exchange._exchange_ws.get_ohlcv = get_mock_coro(ws_candles)
+    res = exchange.refresh_latest_ohlcv([pair, mark_pair])
+    # Mark candles are not streamed
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+    assert exchange._exchange_ws.get_ohlcv.call_count == 1
+    assert exchange._exchange_ws.get_ohlcv.call_args[0][3] == ws_candles[-1][0]
+    assert len(res[pair]) == 100
+    # Incomplete candle is dropped
+    assert res[pair].iloc[-1]['date'] == start + timedelta(hours=99)
+    assert res[pair].iloc[-1]['close'] == ohlcv[-1][4]
+    assert exchange._pairs_last_refresh_time[pair] == ohlcv[-1][0] // 1000
+    exchange._api_async.fetch_ohlcv.reset_mock()
+
+    # Gap in streamed candles - downloaded via REST
+    time_machine.move_to(start + timedelta(hours=102, minutes=1))
+    ohlcv = generate_test_data_raw('1h', 100, start + timedelta(hours=3))
+    exchange._api_async.fetch_ohlcv = get_mock_coro(ohlcv)
+    exchange._exchange_ws.get_ohlcv = get_mock_coro([ohlcv[-1]])
+    res = exchange.refresh_latest_ohlcv([pair])
+    assert exchange._exchange_ws.get_ohlcv.call_count == 1
+    assert exchange._api_async.fetch_ohlcv.call_count == 1
+    assert res[pair].iloc[-1]['date'] == start + timedelta(hours=101)
+
+    # REST requests right at the candle close wait for the new candle to be issued
+    time_machine.move_to(start + timedelta(hours=103), tick=False)
+    sleep_mock = mocker.patch('freqtrade.exchange.exchange.asyncio.sleep', get_mock_coro())
+    exchange.refresh_latest_ohlcv([mark_pair])
+    sleep_mock.assert_called_once_with(REST_CANDLE_OFFSET)
+
+    ws_close = exchange._exchange_ws.close
+    exchange.close()
+    assert ws_close.call_count == 1
+    assert not exchange.ws_ohlcv_enabled
+
+
+def test_init_exchange_ws(mocker, default_conf, caplog) -> None:
+    default_conf['runmode'] = RunMode.DRY_RUN
+    exchange = get_patched_exchange(mocker, default_conf)
+    assert not exchange.ws_ohlcv_enabled
+
+    default_conf['exchange']['enable_ws'] = True
+    exchange = get_patched_exchange(mocker, default_conf)
+    assert exchange.ws_ohlcv_enabled
+    assert log_has("Using websocket candle feed.", caplog)
+    exchange.close()
+    assert not exchange.ws_ohlcv_enabled
+
+    assert exchange._init_exchange_ws({'name': 'unknown_exchange'}, {}) is None
+    assert log_has_re(r".* does not support websocket candles.*", caplog)
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 async def test__async_get_candle_history(default_conf, mocker, caplog, exchange_name):
     ohlcv = [
@@ -3220,6 +3299,79 @@ def test_fetch_order(default_conf, mocker, exchange_name, caplog):
                            order_id='_', pair='TKN/BTC')
 
 
+def test_fetch_orders_by_id(default_conf, mocker, caplog):
+    orders = [('1', 'ETH/BTC'), ('2', 'LTC/BTC'), ('3', 'XRP/BTC'), ('4', 'NEO/BTC')]
+    fetch_order = mocker.patch(f'{EXMS}.fetch_order', side_effect=[
+        {'id': '1', 'status': 'open'}, InvalidOrderException('not found'),
+        {'id': '3', 'status': 'closed'}, {'id': '4', 'status': 'open'}])
+    exchange = get_patched_exchange(mocker, default_conf)
+    # Dry-run orders are fetched one by one
+    res = exchange.fetch_orders_by_id(orders)
+    assert fetch_order.call_count == 4
+    assert res['1'] == {'id': '1', 'status': 'open'}
+    assert isinstance(res['2'], InvalidOrderException)
+    fetch_order.reset_mock()
+
+    default_conf['dry_run'] = False
+    api_mock = MagicMock()
+    api_mock.fetch_open_orders = MagicMock(return_value=[
+        {'id': '1', 'symbol': 'ETH/BTC', 'status': 'open'},
+        {'id': '5', 'symbol': 'ETH/BTC', 'status': 'open'}])
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    mocker.patch(f'{EXMS}.exchange_has', return_value=True)
+    exchange._ft_has['open_orders_bulk_min'] = 4
+    exchange._api_async.fetch_order = get_mock_coro(side_effect=[
+        ccxt.OrderNotFound('not found'),
+        {'id': '3', 'symbol': 'XRP/BTC', 'status': 'closed'},
+        ccxt.InvalidOrder('invalid')])
+    fetch_order.side_effect = DeferredRetryError('rate limited', 2)
+
+    with deferred_backoff():
+        res = exchange.fetch_orders_by_id(orders)
+    assert list(res) == ['1', '2', '3', '4']
+    # Open orders are taken from the bulk request, others are fetched individually
+    assert api_mock.fetch_open_orders.call_count == 1
+    assert res['1'] == {'id': '1', 'symbol': 'ETH/BTC', 'status': 'open'}
+    assert res['3'] == {'id': '3', 'symbol': 'XRP/BTC', 'status': 'closed'}
+    assert isinstance(res['4'], InvalidOrderException)
+    # Orders not found are retried by fetch_order
+    assert fetch_order.call_count == 1
+    assert fetch_order.call_args[0] == ('2', 'LTC/BTC')
+    assert isinstance(res['2'], DeferredRetryError)
+
+    # Temporary errors of the concurrent requests are retried by fetch_order
+    fetch_order.reset_mock()
+    fetch_order.side_effect = [{'id': '2', 'status': 'open'}, {'id': '3', 'status': 'closed'}]
+    exchange._api_async.fetch_order = get_mock_coro(side_effect=[
+        ccxt.NetworkError('timeout'), ccxt.DDoSProtection('rate limited'),
+        {'id': '4', 'symbol': 'NEO/BTC', 'status': 'open'}])
+    res = exchange.fetch_orders_by_id(orders)
+    assert fetch_order.call_count == 2
+    assert [call[0] for call in fetch_order.call_args_list] == [
+        ('2', 'LTC/BTC'), ('3', 'XRP/BTC')]
+    assert res['2'] == {'id': '2', 'status': 'open'}
+    assert res['3'] == {'id': '3', 'status': 'closed'}
+    assert res['4'] == {'id': '4', 'symbol': 'NEO/BTC', 'status': 'open'}
+
+    # Bulk request failure - all orders are fetched individually
+    api_mock.fetch_open_orders = MagicMock(side_effect=ccxt.NetworkError('failed'))
+    exchange._api_async.fetch_order = get_mock_coro(side_effect=lambda order_id, pair: {
+        'id': order_id, 'symbol': pair, 'status': 'open'})
+    res = exchange.fetch_orders_by_id(orders)
+    assert log_has_re(r'Could not fetch open orders due to NetworkError.*', caplog)
+    assert all(res[order_id]['symbol'] == pair for order_id, pair in orders)
+
+    # Below the bulk limit
+    api_mock.fetch_open_orders.reset_mock()
+    res = exchange.fetch_orders_by_id(orders[:3])
+    assert api_mock.fetch_open_orders.call_count == 0
+    assert len(res) == 3
+
+    exchange._api_async.fetch_order = get_mock_coro(side_effect=ccxt.BaseError('unknown'))
+    with pytest.raises(OperationalException):
+        exchange.fetch_orders_by_id(orders[:2])
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_fetch_stoploss_order(default_conf, mocker, exchange_name):
@@ -3737,6 +3889,63 @@ def test_calculate_backoff(retrycount, max_retries, expected):
     assert calculate_backoff(retrycount, max_retries) == expected
 
 
+def test_retrier_deferred_backoff(mocker, caplog):
+    sleep_mock = mocker.patch('freqtrade.exchange.common.time.sleep')
+    mocker.patch.multiple('freqtrade.exchange.common.retry_stats',
+                          retries=0, deferred=0, backoff_time=0.0)
+    api_mock = MagicMock(side_effect=DDosProtection('rate limited'))
+
+    @retrier(retries=2)
+    def outer():
+        return inner()
+
+    @retrier(retries=2)
+    def inner():
+        return api_mock()
+
+    with deferred_backoff():
+        with pytest.raises(DeferredRetryError, match='rate limited') as exc:
+            outer()
+    assert exc.value.delay == calculate_backoff(2, 2)
+    assert exc.value.function == inner.__qualname__
+    assert exc.value.count == 1
+    # Raised without sleeping - and not retried by the outer retrier
+    assert api_mock.call_count == 1
+    assert sleep_mock.call_count == 0
+    assert retry_stats.deferred == 1
+    assert retry_stats.retries == 0
+    assert log_has_re(r'inner\(\) returned exception: .* Deferring retry by 1s\.', caplog)
+
+    # Resumed with the remaining retry - blocking, also within nested deferred_backoff
+    api_mock.reset_mock()
+    with deferred_backoff(False), resume_retries(exc.value):
+        with deferred_backoff():
+            with pytest.raises(DDosProtection, match='rate limited'):
+                inner()
+    assert api_mock.call_count == 2
+    assert sleep_mock.call_count == 1
+    assert sleep_mock.call_args[0][0] == calculate_backoff(1, 2)
+    assert log_has_re(r'inner\(\) returned exception: .* Giving up\.', caplog)
+    sleep_mock.reset_mock()
+    mocker.patch.multiple('freqtrade.exchange.common.retry_stats',
+                          retries=0, deferred=0, backoff_time=0.0)
+
+    # Blocking outside of deferred_backoff
+    api_mock.side_effect = [DDosProtection('rate limited'), TemporaryError('failed'), 'result']
+    api_mock.reset_mock()
+    assert inner() == 'result'
+    assert api_mock.call_count == 3
+    assert sleep_mock.call_count == 1
+    assert retry_stats.retries == 2
+    assert retry_stats.backoff_time == calculate_backoff(2, 2)
+
+    # Errors without backoff delay are retried immediately
+    api_mock.side_effect = [TemporaryError('failed'), 'result']
+    with deferred_backoff():
+        assert inner() == 'result'
+    assert retry_stats.deferred == 0
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_get_funding_fees(default_conf_usdt, mocker, exchange_name, caplog):
     now = datetime.now(timezone.utc)
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import time
+from threading import Thread
+from unittest.mock import AsyncMock, MagicMock
+
+import ccxt
+import ccxt.pro as ccxt_pro
+import pytest
+import websockets
+
+from freqtrade.enums import CandleType
+from freqtrade.exchange.exchange_ws import ExchangeWS
+from tests.conftest import log_has_re
+
+
+MARKET = {
+    'id': 'ETHBTC', 'lowercaseId': 'ethbtc', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC',
+    'baseId': 'ETH', 'quoteId': 'BTC', 'type': 'spot', 'spot': True, 'margin': False,
+    'swap': False, 'future': False, 'option': False, 'contract': False, 'linear': None,
+    'inverse': None, 'active': True, 'precision': {}, 'limits': {}, 'info': {},
+}
+
+
+class FakeBinanceWS:
+    """
+    Local websocket server answering subscriptions and sending klines like binance.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.subscriptions: asyncio.Queue = asyncio.Queue()
+        self.clients: list = []
+        self.server = self.loop.run_until_complete(self._serve())
+        self.url = f"ws://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/stream"
+        self._thread = Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    async def _serve(self):
+        return await websockets.serve(self._handler, '127.0.0.1', 0)
+
+    async def _handler(self, websocket) -> None:
+        self.clients.append(websocket)
+        async for message in websocket:
+            request = json.loads(message)
+            await websocket.send(json.dumps({'result': None, 'id': request['id']}))
+            await self.subscriptions.put(request['params'])
+
+    def next_subscription(self) -> list:
+        return asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(self.subscriptions.get(), 5), self.loop).result()
+
+    def send_kline(self, open_ms: int, close: float) -> None:
+        message = {'e': 'kline', 'E': open_ms, 's': 'ETHBTC', 'k': {
+            't': open_ms, 'T': open_ms + 59999, 's': 'ETHBTC', 'i': '1m', 'o': '1.0',
+            'h': '2.0', 'l': '0.5', 'c': str(close), 'v': '10.0', 'x': False}}
+        asyncio.run_coroutine_threadsafe(
+            self.clients[-1].send(json.dumps(message)), self.loop).result(5)
+
+    def close(self) -> None:
+        self.server.close()
+        asyncio.run_coroutine_threadsafe(self.server.wait_closed(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+@pytest.fixture
+def fake_ws():
+    server = FakeBinanceWS()
+    yield server
+    server.close()
+
+
+def test_exchange_ws_ohlcv(fake_ws):
+    api = ccxt_pro.binance({'urls': {'api': {'ws': {'spot': fake_ws.url}}}})
+    exchange_ws = ExchangeWS(api)
+    exchange_ws.set_markets({'ETH/BTC': MARKET})
+    loop = asyncio.new_event_loop()
+
+    def get_ohlcv(candle_ms, timeout=5):
+        return loop.run_until_complete(exchange_ws.get_ohlcv(
+            'ETH/BTC', '1m', CandleType.SPOT, candle_ms, timeout))
+
+    try:
+        # Nothing received yet - returns without waiting
+        assert get_ohlcv(60_000, timeout=60) == []
+
+        exchange_ws.schedule_ohlcv('ETH/BTC', '1m', CandleType.SPOT)
+        assert fake_ws.next_subscription() == ['ethbtc@kline_1m']
+        # Scheduling again doesn't subscribe again
+        exchange_ws.schedule_ohlcv('ETH/BTC', '1m', CandleType.SPOT)
+
+        fake_ws.send_kline(0, 1.1)
+        fake_ws.send_kline(0, 1.2)
+        for _ in range(100):
+            if get_ohlcv(0):
+                break
+            time.sleep(0.01)
+        loop.call_later(0.2, fake_ws.send_kline, 60_000, 1.3)
+        # Waits for the candle opening at 60_000
+        candles = get_ohlcv(60_000)
+        assert candles == [[0, 1.0, 2.0, 0.5, 1.2, 10.0], [60_000, 1.0, 2.0, 0.5, 1.3, 10.0]]
+
+        # Timeout - returns the candles received so far
+        assert get_ohlcv(120_000, timeout=0.1) == candles
+
+        # Unused pairs are no longer watched
+        exchange_ws._klines_last_request[('ETH/BTC', '1m', CandleType.SPOT)] -= 121
+        watch = exchange_ws._watches[('ETH/BTC', '1m', CandleType.SPOT)]
+        exchange_ws.cleanup_expired()
+        assert not exchange_ws._watches
+        assert watch.cancelled()
+    finally:
+        exchange_ws.close()
+        loop.close()
+    assert exchange_ws._loop.is_closed()
+
+
+def test_exchange_ws_watch_errors(mocker, caplog):
+    mocker.patch('freqtrade.exchange.exchange_ws.WS_RETRY_DELAY', 0.01)
+    api = MagicMock()
+    api.close = AsyncMock()
+    api.ohlcvs = {'ETH/BTC': {'1m': [[0, 1.0, 2.0, 0.5, 1.2, 10.0]]}}
+    api.watch_ohlcv = AsyncMock(side_effect=[
+        ccxt.NetworkError('timeout'), ccxt.NetworkError('timeout'), ccxt.BadSymbol('delisted')])
+    api.un_watch_ohlcv = AsyncMock()
+    exchange_ws = ExchangeWS(api)
+    loop = asyncio.new_event_loop()
+    key = ('ETH/BTC', '1m', CandleType.SPOT)
+    try:
+        exchange_ws.schedule_ohlcv(*key)
+        # Network errors are retried with increasing delay - other errors stop the watch
+        assert exchange_ws._watches[key].result(5) is None
+        assert api.watch_ohlcv.call_count == 3
+        assert log_has_re(r'.* failed: timeout\. Retrying in 0\.01s\.', caplog)
+        assert log_has_re(r'.* failed: timeout\. Retrying in 0\.02s\.', caplog)
+        assert log_has_re(r'.* failed: delisted\. Candles of this pair will be downloaded '
+                          r'via REST\.', caplog)
+        # No waiting for candles of a stopped watch
+        assert loop.run_until_complete(
+            exchange_ws.get_ohlcv(*key, 60_000, timeout=60)) == api.ohlcvs['ETH/BTC']['1m']
+
+        # Unused pairs are unsubscribed
+        exchange_ws._klines_last_request[key] -= 121
+        exchange_ws.cleanup_expired()
+        for _ in range(100):
+            if api.un_watch_ohlcv.await_count:
+                break
+            time.sleep(0.01)
+        api.un_watch_ohlcv.assert_awaited_once_with('ETH/BTC', '1m')
+    finally:
+        exchange_ws.close()
+        loop.close()
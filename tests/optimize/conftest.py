@@ -5,6 +5,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+from freqtrade.constants import BACKTEST_ENGINES
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.optimize.hyperopt import Hyperopt
@@ -36,6 +37,14 @@ def backtesting_cleanup() -> None:
     Backtesting.cleanup()
 
 
+@pytest.fixture(params=BACKTEST_ENGINES)
+def backtest_engine(request) -> str:
+    """
+    Runs the requesting test once per backtest engine.
+    """
+    return request.param
+
+
 @pytest.fixture(scope='function')
 def hyperopt(hyperopt_conf, mocker):
 
@@ -900,10 +900,12 @@ TESTS = [
 
 
 @pytest.mark.parametrize("data", TESTS)
-def test_backtest_results(default_conf, fee, mocker, caplog, data: BTContainer) -> None:
+def test_backtest_results(default_conf, fee, mocker, caplog, data: BTContainer,
+                          backtest_engine) -> None:
     """
     run functional tests
     """
+    default_conf['backtest_engine'] = backtest_engine
     default_conf["stoploss"] = data.stop_loss
     default_conf["minimal_roi"] = data.roi
     default_conf["timeframe"] = tests_timeframe
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, PropertyMock
 import numpy as np
 import pandas as pd
 import pytest
+from cachetools import LRUCache
 
 from freqtrade import constants
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_backtesting
@@ -21,11 +22,13 @@ from freqtrade.data.history import get_timerange
 from freqtrade.enums import CandleType, ExitType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
+from freqtrade.optimize.backtest_arrays import CandleSchedule, DetailArrays, PairArrays
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
+from freqtrade.optimize.backtesting import HEADERS as BT_HEADERS
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
-from freqtrade.util.datetime_helpers import dt_utc
+from freqtrade.util.datetime_helpers import dt_ts, dt_utc
 from tests.conftest import (CURRENT_TEST_STRATEGY, EXMS, get_args, log_has, log_has_re,
                             patch_exchange, patched_configuration_load_config_file)
 
@@ -682,7 +685,8 @@ def test_backtest__check_trade_exit(default_conf, fee, mocker) -> None:
     assert res is None
 
 
-def test_backtest_one(default_conf, fee, mocker, testdatadir) -> None:
+def test_backtest_one(default_conf, fee, mocker, testdatadir, backtest_engine) -> None:
+    default_conf['backtest_engine'] = backtest_engine
     default_conf['use_exit_signal'] = False
     default_conf['max_open_trades'] = 10
 
@@ -768,8 +772,52 @@ def test_backtest_one(default_conf, fee, mocker, testdatadir) -> None:
                 t["close_rate"], 6) < round(ln1.iloc[0]["high"], 6))
 
 
+def test_backtest_compact_dataframes(default_conf, fee, mocker, testdatadir, caplog) -> None:
+    default_conf['use_exit_signal'] = False
+    default_conf['max_open_trades'] = 10
+    default_conf['compact_dataframes'] = True
+
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    advise_entry = backtesting.strategy.populate_entry_trend
+
+    def populate_entry_trend(df, *args, **kwargs):
+        df = advise_entry(df, *args, **kwargs)
+        df.loc[df['enter_long'] == 1, 'enter_tag'] = 'compact_tag'
+        return df
+
+    backtesting.strategy.populate_entry_trend = populate_entry_trend
+    timerange = TimeRange('date', None, 1517227800, 0)
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'],
+                             timerange=timerange, compact_dataframes=True)
+    processed = backtesting.strategy.advise_all_indicators(data)
+    df = processed['UNITTEST/BTC']
+    assert df['volume'].dtype == np.float32
+    assert df['rsi'].dtype == np.float32
+    backtesting._log_dataframe_footprint(processed)
+    assert log_has_re(r"Memory usage of analyzed dataframes: .* MB without compact_dataframes\)\.",
+                      caplog)
+
+    min_date, max_date = get_timerange(processed)
+    result = backtesting.backtest(
+        processed=deepcopy(processed),
+        start_date=min_date,
+        end_date=max_date,
+    )
+    results = result['results']
+    assert len(results) == 2
+    assert results['open_rate'].tolist() == [0.104445, 0.10302485]
+    assert results['enter_tag'].tolist() == ['compact_tag', 'compact_tag']
+
+
 @pytest.mark.parametrize('use_detail', [True, False])
-def test_backtest_one_detail(default_conf_usdt, fee, mocker, testdatadir, use_detail) -> None:
+def test_backtest_one_detail(default_conf_usdt, fee, mocker, testdatadir, use_detail,
+                             backtest_engine) -> None:
+    default_conf_usdt['backtest_engine'] = backtest_engine
     default_conf_usdt['use_exit_signal'] = False
     mocker.patch(f'{EXMS}.get_fee', fee)
     mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
@@ -853,7 +901,8 @@ def test_backtest_one_detail(default_conf_usdt, fee, mocker, testdatadir, use_de
 
 @pytest.mark.parametrize('use_detail', [True, False])
 def test_backtest_one_detail_futures(
-        default_conf_usdt, fee, mocker, testdatadir, use_detail) -> None:
+        default_conf_usdt, fee, mocker, testdatadir, use_detail, backtest_engine) -> None:
+    default_conf_usdt['backtest_engine'] = backtest_engine
     default_conf_usdt['use_exit_signal'] = False
     default_conf_usdt['trading_mode'] = 'futures'
     default_conf_usdt['margin_mode'] = 'isolated'
@@ -942,7 +991,8 @@ def test_backtest_one_detail_futures(
 
 @pytest.mark.parametrize('use_detail', [True, False])
 def test_backtest_one_detail_futures_funding_fees(
-        default_conf_usdt, fee, mocker, testdatadir, use_detail) -> None:
+        default_conf_usdt, fee, mocker, testdatadir, use_detail, backtest_engine) -> None:
+    default_conf_usdt['backtest_engine'] = backtest_engine
     default_conf_usdt['use_exit_signal'] = False
     default_conf_usdt['trading_mode'] = 'futures'
     default_conf_usdt['margin_mode'] = 'isolated'
@@ -1009,7 +1059,9 @@ def test_backtest_one_detail_futures_funding_fees(
         assert -1.81 < t.funding_fees < -0.1
 
 
-def test_backtest_timedout_entry_orders(default_conf, fee, mocker, testdatadir) -> None:
+def test_backtest_timedout_entry_orders(default_conf, fee, mocker, testdatadir,
+                                        backtest_engine) -> None:
+    default_conf['backtest_engine'] = backtest_engine
     # This strategy intentionally places unfillable orders.
     default_conf['strategy'] = 'StrategyTestV3CustomEntryPrice'
     default_conf['startup_candle_count'] = 0
@@ -1037,7 +1089,8 @@ def test_backtest_timedout_entry_orders(default_conf, fee, mocker, testdatadir)
     assert result['timedout_entry_orders'] == 10
 
 
-def test_backtest_1min_timeframe(default_conf, fee, mocker, testdatadir) -> None:
+def test_backtest_1min_timeframe(default_conf, fee, mocker, testdatadir, backtest_engine) -> None:
+    default_conf['backtest_engine'] = backtest_engine
     default_conf['use_exit_signal'] = False
     default_conf['max_open_trades'] = 1
     mocker.patch(f'{EXMS}.get_fee', fee)
@@ -1152,7 +1205,9 @@ def test_backtest_dataprovider_analyzed_df(default_conf, fee, mocker, testdatadi
     assert count == 5
 
 
-def test_backtest_pricecontours_protections(default_conf, fee, mocker, testdatadir) -> None:
+def test_backtest_pricecontours_protections(default_conf, fee, mocker, testdatadir,
+                                            backtest_engine) -> None:
+    default_conf['backtest_engine'] = backtest_engine
     # While this test IS a copy of test_backtest_pricecontours, it's needed to ensure
     # results do not carry-over to the next run, which is not given by using parametrize.
     patch_exchange(mocker)
@@ -1208,7 +1263,8 @@ def test_backtest_pricecontours_protections(default_conf, fee, mocker, testdatad
     ([{"method": "CooldownPeriod", "stop_duration": 3}], 'raise', 10),
 ])
 def test_backtest_pricecontours(default_conf, fee, mocker, testdatadir,
-                                protections, contour, expected) -> None:
+                                protections, contour, expected, backtest_engine) -> None:
+    default_conf['backtest_engine'] = backtest_engine
     if protections:
         default_conf['protections'] = protections
         default_conf['enable_protections'] = True
@@ -1238,7 +1294,9 @@ def test_backtest_pricecontours(default_conf, fee, mocker, testdatadir,
     assert len(results['results']) == expected
 
 
-def test_backtest_clash_buy_sell(mocker, default_conf, testdatadir):
+def test_backtest_clash_buy_sell(mocker, default_conf, testdatadir, backtest_engine):
+    default_conf['backtest_engine'] = backtest_engine
+
     # Override the default buy trend function in our StrategyTest
     def fun(dataframe=None, pair=None):
         buy_value = 1
@@ -1254,7 +1312,9 @@ def test_backtest_clash_buy_sell(mocker, default_conf, testdatadir):
     assert result['results'].empty
 
 
-def test_backtest_only_sell(mocker, default_conf, testdatadir):
+def test_backtest_only_sell(mocker, default_conf, testdatadir, backtest_engine):
+    default_conf['backtest_engine'] = backtest_engine
+
     # Override the default buy trend function in our StrategyTest
     def fun(dataframe=None, pair=None):
         buy_value = 0
@@ -1271,7 +1331,8 @@ def test_backtest_only_sell(mocker, default_conf, testdatadir):
     assert result['results'].empty
 
 
-def test_backtest_alternate_buy_sell(default_conf, fee, mocker, testdatadir):
+def test_backtest_alternate_buy_sell(default_conf, fee, mocker, testdatadir, backtest_engine):
+    default_conf['backtest_engine'] = backtest_engine
     mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
     mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
     mocker.patch(f'{EXMS}.get_fee', fee)
@@ -1304,7 +1365,8 @@ def test_backtest_alternate_buy_sell(default_conf, fee, mocker, testdatadir):
 
 @pytest.mark.parametrize("pair", ['ADA/BTC', 'LTC/BTC'])
 @pytest.mark.parametrize("tres", [0, 20, 30])
-def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir):
+def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir,
+                             backtest_engine):
 
     def _trend_alternate_hold(dataframe=None, metadata=None):
         """
@@ -1335,6 +1397,7 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
         data[pair] = data[pair][tres:].reset_index()
     default_conf['timeframe'] = '5m'
     default_conf['max_open_trades'] = 3
+    default_conf['backtest_engine'] = backtest_engine
 
     backtesting = Backtesting(default_conf)
     backtesting._set_strategy(backtesting.strategylist[0])
@@ -1376,6 +1439,260 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results['results'], '5m', 1)) == 0
 
 
+@pytest.mark.parametrize("tres,gap", [(0, False), (30, False), (0, True), (30, True)])
+@pytest.mark.parametrize("use_exit_signal,minimal_roi,stoploss", [
+    (True, {"0": 10}, -0.99),
+    (True, {"0": 0.01, "30": 0.005, "60": 0}, -0.02),
+    (False, {"0": 0.05, "40": 0.02, "120": -1}, -0.01),
+])
+def test_backtest_engines_identical(default_conf, fee, mocker, testdatadir, tres, gap,
+                                    use_exit_signal, minimal_roi, stoploss):
+    def _trend_alternate_hold(dataframe=None, metadata=None):
+        multi = 20 if metadata['pair'] in ('ETH/BTC', 'LTC/BTC') else 18
+        dataframe['enter_long'] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe['exit_long'] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe['enter_short'] = 0
+        dataframe['exit_short'] = 0
+        dataframe['enter_tag'] = np.where(dataframe.index % multi == 0, 'tag', None)
+        return dataframe
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = trim_dictlist(history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs), -500)
+    if tres > 0:
+        data['LTC/BTC'] = data['LTC/BTC'][tres:].reset_index()
+    if gap:
+        # Missing candles in the middle and at the end of the data
+        data['ETH/BTC'] = data['ETH/BTC'].drop(range(200, 240)).reset_index(drop=True)
+        data['ADA/BTC'] = data['ADA/BTC'][:-50]
+    default_conf['timeframe'] = '5m'
+    default_conf['max_open_trades'] = 3
+    default_conf['use_exit_signal'] = use_exit_signal
+    default_conf['minimal_roi'] = minimal_roi
+    default_conf['stoploss'] = stoploss
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        default_conf['backtest_engine'] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_alternate_hold  # Override
+        backtesting.strategy.advise_exit = _trend_alternate_hold  # Override
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        loop_mock = mocker.spy(backtesting, 'backtest_loop')
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+        results[engine]['loop_calls'] = loop_mock.call_count
+
+    assert len(results['lists']['results']) > 0
+    assert results['numpy']['loop_calls'] < results['lists']['loop_calls']
+    pd.testing.assert_frame_equal(results['lists']['results'], results['numpy']['results'])
+    assert results['lists']['final_balance'] == results['numpy']['final_balance']
+    assert results['lists']['rejected_signals'] == results['numpy']['rejected_signals']
+
+
+def test_backtest_result_cache(default_conf, fee, mocker, testdatadir):
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf['max_open_trades'] = 3
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(datadir=testdatadir, timeframe='5m',
+                             pairs=['UNITTEST/BTC', 'ETH/BTC'])
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    backtesting.result_cache = LRUCache(maxsize=10)
+    loop_mock = mocker.spy(backtesting, '_backtest_lists')
+
+    def run_backtest():
+        return backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+
+    result1 = run_backtest()
+    assert len(result1['results']) > 0
+    assert loop_mock.call_count == 1
+    assert backtesting.result_cache_hits == 0
+
+    result2 = run_backtest()
+    assert loop_mock.call_count == 1
+    assert backtesting.result_cache_hits == 1
+    pd.testing.assert_frame_equal(result1['results'], result2['results'])
+    assert result1['results'] is not result2['results']
+    assert result1['final_balance'] == result2['final_balance']
+
+    # Different stoploss - new backtest
+    backtesting.strategy.stoploss = -0.01
+    run_backtest()
+    assert loop_mock.call_count == 2
+
+    # Different signals - new backtest
+    backtesting.strategy.advise_entry = _trend_alternate  # Override
+    run_backtest()
+    assert loop_mock.call_count == 3
+    run_backtest()
+    assert loop_mock.call_count == 3
+    assert backtesting.result_cache_hits == 2
+
+
+def test_get_ohlcv_as_lists_numpy(default_conf, mocker, testdatadir):
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'])
+    processed = backtesting.strategy.advise_all_indicators(data)
+
+    backtesting.backtest_engine = 'lists'
+    lists = backtesting._get_ohlcv_as_lists(deepcopy(processed))['UNITTEST/BTC']
+    backtesting.backtest_engine = 'numpy'
+    arrays = backtesting._get_ohlcv_as_lists(deepcopy(processed))['UNITTEST/BTC']
+
+    assert len(arrays) == len(lists)
+    for idx in (0, 1, 100, len(lists) - 1, -1):
+        assert list(arrays[idx]) == lists[idx]
+        assert [type(x) for x in arrays[idx]] == [type(x) for x in lists[idx]]
+    assert arrays.has_entry.sum() == sum(1 for row in lists if row[5] == 1 or row[7] == 1)
+    with pytest.raises(IndexError):
+        arrays[len(lists)]
+
+
+@pytest.mark.parametrize("custom_loop_start", [True, False])
+def test_backtest_numpy_fast_forward(default_conf, fee, mocker, testdatadir, custom_loop_start):
+    default_conf['backtest_engine'] = 'numpy'
+    mocker.patch(f'{EXMS}.get_fee', fee)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float('inf'))
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._is_default_callback('bot_loop_start')
+    loop_start = MagicMock()
+    if custom_loop_start:
+        backtesting.strategy.bot_loop_start = loop_start
+        assert not backtesting._is_default_callback('bot_loop_start')
+    loop_mock = mocker.spy(backtesting, 'backtest_loop')
+    progress_mock = mocker.spy(backtesting.progress, 'increment')
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'])
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    steps = int((max_date - min_date) / timedelta(minutes=5))
+
+    backtesting.backtest(processed=deepcopy(processed), start_date=min_date, end_date=max_date)
+
+    if custom_loop_start:
+        # Every candle is processed
+        assert loop_start.call_count == steps
+        # One increment per pair from data conversion
+        assert progress_mock.call_count == steps + 1
+    else:
+        # Candles without open trade and without entry signal were skipped
+        assert 0 < progress_mock.call_count < steps
+    assert backtesting.progress.progress == 1
+    assert loop_mock.call_count < steps
+
+
+def test_candle_schedule():
+    def _df(dates):
+        return pd.DataFrame({
+            'date': pd.to_datetime(dates, utc=True),
+            **{col: 0.0 for col in BT_HEADERS[1:9]},
+            'enter_tag': None, 'exit_tag': None,
+        })
+    start = dt_utc(2022, 1, 1)
+    data = {
+        'A/USDT': PairArrays(_df([start + timedelta(minutes=5 * i) for i in range(6)]), BT_HEADERS),
+        # Late start, with a gap
+        'B/USDT': PairArrays(_df([start + timedelta(minutes=15), start + timedelta(minutes=20),
+                                  start + timedelta(minutes=35)]), BT_HEADERS),
+        # duplicate candle lags behind
+        'C/USDT': PairArrays(_df([start, start, start + timedelta(minutes=5)]), BT_HEADERS),
+        'D/USDT': PairArrays(pd.DataFrame(), BT_HEADERS),
+    }
+    schedule = CandleSchedule(data, start, 5)
+    assert data['A/USDT'].steps.tolist() == [0, 1, 2, 3, 4, 5]
+    assert data['B/USDT'].steps.tolist() == [2, 3, 6]
+    assert data['C/USDT'].steps.tolist() == [0, 1, 2]
+    assert len(data['D/USDT'].steps) == 0
+
+    assert schedule.get_live_pairs(0) == ['A/USDT', 'C/USDT']
+    assert schedule.get_live_pairs(2) == ['A/USDT', 'B/USDT', 'C/USDT']
+    assert schedule.get_live_pairs(3) == ['A/USDT', 'B/USDT']
+    assert schedule.get_live_pairs(5) == ['A/USDT', 'B/USDT']
+    assert schedule.get_live_pairs(6) == ['B/USDT']
+    assert schedule.get_live_pairs(7) == []
+    assert data['A/USDT'].row_index_at_step(3) == 3
+    assert data['B/USDT'].row_index_at_step(4) == 2
+    assert data['B/USDT'].row_index_at_step(7) == 3
+
+    schedule = CandleSchedule(data, start, 5)
+    # Skipping steps
+    assert schedule.get_live_pairs(3) == ['A/USDT', 'B/USDT']
+    assert schedule.get_live_pairs(6) == ['B/USDT']
+    assert schedule.next_entry_step(0) is None
+
+
+def test_pair_arrays_find_exit_candidate():
+    start = dt_utc(2022, 1, 1)
+    df = pd.DataFrame({
+        'date': pd.date_range(start, periods=300, freq='5min', tz='UTC'),
+        'open': 1.0, 'high': 1.01, 'low': 0.99, 'close': 1.0,
+        'enter_long': 0, 'exit_long': 0, 'enter_short': 0, 'exit_short': 0,
+        'enter_tag': None, 'exit_tag': None,
+    })
+    df.loc[250, 'low'] = 0.9
+    df.loc[200, 'exit_long'] = 1
+    df.loc[150, 'high'] = 1.05
+    pair_data = PairArrays(df, BT_HEADERS)
+    assert pair_data.get_high_low(140, 260) == (1.05, 0.9)
+
+    kwargs = {'stop_loss': 0.95, 'open_ms': dt_ts(start), 'exit_signal': False,
+              'roi_minutes': np.array([], dtype=np.int64), 'roi_rates': np.array([])}
+    assert pair_data.find_exit_candidate(0, **kwargs) == 250
+    assert pair_data.find_exit_candidate(251, **kwargs) == 300
+    assert pair_data.find_exit_candidate(0, **{**kwargs, 'exit_signal': True}) == 200
+    # ROI of 4% reached on the candle with high 1.05
+    kwargs.update({'roi_minutes': np.array([0, 1000]), 'roi_rates': np.array([1.04, 1.1])})
+    assert pair_data.find_exit_candidate(0, **kwargs) == 150
+    # ROI table moves to 1.005 after 1000 minutes (candle 200)
+    kwargs.update({'roi_minutes': np.array([0, 1000]), 'roi_rates': np.array([1.1, 1.005])})
+    assert pair_data.find_exit_candidate(0, **kwargs) == 200
+    # ROI only valid after 100 minutes
+    kwargs.update({'roi_minutes': np.array([100]), 'roi_rates': np.array([1.0])})
+    assert pair_data.find_exit_candidate(0, **kwargs) == 20
+
+
+def test_detail_arrays():
+    start = dt_utc(2022, 1, 1)
+    df = pd.DataFrame({
+        'date': pd.date_range(start, periods=20, freq='1min', tz='UTC'),
+        'open': 1.0, 'high': 1.01, 'low': 0.99, 'close': 1.0, 'volume': 5.0,
+    })
+    df = df.drop(index=[7, 8])
+    detail = DetailArrays(df)
+    assert len(detail) == 18
+    # Detail data is not copied
+    assert np.shares_memory(detail._ohlc[0], df['open'].to_numpy())
+    main_dates = pd.date_range(start, periods=8, freq='5min', tz='UTC').values
+    detail.set_main_candles(main_dates, 5)
+    assert detail.get_range(0) == (0, 5)
+    assert detail.get_range(1) == (5, 8)
+    assert detail.get_range(3) == (13, 18)
+    assert detail.get_range(7) == (18, 18)
+
+    rows = detail.get_rows(5, 8, (1, 0, 0, 0, 'tag', None))
+    assert rows == [
+        (pd.Timestamp(start + timedelta(minutes=minute)), 1.0, 1.01, 0.99, 1.0,
+         1, 0, 0, 0, 'tag', None)
+        for minute in (5, 6, 9)
+    ]
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
 
     patch_exchange(mocker)
@@ -15,7 +15,9 @@ from freqtrade.util.datetime_helpers import dt_utc
 from tests.conftest import EXMS, patch_exchange
 
 
-def test_backtest_position_adjustment(default_conf, fee, mocker, testdatadir) -> None:
+def test_backtest_position_adjustment(default_conf, fee, mocker, testdatadir,
+                                      backtest_engine) -> None:
+    default_conf['backtest_engine'] = backtest_engine
     default_conf['use_exit_signal'] = False
     default_conf['max_open_trades'] = 10
     mocker.patch(f'{EXMS}.get_fee', fee)
@@ -97,7 +99,9 @@ def test_backtest_position_adjustment(default_conf, fee, mocker, testdatadir) ->
 @pytest.mark.parametrize('leverage', [
     1, 2
 ])
-def test_backtest_position_adjustment_detailed(default_conf, fee, mocker, leverage) -> None:
+def test_backtest_position_adjustment_detailed(default_conf, fee, mocker, leverage,
+                                               backtest_engine) -> None:
+    default_conf['backtest_engine'] = backtest_engine
     default_conf['use_exit_signal'] = False
     mocker.patch(f'{EXMS}.get_fee', fee)
     mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=10)
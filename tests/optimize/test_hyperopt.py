@@ -1,4 +1,6 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
@@ -7,12 +9,14 @@ from unittest.mock import ANY, MagicMock, PropertyMock
 import pandas as pd
 import pytest
 from filelock import Timeout
+from joblib import dump
 from skopt.space import Integer
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize import hyperopt as hyperopt_mod
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
@@ -457,7 +461,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     patch_exchange(mocker)
     mocker.patch.object(Path, 'open')
     mocker.patch('freqtrade.configuration.config_validation.validate_config_schema')
-    mocker.patch('freqtrade.optimize.hyperopt.load', return_value={'XRP/BTC': None})
+    mocker.patch('freqtrade.optimize.hyperopt.load', return_value={'XRP/BTC': pd.DataFrame()})
 
     optimizer_param = {
         'buy_plusdi': 0.02,
@@ -520,6 +524,85 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     assert generate_optimizer_value == response_expected
 
 
+def test_load_processed_data(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf['user_data_dir'] = tmp_path
+    (tmp_path / 'hyperopt_results').mkdir()
+    hyperopt = Hyperopt(hyperopt_conf)
+    dump({'XRP/BTC': pd.DataFrame({'close': [1.0, 2.0], 'rsi': [30.0, 40.0]})},
+         hyperopt.data_pickle_file)
+    loader = mocker.spy(hyperopt_mod, 'load')
+
+    processed = hyperopt._load_processed_data()
+    assert loader.call_count == 1
+    assert processed['XRP/BTC']['rsi'].tolist() == [30.0, 40.0]
+    # Columns added in one epoch must not be visible in the next epoch.
+    processed['XRP/BTC']['enter_long'] = 1
+
+    processed = hyperopt._load_processed_data()
+    assert loader.call_count == 1
+    assert 'enter_long' not in processed['XRP/BTC'].columns
+
+    # New data is loaded for a different hyperopt run
+    hyperopt.run_id = 'new_run'
+    hyperopt._load_processed_data()
+    assert loader.call_count == 2
+
+
+def test_evaluate_epoch(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf['user_data_dir'] = tmp_path
+    (tmp_path / 'hyperopt_results').mkdir()
+    go = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+                      return_value={'loss': 1})
+    dumper = mocker.patch.object(hyperopt_mod.cloudpickle, 'dump')
+    worker_hyperopt = MagicMock()
+    loader = mocker.patch.object(hyperopt_mod.cloudpickle, 'load', return_value=worker_hyperopt)
+    hyperopt = Hyperopt(hyperopt_conf)
+
+    # Single job - evaluated on the instance itself.
+    hyperopt.prepare_workers(1)
+    assert dumper.call_count == 0
+    assert hyperopt_mod._hyperopt_worker['hyperopt'] is hyperopt
+    assert hyperopt_mod._evaluate_epoch(
+        hyperopt.worker_pickle_file, hyperopt.run_id, [1, 2]) == {'loss': 1}
+    go.assert_called_once_with([1, 2])
+
+    hyperopt.prepare_workers(2)
+    assert dumper.call_count == 1
+    assert dumper.call_args[0][0] is hyperopt
+    # Concurrent hyperopt runs use separate worker files.
+    assert hyperopt.run_id in hyperopt.worker_pickle_file.name
+    assert Hyperopt(hyperopt_conf).worker_pickle_file != hyperopt.worker_pickle_file
+    # Simulate a new worker process - the instance is loaded once per run.
+    hyperopt_mod._hyperopt_worker.update({'id': None, 'hyperopt': None})
+    for _ in range(3):
+        hyperopt_mod._evaluate_epoch(hyperopt.worker_pickle_file, hyperopt.run_id, [1, 2])
+    assert loader.call_count == 1
+    assert worker_hyperopt.generate_optimizer.call_count == 3
+    hyperopt_mod._evaluate_epoch(hyperopt.worker_pickle_file, 'new_run', [1, 2])
+    assert loader.call_count == 2
+
+
+def test_init_signal_cache(mocker, hyperopt, caplog) -> None:
+    hyperopt.init_signal_cache()
+    assert hyperopt.backtesting.result_cache is None
+    assert log_has("Not caching results of identical signals, as the strategy implements "
+                   "bot_loop_start, adjust_trade_position, leverage.", caplog)
+
+    mocker.patch.object(hyperopt.backtesting, '_is_default_callback', return_value=True)
+    hyperopt.init_signal_cache()
+    assert hyperopt.backtesting.result_cache is not None
+
+    mocker.patch.object(hyperopt, '_save_result')
+    mocker.patch.object(hyperopt, 'print_results')
+    for i, hit in enumerate([False, True, True], start=1):
+        val = {'loss': 1, 'signal_cache_hit': hit, 'results_metrics': generate_result_metrics()}
+        hyperopt.evaluate_result(val, i, False)
+        assert 'signal_cache_hit' not in val
+    assert hyperopt.signal_cache_hits == 2
+
+
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     patch_exchange(mocker)
 
@@ -938,6 +1021,58 @@ def test_in_strategy_auto_hyperopt_with_parallel(mocker, hyperopt_conf, tmp_path
     hyperopt.start()
 
 
+def test_get_asked_points(hyperopt) -> None:
+    hyperopt.opt = MagicMock()
+    hyperopt.opt.Xi = [[1], [2]]
+    hyperopt.opt.ask.return_value = [[1], [3], [3], [2], [4]]
+    hyperopt.opt.space.rvs.return_value = [[5], [1], [6]]
+
+    assert hyperopt.get_asked_points(3, pending=[[4]]) == ([[3], [5], [6]], [False, True, True])
+    assert hyperopt.opt.ask.call_count == 3
+    assert hyperopt.opt.space.rvs.call_count == 1
+    assert hyperopt.num_points_indexed == 2
+
+    hyperopt.opt.Xi += [[3], [5], [6]]
+    assert hyperopt.get_asked_points(1) == ([[4]], [False])
+    assert hyperopt.num_points_indexed == 5
+    assert hyperopt.tried_points == {(1, ), (2, ), (3, ), (5, ), (6, )}
+
+    hyperopt.opt.Xi.append([4])
+    hyperopt.opt.space.rvs.return_value = [[7]]
+    assert hyperopt.get_asked_points(1) == ([[7]], [True])
+
+
+def test_run_optimizer_async(mocker, hyperopt) -> None:
+    hyperopt.total_epochs = 7
+    hyperopt.opt = MagicMock()
+    points = iter([[i] for i in range(1, 8)])
+    asked = mocker.patch.object(hyperopt, 'get_asked_points',
+                                side_effect=lambda n_points, pending: ([next(points)], [False]))
+
+    def evaluate(worker_file, run_id, raw_params):
+        # Earlier epochs take longer
+        time.sleep(0.02 * (8 - raw_params[0]))
+        return {'loss': raw_params[0]}
+
+    mocker.patch('freqtrade.optimize.hyperopt._evaluate_epoch', side_effect=evaluate)
+    mocker.patch('freqtrade.optimize.hyperopt.get_reusable_executor',
+                 return_value=ThreadPoolExecutor(max_workers=3))
+    evaluate_result = mocker.patch.object(hyperopt, 'evaluate_result')
+    pbar = MagicMock()
+
+    hyperopt.run_optimizer_async(3, 1, pbar, 0)
+
+    assert asked.call_count == 6
+    # Never more than 3 points are in progress
+    assert max(len(c[1]['pending']) for c in asked.call_args_list) == 2
+    # All results were told - and evaluated in epoch order
+    told = [x for c in hyperopt.opt.tell.call_args_list for x in c[0][0]]
+    assert sorted(told) == [[i] for i in range(1, 7)]
+    assert [c[0][1] for c in evaluate_result.call_args_list] == [2, 3, 4, 5, 6, 7]
+    assert [c[0][0]['loss'] for c in evaluate_result.call_args_list] == [1, 2, 3, 4, 5, 6]
+    assert pbar.update.call_count == 6
+
+
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fee) -> None:
     patch_exchange(mocker)
     mocker.patch(f'{EXMS}.get_fee', fee)
@@ -973,9 +1108,20 @@ def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fe
     # Range from 0 - 50 (inclusive)
     assert len(list(buy_rsi_range)) == 51
 
+    prepare_workers = Hyperopt.prepare_workers
+    calls_before_prepare = []
+
+    def prepare_workers_mock(self, jobs):
+        calls_before_prepare.append(go.call_count)
+        prepare_workers(self, jobs)
+
+    mocker.patch.object(Hyperopt, 'prepare_workers', prepare_workers_mock)
+
     hyperopt.start()
     # backtesting should be called 3 times (once per epoch)
     assert go.call_count == 3
+    # Workers are prepared after the first (non-parallel) epoch
+    assert calls_before_prepare == [1]
 
 
 def test_SKDecimal():
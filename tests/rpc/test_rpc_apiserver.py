@@ -1558,6 +1558,50 @@ def test_api_pair_candles(botclient, ohlcv_history):
              ])
 
 
+def test_api_pair_candles_arrow(botclient, ohlcv_history, mocker):
+    pa = pytest.importorskip('pyarrow')
+    ftbot, client = botclient
+    timeframe = '5m'
+    url = f"{BASE_URI}/pair_candles?limit=3&pair=XRP%2FBTC&timeframe={timeframe}"
+    headers = {'Authorization': _basic_auth_str(_TEST_USER, _TEST_PASS),
+               'Accept': 'application/json;q=0.9, application/vnd.apache.arrow.stream'}
+    ohlcv_history['sma'] = ohlcv_history['close'].rolling(2).mean()
+    ohlcv_history['enter_long'] = 0
+    ohlcv_history.loc[1, 'enter_long'] = 1
+    ohlcv_history['exit_long'] = 0
+    ohlcv_history['enter_short'] = 0
+    ohlcv_history['exit_short'] = 0
+    # Mixed types are sent as strings
+    ohlcv_history['enter_tag'] = None
+    ohlcv_history.loc[1, 'enter_tag'] = 5
+    ohlcv_history.loc[2, 'enter_tag'] = 'tag'
+    ftbot.dataprovider._set_cached_df("XRP/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+
+    rc = client.get(url, headers=headers)
+    assert rc.status_code == 200
+    assert rc.headers['content-type'] == 'application/vnd.apache.arrow.stream'
+    table = pa.ipc.open_stream(rc.content).read_all()
+    info = rapidjson.loads(table.schema.metadata[b'freqtrade'])
+    rc_json = client_get(client, url).json()
+    assert rc_json['data_start_ts'] == 1511686200000
+    for key, value in rc_json.items():
+        if key != 'data':
+            assert info[key] == value
+    assert table.column_names == rc_json['columns']
+    assert table.num_rows == 3
+    df = table.to_pandas()
+    assert df['__date_ts'].tolist() == [1511686200000, 1511686500000, 1511686800000]
+    assert df['_enter_long_signal_close'].tolist()[1] == 8.893e-05
+    assert df['enter_tag'].tolist() == [None, '5', 'tag']
+    assert df['date'].tolist() == ohlcv_history['date'].tail(3).tolist()
+
+    # Json without pyarrow
+    mocker.patch('freqtrade.rpc.api_server.api_v1.find_spec', return_value=None)
+    rc = client.get(url, headers=headers)
+    assert_response(rc, needs_cors=False)
+    assert rc.json()['data_start_ts'] == 1511686200000
+
+
 def test_api_pair_history(botclient, mocker):
     ftbot, client = botclient
     timeframe = '5m'
@@ -1628,6 +1672,19 @@ def test_api_pair_history(botclient, mocker):
     assert_response(rc, 502)
     assert rc.json()['detail'] == ("No data for UNITTEST/BTC, 5m in 20200111-20200112 found.")
 
+    # Arrow IPC stream
+    pa = pytest.importorskip('pyarrow')
+    rc = client.get(f"{BASE_URI}/pair_history?pair=UNITTEST%2FBTC&timeframe={timeframe}"
+                    f"&timerange=20180111-20180112&strategy={CURRENT_TEST_STRATEGY}",
+                    headers={'Authorization': _basic_auth_str(_TEST_USER, _TEST_PASS),
+                             'Accept': 'application/vnd.apache.arrow.stream'})
+    assert rc.status_code == 200
+    table = pa.ipc.open_stream(rc.content).read_all()
+    assert table.num_rows == 289
+    assert table.column_names == result['columns']
+    assert rapidjson.loads(table.schema.metadata[b'freqtrade'])['data_stop_ts'] == 1515715200000
+    assert table.column('rsi')[0].as_py() == data[0][rsi_col_idx]
+
 
 def test_api_plot_config(botclient, mocker):
     ftbot, client = botclient
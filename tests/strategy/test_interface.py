@@ -6,12 +6,13 @@ from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import load_data
-from freqtrade.enums import ExitCheckTuple, ExitType, HyperoptState, SignalDirection
+from freqtrade.enums import ExitCheckTuple, ExitType, HyperoptState, RunMode, SignalDirection
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer
 from freqtrade.optimize.space import SKDecimal
@@ -22,8 +23,8 @@ from freqtrade.strategy.parameters import (BaseParameter, BooleanParameter, Cate
                                            DecimalParameter, IntParameter, RealParameter)
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now
-from tests.conftest import (CURRENT_TEST_STRATEGY, TRADE_SIDES, create_mock_trades, log_has,
-                            log_has_re)
+from tests.conftest import (CURRENT_TEST_STRATEGY, TRADE_SIDES, create_mock_trades,
+                            generate_test_data, log_has, log_has_re)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -720,6 +721,142 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has('Skipping TA Analysis for already analyzed candle', caplog)
 
 
+def test__analyze_ticker_internal_incremental(default_conf, mocker, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    ind_mock = MagicMock(side_effect=lambda df, meta: df.assign(sma=df['close'].rolling(3).mean()))
+    mocker.patch.multiple(
+        'freqtrade.strategy.interface.IStrategy',
+        advise_indicators=ind_mock,
+        advise_entry=lambda self, df, meta: df.assign(enter_long=(df['close'] > df['sma']) * 1),
+        advise_exit=lambda self, df, meta: df.assign(exit_long=0),
+    )
+    default_conf['runmode'] = RunMode.DRY_RUN
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    strategy.incremental_analysis = True
+    strategy.incremental_overlap = 2
+    data = generate_test_data('5m', 60)
+
+    def full_analysis(df):
+        # Skip the startup period (which lacks indicators in a full analysis)
+        return StrategyResolver.load_strategy(default_conf).analyze_ticker(df.copy(), {})[2:]
+
+    strategy._analyze_ticker_internal(data.iloc[:48].reset_index(drop=True), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 48
+
+    # 2 new candles (the oldest candles age out)
+    window = data.iloc[2:50].reset_index(drop=True)
+    res = strategy._analyze_ticker_internal(window.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 4
+    assert_frame_equal(res[2:], full_analysis(window))
+    assert_frame_equal(strategy.dp.get_analyzed_dataframe('ETH/BTC', '5m')[0], res)
+
+    # Candles changed since the previous analysis - full analysis
+    window = data.iloc[3:51].reset_index(drop=True)
+    window.loc[46, 'close'] += 1
+    res = strategy._analyze_ticker_internal(window.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 48
+    assert_frame_equal(res[2:], full_analysis(window))
+
+    # Insufficient overlap - detected by the consistency check
+    strategy.incremental_overlap = 0
+    strategy.incremental_check_interval = 2
+    window = data.iloc[5:53].reset_index(drop=True)
+    res = strategy._analyze_ticker_internal(window.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 2
+    assert not log_has_re(r'Incremental analysis of ETH/BTC differs.*', caplog)
+    assert res['sma'].iloc[-2:].isna().all()
+
+    window = data.iloc[6:54].reset_index(drop=True)
+    res = strategy._analyze_ticker_internal(window.copy(), {'pair': 'ETH/BTC'})
+    assert log_has_re(r"Incremental analysis of ETH/BTC differs from the full analysis in columns "
+                      r"sma.* - using the full analysis\. Consider increasing .*", caplog)
+    assert_frame_equal(res[2:], full_analysis(window))
+
+    # Disabled without process_only_new_candles
+    strategy.process_only_new_candles = False
+    window = data.iloc[7:55].reset_index(drop=True)
+    strategy._analyze_ticker_internal(window.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 48
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_analyze_parallel(default_conf, mocker, caplog, executor) -> None:
+    caplog.set_level(logging.DEBUG)
+    pairs = ['ETH/BTC', 'LTC/BTC', 'XRP/BTC', 'NEO/BTC', 'EMPTY/BTC']
+    data = {pair: generate_test_data('5m', 100) for pair in pairs[:-1]}
+    data['EMPTY/BTC'] = DataFrame()
+    default_conf.update({'runmode': RunMode.DRY_RUN, 'analysis_workers': 3,
+                         'analysis_executor': executor})
+
+    def get_strategy(conf):
+        strategy = StrategyResolver.load_strategy(conf)
+        strategy.dp = DataProvider(conf, None, None)
+        mocker.patch.object(strategy.dp, 'ohlcv', side_effect=lambda pair, *args, **kwargs:
+                            data[pair].copy())
+        strategy.ft_bot_start()
+        return strategy
+
+    sequential = get_strategy({**default_conf, 'analysis_workers': 0})
+    assert sequential._parallel_analysis is None
+    sequential.analyze(pairs)
+
+    strategy = get_strategy(default_conf)
+    assert strategy._parallel_analysis is not None
+    assert log_has(f"Analyzing pairs in 3 {executor} workers.", caplog)
+    caplog.clear()
+    cached_mock = mocker.spy(strategy.dp, '_set_cached_df')
+    emit_mock = mocker.spy(strategy.dp, '_emit_df')
+    strategy.analyze(pairs)
+
+    # Results are stored in the order of pairs
+    assert [c[0][0] for c in cached_mock.call_args_list] == pairs[:-1]
+    assert [c[0][0][0] for c in emit_mock.call_args_list] == pairs[:-1]
+    assert all(c[0][2] for c in emit_mock.call_args_list)
+    for pair in pairs[:-1]:
+        df, _ = strategy.dp.get_analyzed_dataframe(pair, '5m')
+        expected, _ = sequential.dp.get_analyzed_dataframe(pair, '5m')
+        assert_frame_equal(df, expected)
+    assert list(strategy._analysis_latency) == pairs[:-1]
+    assert log_has('Empty candle (OHLCV) data for pair EMPTY/BTC', caplog)
+    assert log_has_re(rf'Analyzed 4 pairs in [\d.]+s using 3 {executor} workers, '
+                      r'slowest: \S+ \([\d.]+s\)', caplog)
+    assert [r.levelno for r in caplog.records if r.message.startswith('Analyzed 4 pairs')] == [
+        logging.INFO]
+
+    # No new candles - nothing is analyzed
+    cached_mock.reset_mock()
+    strategy.analyze(pairs)
+    assert cached_mock.call_count == 0
+    assert strategy._analysis_latency == {}
+
+    # Errors in one pair don't stop the analysis of other pairs
+    data['LTC/BTC'] = generate_test_data('5m', 101)
+    data['XRP/BTC'] = generate_test_data('5m', 101)
+    data['XRP/BTC']['close'] = 'invalid'
+    strategy.analyze(pairs)
+    assert log_has_re(r'Unable to analyze candle \(OHLCV\) data for pair XRP/BTC: .*', caplog)
+    assert [c[0][0] for c in cached_mock.call_args_list] == ['LTC/BTC']
+
+    strategy.ft_bot_cleanup()
+    assert strategy._parallel_analysis is None
+
+
+def test_analyze_parallel_unsupported(default_conf, mocker) -> None:
+    default_conf.update({'runmode': RunMode.DRY_RUN, 'analysis_workers': 2,
+                         'analysis_executor': 'process'})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    mocker.patch.object(strategy, 'informative_pairs', return_value=[('BTC/USDT', '1h')])
+    with pytest.raises(OperationalException, match=r'.*does not support informative pairs.*'):
+        strategy.ft_bot_start()
+
+    default_conf['freqai'] = {'enabled': True}
+    mocker.patch.object(strategy, 'load_freqAI_model')
+    with pytest.raises(OperationalException, match=r'.*does not support FreqAI.*'):
+        strategy.ft_bot_start()
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf['timeframe']
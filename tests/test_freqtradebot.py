@@ -15,9 +15,11 @@ from sqlalchemy import select
 from freqtrade.constants import CANCEL_REASON, UNLIMITED_STAKE_AMOUNT
 from freqtrade.enums import (CandleType, ExitCheckTuple, ExitType, RPCMessageType, RunMode,
                              SignalDirection, State)
-from freqtrade.exceptions import (DependencyException, ExchangeError, InsufficientFundsError,
-                                  InvalidOrderException, OperationalException, PricingError,
+from freqtrade.exceptions import (DeferredRetryError, DependencyException, ExchangeError,
+                                  InsufficientFundsError, InvalidOrderException,
+                                  OperationalException, PricingError, RetryableOrderError,
                                   TemporaryError)
+from freqtrade.exchange.common import API_FETCH_ORDER_RETRY_COUNT, calculate_backoff
 from freqtrade.freqtradebot import FreqtradeBot
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.persistence.models import PairLock
@@ -2221,6 +2223,49 @@ def test_exit_positions_exception(mocker, default_conf_usdt, limit_order, caplog
     assert log_has('Unable to exit trade ETH/USDT: ', caplog)
 
 
+def test_exit_positions_deferred(mocker, default_conf_usdt, fee, caplog) -> None:
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    freqtrade.strategy.order_types['stoploss_on_exchange'] = True
+    stoploss_order = {'id': 'sl_123', 'status': 'open', 'symbol': 'ETH/USDT'}
+    fetch_dry_run_order = mocker.patch(f'{EXMS}.fetch_dry_run_order', side_effect=[
+        RetryableOrderError('not found'), RetryableOrderError('not found'), stoploss_order])
+    sleep_mock = mocker.patch('freqtrade.exchange.common.time.sleep')
+    update_trade_state = mocker.patch('freqtrade.freqtradebot.FreqtradeBot.update_trade_state')
+    handle_trade = mocker.patch('freqtrade.freqtradebot.FreqtradeBot.handle_trade',
+                                return_value=False)
+    trade = Trade(
+        pair='ETH/USDT',
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        open_rate=2.0,
+        open_date=dt_now(),
+        stake_amount=20,
+        amount=10,
+        exchange="binance",
+        is_open=True,
+        stoploss_order_id='sl_123',
+    )
+    Trade.session.add(trade)
+    Trade.commit()
+
+    # Throttled stoploss order fetch - the trade is handled after all others
+    assert freqtrade.exit_positions([trade]) == 0
+    assert fetch_dry_run_order.call_count == 1
+    assert sleep_mock.call_count == 0
+    assert handle_trade.call_count == 0
+    assert len(freqtrade._deferred_calls) == 1
+    assert log_has_re(r'Retrying in 1s, after handling all other trades: .*', caplog)
+
+    # Retried blocking, continuing with the remaining retries
+    freqtrade.process_deferred_calls()
+    assert fetch_dry_run_order.call_count == 3
+    assert sleep_mock.call_args_list[-1][0][0] == calculate_backoff(
+        API_FETCH_ORDER_RETRY_COUNT - 1, API_FETCH_ORDER_RETRY_COUNT)
+    assert update_trade_state.call_args[0][2] == stoploss_order
+    assert handle_trade.call_count == 1
+    assert freqtrade._deferred_calls == []
+
+
 @pytest.mark.parametrize("is_short", [False, True])
 def test_update_trade_state(mocker, default_conf_usdt, limit_order, is_short, caplog) -> None:
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
@@ -3387,6 +3432,88 @@ def test_manage_open_orders_partial_except(
     assert trades[0].fee_open == fee()
 
 
+def test_manage_open_orders_unchanged(default_conf_usdt, ticker_usdt, open_trade, mocker) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    default_conf_usdt['unfilledtimeout'] = {'entry': 1440, 'exit': 1440, 'unit': 'minutes'}
+    open_order = open_trade.orders[0]
+    open_order.status = 'open'
+    open_order.filled = 0.0
+    open_order.remaining = open_trade.amount
+    open_order.average = None
+    order = open_order.to_ccxt_object()
+    fetch_orders_mock = mocker.patch(f'{EXMS}.fetch_orders_by_id',
+                                     return_value={open_order.order_id: order})
+    replace_order_mock = mocker.patch('freqtrade.freqtradebot.FreqtradeBot.replace_order')
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    update_trade_state_mock = mocker.patch(
+        'freqtrade.freqtradebot.FreqtradeBot.update_trade_state', return_value=False)
+
+    Trade.session.add(open_trade)
+    Trade.commit()
+
+    freqtrade.manage_open_orders()
+    assert fetch_orders_mock.call_count == 1
+    assert fetch_orders_mock.call_args[0][0] == [(open_order.order_id, open_trade.pair)]
+    # Order didn't change
+    assert update_trade_state_mock.call_count == 0
+    assert replace_order_mock.call_count == 1
+
+    order['filled'] = 10.0
+    order['remaining'] = open_trade.amount - 10.0
+    freqtrade.manage_open_orders()
+    assert update_trade_state_mock.call_count == 1
+    assert replace_order_mock.call_count == 2
+
+    # No open orders - nothing to fetch
+    fetch_orders_mock.reset_mock()
+    open_order.ft_is_open = False
+    freqtrade.manage_open_orders()
+    assert fetch_orders_mock.call_count == 0
+
+
+def test_manage_open_orders_deferred(default_conf_usdt, open_trade, mocker, caplog) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    default_conf_usdt['unfilledtimeout'] = {'entry': 1440, 'exit': 1440, 'unit': 'minutes'}
+    open_order = open_trade.orders[0]
+    open_order.status = 'open'
+    open_order.filled = 0.0
+    open_order.remaining = open_trade.amount
+    open_order.average = None
+    order = open_order.to_ccxt_object()
+    mocker.patch(f'{EXMS}.fetch_orders_by_id', return_value={
+        open_order.order_id: DeferredRetryError('rate limited', 2)})
+    fetch_order_mock = mocker.patch(f'{EXMS}.fetch_order', return_value=order)
+    replace_order_mock = mocker.patch('freqtrade.freqtradebot.FreqtradeBot.replace_order')
+    sleep_mock = mocker.patch('freqtrade.exchange.common.time.sleep')
+    freqtrade = FreqtradeBot(default_conf_usdt)
+
+    Trade.session.add(open_trade)
+    Trade.commit()
+
+    freqtrade.manage_open_orders()
+    assert replace_order_mock.call_count == 0
+    assert len(freqtrade._deferred_calls) == 1
+    assert log_has_re(r'Retrying in 2s, after handling all other trades: rate limited', caplog)
+
+    freqtrade.process_deferred_calls()
+    assert sleep_mock.call_count == 1
+    assert 0 < sleep_mock.call_args[0][0] <= 2
+    assert fetch_order_mock.call_count == 1
+    assert replace_order_mock.call_count == 1
+    assert freqtrade._deferred_calls == []
+    assert log_has_re(r'Retried 1 deferred exchange calls\. Total retries: .*', caplog)
+
+    freqtrade.manage_open_orders()
+    assert len(freqtrade._deferred_calls) == 1
+    # Order was closed in the meantime
+    open_order.ft_is_open = False
+    freqtrade.process_deferred_calls()
+    assert fetch_order_mock.call_count == 1
+    assert replace_order_mock.call_count == 1
+
+
 def test_manage_open_orders_exception(default_conf_usdt, ticker_usdt, open_trade_usdt, mocker,
                                       caplog) -> None:
     patch_RPCManager(mocker)